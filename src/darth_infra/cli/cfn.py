@@ -12,7 +12,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import boto3
 from botocore.exceptions import ClientError
 from rich.console import Group
 from rich.live import Live
@@ -20,7 +19,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ..config.models import ProjectConfig
-from .helpers import console, get_cluster_name, get_service_name
+from .helpers import aws_client, console, get_cluster_name, get_service_name
 
 
 @dataclass
@@ -50,10 +49,10 @@ class DeployMonitorState:
 
 
 def resolve_lookup_data(config: ProjectConfig, env_name: str) -> ResolvedLookupData:
-    ec2 = boto3.client("ec2", region_name=config.aws_region)
-    elbv2 = boto3.client("elbv2", region_name=config.aws_region)
-    sd = boto3.client("servicediscovery", region_name=config.aws_region)
-    route53 = boto3.client("route53")
+    ec2 = aws_client("ec2", config.aws_region)
+    elbv2 = aws_client("elbv2", config.aws_region)
+    sd = aws_client("servicediscovery", config.aws_region)
+    route53 = aws_client("route53", config.aws_region)
 
     vpc_id, vpc_cidr, private_subnets, public_subnets = _resolve_network(config, ec2)
     listener_arn, alb_sg, alb_dns_name = _resolve_shared_alb(config, elbv2)
@@ -371,10 +370,10 @@ def _validate_subnet_ids(
 
 
 def ensure_artifact_bucket(config: ProjectConfig) -> str:
-    sts = boto3.client("sts")
+    sts = aws_client("sts", config.aws_region)
     account = sts.get_caller_identity()["Account"]
     bucket_name = f"darth-infra-artifacts-{account}-{config.aws_region}".lower()
-    s3 = boto3.client("s3", region_name=config.aws_region)
+    s3 = aws_client("s3", config.aws_region)
 
     try:
         s3.head_bucket(Bucket=bucket_name)
@@ -435,7 +434,7 @@ def deploy_changeset(
     no_execute: bool,
     changeset_name: str | None,
 ) -> int:
-    cf = boto3.client("cloudformation", region_name=config.aws_region)
+    cf = aws_client("cloudformation", config.aws_region)
     stack_name = f"{config.project_name}-ecs-{env_name}"
 
     template_body = template_path.read_text()
@@ -559,11 +558,11 @@ def _validate_create_stack_named_resource_collisions(
 ) -> None:
     collisions: list[str] = []
 
-    ecr = boto3.client("ecr", region_name=config.aws_region)
-    ecs = boto3.client("ecs", region_name=config.aws_region)
-    sm = boto3.client("secretsmanager", region_name=config.aws_region)
-    s3 = boto3.client("s3", region_name=config.aws_region)
-    rds = boto3.client("rds", region_name=config.aws_region)
+    ecr = aws_client("ecr", config.aws_region)
+    ecs = aws_client("ecs", config.aws_region)
+    sm = aws_client("secretsmanager", config.aws_region)
+    s3 = aws_client("s3", config.aws_region)
+    rds = aws_client("rds", config.aws_region)
 
     cluster_name = get_cluster_name(config.project_name, env_name)
     try:
@@ -651,11 +650,11 @@ def _validate_update_stack_named_resource_collisions(
     managed_logical_ids = _stack_logical_resource_ids(cf, stack_name)
     collisions: list[str] = []
 
-    ecr = boto3.client("ecr", region_name=config.aws_region)
-    ecs = boto3.client("ecs", region_name=config.aws_region)
-    sm = boto3.client("secretsmanager", region_name=config.aws_region)
-    s3 = boto3.client("s3", region_name=config.aws_region)
-    rds = boto3.client("rds", region_name=config.aws_region)
+    ecr = aws_client("ecr", config.aws_region)
+    ecs = aws_client("ecs", config.aws_region)
+    sm = aws_client("secretsmanager", config.aws_region)
+    s3 = aws_client("s3", config.aws_region)
+    rds = aws_client("rds", config.aws_region)
 
     if "EcsCluster" not in managed_logical_ids:
         cluster_name = get_cluster_name(config.project_name, env_name)
@@ -793,7 +792,7 @@ def _secret_logical_suffix(secret_name: str) -> str:
 
 
 def delete_stack(config: ProjectConfig, env_name: str) -> int:
-    cf = boto3.client("cloudformation", region_name=config.aws_region)
+    cf = aws_client("cloudformation", config.aws_region)
     stack_name = f"{config.project_name}-ecs-{env_name}"
     try:
         cf.delete_stack(StackName=stack_name)
@@ -806,7 +805,7 @@ def delete_stack(config: ProjectConfig, env_name: str) -> int:
 
 
 def cancel_stack_update(config: ProjectConfig, env_name: str) -> int:
-    cf = boto3.client("cloudformation", region_name=config.aws_region)
+    cf = aws_client("cloudformation", config.aws_region)
     stack_name = f"{config.project_name}-ecs-{env_name}"
 
     try:
@@ -1010,8 +1009,8 @@ def _monitor_stack_deploy(
     stack_name: str,
     poll_interval_seconds: int,
 ) -> bool:
-    ecs = boto3.client("ecs", region_name=config.aws_region)
-    logs = boto3.client("logs", region_name=config.aws_region)
+    ecs = aws_client("ecs", config.aws_region)
+    logs = aws_client("logs", config.aws_region)
     state = DeployMonitorState(
         seen_stack_event_ids=set(),
         seen_service_event_keys=set(),
@@ -2044,7 +2043,7 @@ def _resolve_stack_owned_listener_rule_priorities(
     elbv2,
 ) -> set[int]:
     stack_name = f"{config.project_name}-ecs-{env_name}"
-    cf = boto3.client("cloudformation", region_name=config.aws_region)
+    cf = aws_client("cloudformation", config.aws_region)
 
     rule_arns = _list_listener_rule_arns_for_stack(cf, stack_name)
 
@@ -2123,7 +2122,7 @@ def _list_stack_resource_summaries(cf, stack_name: str) -> list[dict[str, Any]]:
 
 def _stack_exists_for_env(config: ProjectConfig, env_name: str) -> bool:
     stack_name = f"{config.project_name}-ecs-{env_name}"
-    cf = boto3.client("cloudformation", region_name=config.aws_region)
+    cf = aws_client("cloudformation", config.aws_region)
     try:
         cf.describe_stacks(StackName=stack_name)
         return True
@@ -2139,7 +2138,7 @@ def _resolve_rds_snapshot(config: ProjectConfig, env_name: str) -> str:
     if not config.rds or env_name == "prod":
         return ""
 
-    rds = boto3.client("rds", region_name=config.aws_region)
+    rds = aws_client("rds", config.aws_region)
     db_id = f"{config.project_name}-prod-db"
     try:
         snapshots = rds.describe_db_snapshots(
@@ -2157,7 +2156,7 @@ def _resolve_rds_snapshot(config: ProjectConfig, env_name: str) -> str:
 
 def _resolve_external_secrets(config: ProjectConfig) -> dict[str, str]:
     out: dict[str, str] = {}
-    sm = boto3.client("secretsmanager", region_name=config.aws_region)
+    sm = aws_client("secretsmanager", config.aws_region)
     for sec in config.secrets:
         if sec.source.value in {"generate", "rds"}:
             continue
@@ -2337,7 +2336,7 @@ def run_seed_copy_tasks(config: ProjectConfig, env_name: str) -> int:
     if not seed_buckets:
         return 0
 
-    s3 = boto3.client("s3", region_name=config.aws_region)
+    s3 = aws_client("s3", config.aws_region)
     failures: list[str] = []
 
     for bucket in seed_buckets:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import copy
 
-import boto3
 import click
 from botocore.exceptions import ClientError
 
@@ -18,6 +17,7 @@ from .cfn import (
     validate_rendered_deploy_templates,
 )
 from .helpers import (
+    aws_client,
     console,
     get_cluster_name,
     get_service_name,
@@ -192,7 +192,7 @@ def _prepare_images_for_deploy(config, project_dir, env_name: str) -> None:
 
 def _stack_exists(project_name: str, region: str, env_name: str) -> bool:
     stack_name = f"{project_name}-ecs-{env_name}"
-    cf = boto3.client("cloudformation", region_name=region)
+    cf = aws_client("cloudformation", region)
     try:
         cf.describe_stacks(StackName=stack_name)
         return True
@@ -209,7 +209,7 @@ def _force_new_deployments_for_internal_services(config, env_name: str) -> None:
     if not services:
         return
 
-    ecs = boto3.client("ecs", region_name=config.aws_region)
+    ecs = aws_client("ecs", config.aws_region)
     cluster_name = get_cluster_name(config.project_name, env_name)
     restarted: list[str] = []
 
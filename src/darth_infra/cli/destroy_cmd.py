@@ -2,11 +2,37 @@
 
 from __future__ import annotations
 
-import boto3
 import click
 
 from .cfn import delete_stack
-from .helpers import console, require_config
+from .helpers import aws_client, console, require_config
+
+# Every CloudFormation stack status except DELETE_COMPLETE, so list_stacks
+# skips the account's deleted-stack history server-side.
+_LIVE_STACK_STATUSES = [
+    "CREATE_IN_PROGRESS",
+    "CREATE_FAILED",
+    "CREATE_COMPLETE",
+    "ROLLBACK_IN_PROGRESS",
+    "ROLLBACK_FAILED",
+    "ROLLBACK_COMPLETE",
+    "DELETE_IN_PROGRESS",
+    "DELETE_FAILED",
+    "UPDATE_IN_PROGRESS",
+    "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_COMPLETE",
+    "UPDATE_FAILED",
+    "UPDATE_ROLLBACK_IN_PROGRESS",
+    "UPDATE_ROLLBACK_FAILED",
+    "UPDATE_ROLLBACK_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_ROLLBACK_COMPLETE",
+    "REVIEW_IN_PROGRESS",
+    "IMPORT_IN_PROGRESS",
+    "IMPORT_COMPLETE",
+    "IMPORT_ROLLBACK_IN_PROGRESS",
+    "IMPORT_ROLLBACK_FAILED",
+    "IMPORT_ROLLBACK_COMPLETE",
+]
 
 
 @click.command()
@@ -17,20 +43,28 @@ def destroy(env_name: str, force: bool) -> None:
     config, _ = require_config()
 
     if env_name == "prod":
-        # Verify no non-prod envs still exist
-        cf = boto3.client("cloudformation", region_name=config.aws_region)
-        for other_env in config.environments:
-            if other_env == "prod":
-                continue
-            try:
-                cf.describe_stacks(StackName=f"{config.project_name}-ecs-{other_env}")
-                console.print(
-                    f"[red]Cannot destroy prod while '{other_env}' "
-                    f"environment still exists. Destroy it first.[/red]"
-                )
-                raise SystemExit(1)
-            except cf.exceptions.ClientError:
-                pass  # Stack doesn't exist, fine
+        # Verify no non-prod envs still exist, with one paginated listing
+        # of live stacks instead of a describe_stacks round-trip per
+        # environment.
+        cf = aws_client("cloudformation", config.aws_region)
+        other_stacks = {
+            f"{config.project_name}-ecs-{other_env}": other_env
+            for other_env in config.environments
+            if other_env != "prod"
+        }
+        if other_stacks:
+            pages = cf.get_paginator("list_stacks").paginate(
+                StackStatusFilter=_LIVE_STACK_STATUSES
+            )
+            for page in pages:
+                for summary in page["StackSummaries"]:
+                    other_env = other_stacks.get(summary["StackName"])
+                    if other_env is not None:
+                        console.print(
+                            f"[red]Cannot destroy prod while '{other_env}' "
+                            f"environment still exists. Destroy it first.[/red]"
+                        )
+                        raise SystemExit(1)
 
     if not force:
         click.confirm(
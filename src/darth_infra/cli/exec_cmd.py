@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import subprocess
 
-import boto3
 import click
 
-from .helpers import console, get_cluster_name, get_service_name, require_config
+from .helpers import (
+    aws_client,
+    console,
+    get_cluster_name,
+    get_service_name,
+    require_config,
+)
 
 
 @click.command("exec")
@@ -38,7 +43,7 @@ def exec_cmd(service: str, env_name: str, shell_cmd: str) -> None:
         f"[bold]Finding running task for [cyan]{service_name}[/cyan]...[/bold]"
     )
 
-    ecs = boto3.client("ecs", region_name=config.aws_region)
+    ecs = aws_client("ecs", config.aws_region)
 
     # Find a running task
     tasks = ecs.list_tasks(
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
-import boto3
 from rich.console import Console
 
 from ..config.loader import find_config, load_config
@@ -14,6 +14,21 @@ from ..config.models import ProjectConfig
 console = Console()
 
 
+@functools.lru_cache(maxsize=None)
+def _session():
+    # boto3 is imported here rather than at module level so that commands
+    # which never talk to AWS (``build``, ``--help``) skip its import cost.
+    import boto3
+
+    return boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def aws_client(service: str, region: str):
+    """Return a boto3 client, reused for the rest of the process."""
+    return _session().client(service, region_name=region)
+
+
 def require_config() -> tuple[ProjectConfig, Path]:
     """Load config or exit with an error."""
     try:
@@ -32,7 +47,7 @@ def require_prod_deployed(config: ProjectConfig, env: str) -> None:
 
     stack_name = f"{config.project_name}-ecs-prod"
     try:
-        cf = boto3.client("cloudformation", region_name=config.aws_region)
+        cf = aws_client("cloudformation", config.aws_region)
         cf.describe_stacks(StackName=stack_name)
     except Exception:
         console.print(
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+import base64
+import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
 
-import boto3
+from botocore.exceptions import BotoCoreError, ClientError
 from rich.console import Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
 from ..config.models import ProjectConfig, ServiceConfig
-from .helpers import console
+from .helpers import aws_client, console
+
+# Upper bounds on concurrent docker invocations. Builds are CPU-bound in the
+# Docker daemon; pushes are network-bound, so a few run at once regardless
+# of core count.
+_MAX_PARALLEL_BUILDS = os.cpu_count() or 1
+_MAX_PARALLEL_PUSHES = 4
+
+# Registries docker has already been logged in to by this process.
+_ECR_LOGGED_IN: set[str] = set()
 
 
 def select_services(
@@ -47,33 +60,28 @@ def build_images(
     project_dir: Path,
     service_name: str | None,
 ) -> None:
-    """Build local Docker images for internal services."""
+    """Build local Docker images for internal services.
+
+    Services build concurrently; after the first failure, builds that have
+    not started yet are cancelled.
+    """
     ensure_docker_buildx()
     services = select_services(config, service_name)
 
     status_by_service: dict[str, str] = {service.name: "queued" for service in services}
-    last_update = "Starting build flow"
     failed_code: int | None = None
     failed_message = ""
 
     with Live(console=console, refresh_per_second=8, transient=False) as live:
-        for service in services:
-            if service.image:
-                status_by_service[service.name] = "skipped (external image)"
-                last_update = f"Skipped {service.name}: uses external image"
-                live.update(
-                    _render_docker_live_view(
-                        title="Docker Build",
-                        summary_rows=[
-                            ("Phase", "Building internal service images", "cyan"),
-                            ("Current service", service.name, "cyan"),
-                            ("Last update", last_update, "dim"),
-                        ],
-                        service_status=status_by_service,
-                    )
-                )
-                continue
 
+        report = _LiveStatusBoard(
+            live,
+            title="Docker Build",
+            leading_rows=[("Phase", "Building internal service images", "cyan")],
+            service_status=status_by_service,
+        ).report
+
+        def build_one(service: ServiceConfig) -> subprocess.CompletedProcess[str]:
             tag = local_image_tag(config.project_name, service.name)
             cmd = [
                 "docker",
@@ -89,59 +97,50 @@ def build_images(
                 cmd.extend(["--target", service.docker_build_target])
             cmd.append(service.build_context)
 
-            status_by_service[service.name] = "building"
-            last_update = f"Building {service.name}"
-            live.update(
-                _render_docker_live_view(
-                    title="Docker Build",
-                    summary_rows=[
-                        ("Phase", "Building internal service images", "cyan"),
-                        ("Current service", service.name, "cyan"),
-                        ("Last update", last_update, "white"),
-                    ],
-                    service_status=status_by_service,
-                )
-            )
-
+            report(service.name, "building", f"Building {service.name}", "white")
             result = _run_quiet(cmd, cwd=project_dir)
-            if result.returncode != 0:
-                status_by_service[service.name] = f"failed (exit {result.returncode})"
-                failed_code = result.returncode
-                failed_message = _tail_stderr(result.stderr)
-                last_update = f"Build failed for {service.name}"
-                live.update(
-                    _render_docker_live_view(
-                        title="Docker Build",
-                        summary_rows=[
-                            ("Phase", "Building internal service images", "cyan"),
-                            ("Current service", service.name, "cyan"),
-                            ("Last update", last_update, "red"),
-                            (
-                                "Error",
-                                failed_message
-                                if failed_message
-                                else "No error details captured",
-                                "red",
-                            ),
-                        ],
-                        service_status=status_by_service,
-                    )
-                )
-                break
+            if result.returncode == 0:
+                report(service.name, f"built ({tag})", f"Built {service.name}", "green")
+            return result
 
-            status_by_service[service.name] = f"built ({tag})"
-            last_update = f"Built {service.name}"
-            live.update(
-                _render_docker_live_view(
-                    title="Docker Build",
-                    summary_rows=[
-                        ("Phase", "Building internal service images", "cyan"),
-                        ("Current service", service.name, "cyan"),
-                        ("Last update", last_update, "green"),
-                    ],
-                    service_status=status_by_service,
+        internal: list[ServiceConfig] = []
+        for service in services:
+            if service.image:
+                report(
+                    service.name,
+                    "skipped (external image)",
+                    f"Skipped {service.name}: uses external image",
+                    "dim",
                 )
-            )
+            else:
+                internal.append(service)
+
+        if internal:
+            workers = min(len(internal), _MAX_PARALLEL_BUILDS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(build_one, service): service for service in internal
+                }
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    result = future.result()
+                    if result.returncode == 0:
+                        continue
+                    service = futures[future]
+                    message = _tail_stderr(result.stderr)
+                    report(
+                        service.name,
+                        f"failed (exit {result.returncode})",
+                        f"Build failed for {service.name}",
+                        "red",
+                        message,
+                    )
+                    if failed_code is None:
+                        failed_code = result.returncode
+                        failed_message = message
+                        for pending in futures:
+                            pending.cancel()
 
     if failed_code is not None:
         console.print(f"[red]Build failed with exit code {failed_code}[/red]")
@@ -157,15 +156,15 @@ def push_images(
     env_name: str,
     service_name: str | None,
 ) -> None:
-    """Tag and push local Docker images to ECR with latest + immutable tags."""
+    """Tag and push local Docker images to ECR with latest + immutable tags.
+
+    After a shared ECR login, services are pushed concurrently; after the
+    first failure, pushes that have not started yet are cancelled.
+    """
     services = select_services(config, service_name)
-    account = boto3.client("sts").get_caller_identity()["Account"]
+    account = aws_client("sts", config.aws_region).get_caller_identity()["Account"]
     registry = ecr_registry_uri(account, config.aws_region)
 
-    login_cmd = (
-        f"aws ecr get-login-password --region {config.aws_region} "
-        f"| docker login --username AWS --password-stdin {registry}"
-    )
     status_by_service: dict[str, str] = {service.name: "queued" for service in services}
     last_update = "Logging in to ECR"
     failed_code: int | None = None
@@ -185,10 +184,10 @@ def push_images(
             )
         )
 
-        login_result = _run_quiet(login_cmd, shell=True)
-        if login_result.returncode != 0:
-            failed_code = login_result.returncode
-            failed_message = _tail_stderr(login_result.stderr)
+        login_code, login_message = _ecr_login(config.aws_region, registry)
+        if login_code != 0:
+            failed_code = login_code
+            failed_message = login_message
             live.update(
                 _render_docker_live_view(
                     title="Docker Push",
@@ -198,9 +197,11 @@ def push_images(
                         ("Last update", "ECR login failed", "red"),
                         (
                             "Error",
-                            failed_message
-                            if failed_message
-                            else "No error details captured",
+                            (
+                                failed_message
+                                if failed_message
+                                else "No error details captured"
+                            ),
                             "red",
                         ),
                     ],
@@ -222,232 +223,108 @@ def push_images(
                 )
             )
 
+        report = _LiveStatusBoard(
+            live,
+            title="Docker Push",
+            leading_rows=[
+                ("Phase", "Pushing service images", "cyan"),
+                ("Registry", registry, "white"),
+                ("Immutable tag", immutable_tag, "white"),
+            ],
+            service_status=status_by_service,
+        ).report
+
+        def push_one(
+            service: ServiceConfig,
+        ) -> tuple[str, str, subprocess.CompletedProcess[str]] | None:
+            """Run the tag/push steps for one service; return the failed step."""
+            local_tag = local_image_tag(config.project_name, service.name)
+            repo = ecr_repo_name(config.project_name, env_name, service.name)
+            latest_remote_tag = f"{registry}/{repo}:latest"
+            immutable_remote_tag = f"{registry}/{repo}:{immutable_tag}"
+            steps = [
+                (
+                    "tagging immutable",
+                    f"Tagging {service.name} for immutable push",
+                    ["docker", "tag", local_tag, immutable_remote_tag],
+                    "failed tagging immutable",
+                    "Failed while tagging immutable image",
+                ),
+                (
+                    "pushing immutable",
+                    f"Pushing immutable image for {service.name}",
+                    ["docker", "push", immutable_remote_tag],
+                    "failed pushing immutable",
+                    "Immutable push failed",
+                ),
+                (
+                    "tagging latest",
+                    f"Tagging latest image for {service.name}",
+                    ["docker", "tag", immutable_remote_tag, latest_remote_tag],
+                    "failed tagging latest",
+                    "Failed while tagging latest image",
+                ),
+                (
+                    "pushing latest",
+                    f"Pushing latest image for {service.name}",
+                    ["docker", "push", latest_remote_tag],
+                    "failed pushing latest",
+                    "Latest push failed",
+                ),
+            ]
+            for status, update, cmd, failed_status, failed_update in steps:
+                report(service.name, status, update, "white")
+                result = _run_quiet(cmd)
+                if result.returncode != 0:
+                    return failed_status, failed_update, result
+
+            report(
+                service.name,
+                "pushed latest + immutable",
+                f"Pushed {service.name}",
+                "green",
+            )
+            return None
+
         if failed_code is None:
+            internal: list[ServiceConfig] = []
             for service in services:
                 if service.image:
-                    status_by_service[service.name] = "skipped (external image)"
-                    last_update = f"Skipped {service.name}: uses external image"
-                    live.update(
-                        _render_docker_live_view(
-                            title="Docker Push",
-                            summary_rows=[
-                                ("Phase", "Pushing service images", "cyan"),
-                                ("Registry", registry, "white"),
-                                ("Immutable tag", immutable_tag, "white"),
-                                ("Last update", last_update, "dim"),
-                            ],
-                            service_status=status_by_service,
-                        )
-                    )
-                    continue
-
-                local_tag = local_image_tag(config.project_name, service.name)
-                repo = ecr_repo_name(config.project_name, env_name, service.name)
-                latest_remote_tag = f"{registry}/{repo}:latest"
-                immutable_remote_tag = f"{registry}/{repo}:{immutable_tag}"
-
-                status_by_service[service.name] = "tagging immutable"
-                last_update = f"Tagging {service.name} for immutable push"
-                live.update(
-                    _render_docker_live_view(
-                        title="Docker Push",
-                        summary_rows=[
-                            ("Phase", "Pushing service images", "cyan"),
-                            ("Registry", registry, "white"),
-                            ("Immutable tag", immutable_tag, "white"),
-                            ("Current service", service.name, "cyan"),
-                            ("Last update", last_update, "white"),
-                        ],
-                        service_status=status_by_service,
-                    )
-                )
-
-                tag_immutable_result = _run_quiet(
-                    ["docker", "tag", local_tag, immutable_remote_tag]
-                )
-                if tag_immutable_result.returncode != 0:
-                    status_by_service[service.name] = (
-                        f"failed tagging immutable (exit {tag_immutable_result.returncode})"
-                    )
-                    failed_code = tag_immutable_result.returncode
-                    failed_message = _tail_stderr(tag_immutable_result.stderr)
-                    live.update(
-                        _render_docker_live_view(
-                            title="Docker Push",
-                            summary_rows=[
-                                ("Phase", "Pushing service images", "cyan"),
-                                ("Registry", registry, "white"),
-                                ("Current service", service.name, "cyan"),
-                                (
-                                    "Last update",
-                                    "Failed while tagging immutable image",
-                                    "red",
-                                ),
-                                (
-                                    "Error",
-                                    failed_message
-                                    if failed_message
-                                    else "No error details captured",
-                                    "red",
-                                ),
-                            ],
-                            service_status=status_by_service,
-                        )
-                    )
-                    break
-
-                status_by_service[service.name] = "pushing immutable"
-                last_update = f"Pushing immutable image for {service.name}"
-                live.update(
-                    _render_docker_live_view(
-                        title="Docker Push",
-                        summary_rows=[
-                            ("Phase", "Pushing service images", "cyan"),
-                            ("Registry", registry, "white"),
-                            ("Current service", service.name, "cyan"),
-                            ("Last update", last_update, "white"),
-                        ],
-                        service_status=status_by_service,
-                    )
-                )
-
-                push_immutable_result = _run_quiet(
-                    ["docker", "push", immutable_remote_tag]
-                )
-                if push_immutable_result.returncode != 0:
-                    status_by_service[service.name] = (
-                        f"failed pushing immutable (exit {push_immutable_result.returncode})"
-                    )
-                    failed_code = push_immutable_result.returncode
-                    failed_message = _tail_stderr(push_immutable_result.stderr)
-                    live.update(
-                        _render_docker_live_view(
-                            title="Docker Push",
-                            summary_rows=[
-                                ("Phase", "Pushing service images", "cyan"),
-                                ("Registry", registry, "white"),
-                                ("Current service", service.name, "cyan"),
-                                ("Last update", "Immutable push failed", "red"),
-                                (
-                                    "Error",
-                                    failed_message
-                                    if failed_message
-                                    else "No error details captured",
-                                    "red",
-                                ),
-                            ],
-                            service_status=status_by_service,
-                        )
-                    )
-                    break
-
-                status_by_service[service.name] = "tagging latest"
-                last_update = f"Tagging latest image for {service.name}"
-                live.update(
-                    _render_docker_live_view(
-                        title="Docker Push",
-                        summary_rows=[
-                            ("Phase", "Pushing service images", "cyan"),
-                            ("Registry", registry, "white"),
-                            ("Current service", service.name, "cyan"),
-                            ("Last update", last_update, "white"),
-                        ],
-                        service_status=status_by_service,
-                    )
-                )
-
-                tag_latest_result = _run_quiet(
-                    ["docker", "tag", immutable_remote_tag, latest_remote_tag]
-                )
-                if tag_latest_result.returncode != 0:
-                    status_by_service[service.name] = (
-                        f"failed tagging latest (exit {tag_latest_result.returncode})"
+                    report(
+                        service.name,
+                        "skipped (external image)",
+                        f"Skipped {service.name}: uses external image",
+                        "dim",
                     )
-                    failed_code = tag_latest_result.returncode
-                    failed_message = _tail_stderr(tag_latest_result.stderr)
-                    live.update(
-                        _render_docker_live_view(
-                            title="Docker Push",
-                            summary_rows=[
-                                ("Phase", "Pushing service images", "cyan"),
-                                ("Registry", registry, "white"),
-                                ("Current service", service.name, "cyan"),
-                                (
-                                    "Last update",
-                                    "Failed while tagging latest image",
-                                    "red",
-                                ),
-                                (
-                                    "Error",
-                                    failed_message
-                                    if failed_message
-                                    else "No error details captured",
-                                    "red",
-                                ),
-                            ],
-                            service_status=status_by_service,
-                        )
-                    )
-                    break
-
-                status_by_service[service.name] = "pushing latest"
-                last_update = f"Pushing latest image for {service.name}"
-                live.update(
-                    _render_docker_live_view(
-                        title="Docker Push",
-                        summary_rows=[
-                            ("Phase", "Pushing service images", "cyan"),
-                            ("Registry", registry, "white"),
-                            ("Current service", service.name, "cyan"),
-                            ("Last update", last_update, "white"),
-                        ],
-                        service_status=status_by_service,
-                    )
-                )
-
-                push_latest_result = _run_quiet(["docker", "push", latest_remote_tag])
-                if push_latest_result.returncode != 0:
-                    status_by_service[service.name] = (
-                        f"failed pushing latest (exit {push_latest_result.returncode})"
-                    )
-                    failed_code = push_latest_result.returncode
-                    failed_message = _tail_stderr(push_latest_result.stderr)
-                    live.update(
-                        _render_docker_live_view(
-                            title="Docker Push",
-                            summary_rows=[
-                                ("Phase", "Pushing service images", "cyan"),
-                                ("Registry", registry, "white"),
-                                ("Current service", service.name, "cyan"),
-                                ("Last update", "Latest push failed", "red"),
-                                (
-                                    "Error",
-                                    failed_message
-                                    if failed_message
-                                    else "No error details captured",
-                                    "red",
-                                ),
-                            ],
-                            service_status=status_by_service,
+                else:
+                    internal.append(service)
+
+            if internal:
+                workers = min(len(internal), _MAX_PARALLEL_PUSHES)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {
+                        pool.submit(push_one, service): service for service in internal
+                    }
+                    for future in as_completed(futures):
+                        if future.cancelled():
+                            continue
+                        failure = future.result()
+                        if failure is None:
+                            continue
+                        failed_status, failed_update, result = failure
+                        message = _tail_stderr(result.stderr)
+                        report(
+                            futures[future].name,
+                            f"{failed_status} (exit {result.returncode})",
+                            failed_update,
+                            "red",
+                            message,
                         )
-                    )
-                    break
-
-                status_by_service[service.name] = "pushed latest + immutable"
-                last_update = f"Pushed {service.name}"
-                live.update(
-                    _render_docker_live_view(
-                        title="Docker Push",
-                        summary_rows=[
-                            ("Phase", "Pushing service images", "cyan"),
-                            ("Registry", registry, "white"),
-                            ("Immutable tag", immutable_tag, "white"),
-                            ("Current service", service.name, "cyan"),
-                            ("Last update", last_update, "green"),
-                        ],
-                        service_status=status_by_service,
-                    )
-                )
+                        if failed_code is None:
+                            failed_code = result.returncode
+                            failed_message = message
+                            for pending in futures:
+                                pending.cancel()
 
     if failed_code is not None:
         console.print(f"[red]Push failed with exit code {failed_code}[/red]")
@@ -492,16 +369,40 @@ def ensure_docker_buildx() -> None:
     raise SystemExit(1)
 
 
+def _ecr_login(region: str, registry: str) -> tuple[int, str]:
+    """Log docker in to *registry*, returning (exit code, error message).
+
+    The token comes straight from the ECR API and is fed to
+    ``docker login --password-stdin``; successful logins are remembered for
+    the rest of the process.
+    """
+    if registry in _ECR_LOGGED_IN:
+        return 0, ""
+    try:
+        auth = aws_client("ecr", region).get_authorization_token()
+    except (BotoCoreError, ClientError) as exc:
+        return 1, str(exc)
+    token = auth["authorizationData"][0]["authorizationToken"]
+    username, password = base64.b64decode(token).decode().split(":", 1)
+    result = _run_quiet(
+        ["docker", "login", "--username", username, "--password-stdin", registry],
+        input=password,
+    )
+    if result.returncode == 0:
+        _ECR_LOGGED_IN.add(registry)
+    return result.returncode, _tail_stderr(result.stderr)
+
+
 def _run_quiet(
-    cmd: list[str] | str,
+    cmd: list[str],
     *,
     cwd: Path | None = None,
-    shell: bool = False,
+    input: str | None = None,
 ) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         cmd,
         cwd=str(cwd) if cwd else None,
-        shell=shell,
+        input=input,
         text=True,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
@@ -530,6 +431,57 @@ def _status_style(value: str) -> str:
     return "white"
 
 
+class _LiveStatusBoard:
+    """Thread-safe per-service status updates for a docker Live view.
+
+    Every failure updates its service row, but only the first failure's
+    summary is pinned; it stays on screen while in-flight jobs finish.
+    """
+
+    def __init__(
+        self,
+        live: Live,
+        *,
+        title: str,
+        leading_rows: list[tuple[str, str, str]],
+        service_status: dict[str, str],
+    ) -> None:
+        self._live = live
+        self._title = title
+        self._leading_rows = leading_rows
+        self._service_status = service_status
+        self._failure_rows: list[tuple[str, str, str]] | None = None
+        self._lock = threading.Lock()
+
+    def report(
+        self,
+        name: str,
+        status: str,
+        last_update: str,
+        style: str,
+        error: str | None = None,
+    ) -> None:
+        summary_rows = [
+            *self._leading_rows,
+            ("Current service", name, "cyan"),
+            ("Last update", last_update, style),
+        ]
+        with self._lock:
+            if error is not None and self._failure_rows is None:
+                summary_rows.append(
+                    ("Error", error or "No error details captured", "red")
+                )
+                self._failure_rows = summary_rows
+            self._service_status[name] = status
+            self._live.update(
+                _render_docker_live_view(
+                    title=self._title,
+                    summary_rows=self._failure_rows or summary_rows,
+                    service_status=self._service_status,
+                )
+            )
+
+
 def _render_docker_live_view(
     *,
     title: str,
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import base64
 
-import boto3
 import click
 
 from ..config.models import ProjectConfig
-from .helpers import console, require_config
+from .helpers import aws_client, console, require_config
 
 
 @click.command("secret")
@@ -23,7 +22,7 @@ def secret_cmd(secret: str, env_name: str, json_key: str | None) -> None:
     """Retrieve a secret value from AWS Secrets Manager and print it."""
     config, _ = require_config()
 
-    sm = boto3.client("secretsmanager", region_name=config.aws_region)
+    sm = aws_client("secretsmanager", config.aws_region)
 
     try:
         secret_id = _resolve_secret_id(config, env_name, secret)
@@ -64,7 +63,7 @@ def _resolve_secret_id(config: ProjectConfig, env_name: str, secret: str) -> str
         stack_name = f"{config.project_name}-ecs-{env_name}"
         param_key = f"EnvSecretArn{secret.replace('_', '').replace('-', '')}"
 
-        cf = boto3.client("cloudformation", region_name=config.aws_region)
+        cf = aws_client("cloudformation", config.aws_region)
         stacks = cf.describe_stacks(StackName=stack_name).get("Stacks", [])
         if not stacks:
             raise RuntimeError(f"Stack '{stack_name}' not found")
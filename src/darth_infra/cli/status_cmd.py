@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-import boto3
 import click
 from rich.table import Table
 
-from .helpers import console, get_cluster_name, get_service_name, require_config
+from .helpers import (
+    aws_client,
+    console,
+    get_cluster_name,
+    get_service_name,
+    require_config,
+)
 
 
 @click.command()
@@ -15,7 +20,7 @@ def status(env_name: str) -> None:
     """Show the status of services in an environment."""
     config, _ = require_config()
 
-    ecs = boto3.client("ecs", region_name=config.aws_region)
+    ecs = aws_client("ecs", config.aws_region)
     cluster = get_cluster_name(config.project_name, env_name)
 
     table = Table(title=f"{config.project_name} — {env_name}")
@@ -54,7 +59,7 @@ def status(env_name: str) -> None:
     # RDS status
     if config.rds:
         console.print()
-        rds_client = boto3.client("rds", region_name=config.aws_region)
+        rds_client = aws_client("rds", config.aws_region)
         db_id = f"{config.project_name}-{env_name}-db"
         try:
             resp = rds_client.describe_db_instances(DBInstanceIdentifier=db_id)
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import io
+import json
+import os
 import sys
+from enum import Enum
 from pathlib import Path
-from typing import Any
-
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib  # type: ignore[import-not-found]
+from types import ModuleType
+from typing import Any, Callable, Iterable, TypeVar
 
 from .models import (
     AlbConfig,
@@ -37,44 +39,310 @@ from .models import (
 
 CONFIG_FILENAME = "darth-infra.toml"
 
+_HEADER = (
+    "#:schema darth-infra.schema.json\n"
+    "#\n"
+    "# darth-infra config\n"
+    "#\n"
+    "# This TOML is the main editable config and wizard seed source.\n"
+    "\n"
+    "# [deploy-live] project and network lookup settings\n"
+)
+_BOOL = {True: "true", False: "false"}
+# Single-pass escaping for TOML basic strings. Control characters without a
+# short escape are written as \uXXXX, which TOML requires.
+_TOML_ESCAPES = str.maketrans(
+    {
+        **{chr(c): f"\\u{c:04X}" for c in (*range(0x20), 0x7F)},
+        "\\": "\\\\",
+        '"': '\\"',
+        "\n": "\\n",
+        "\r": "\\r",
+        "\t": "\\t",
+    }
+)
+# Multiline basic strings keep newlines and tabs literal but still need
+# backslashes, quotes and lone carriage returns escaped.
+_TOML_MULTILINE_ESCAPES = str.maketrans(
+    {
+        **{chr(c): f"\\u{c:04X}" for c in (*range(0x20), 0x7F) if c not in (9, 10)},
+        "\\": "\\\\",
+        '"': '\\"',
+        "\r": "\\r",
+    }
+)
+_BARE_KEY_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+
+_E = TypeVar("_E", bound=Enum)
+
+# Config enum member -> TOML string, so dump_config does a dict probe per
+# record instead of going through the Enum.value descriptor.
+_ENUM_VALUES: dict[Enum, str] = {
+    member: member.value
+    for enum_cls in (
+        AlbMode,
+        Architecture,
+        CloudFrontCookiesMode,
+        CloudFrontQueryStringsMode,
+        LaunchType,
+        S3BucketMode,
+        SecretSource,
+    )
+    for member in enum_cls
+}
+
+# Fixed runs of lines repeated per record in dump_config, filled in with a
+# single str.format call on a _TomlEscaped view of the record. Enum fields are
+# excluded on purpose: format() on a str-mixin Enum renders the member name,
+# not its value.
+_PROJECT_HEAD = (
+    "[project]\n"
+    'name = "{0.project_name}"\n'
+    'aws_region = "{0.aws_region}"\n'
+    'vpc_name = "{0.vpc_name}"\n'
+)
+_SERVICE_HEAD = (
+    "[[services]]\n"
+    'name = "{0.name}"\n'
+    'dockerfile = "{0.dockerfile}"\n'
+    'build_context = "{0.build_context}"\n'
+)
+_SERVICE_HEALTH_CHECK = (
+    'health_check_path = "{0.health_check_path}"\n'
+    'health_check_http_codes = "{0.health_check_http_codes}"\n'
+    "health_check_timeout_seconds = {0.health_check_timeout_seconds}\n"
+    "health_check_interval_seconds = {0.health_check_interval_seconds}\n"
+    "healthy_threshold_count = {0.healthy_threshold_count}\n"
+    "unhealthy_threshold_count = {0.unhealthy_threshold_count}\n"
+)
+_SERVICE_SIZING = (
+    "cpu = {0.cpu}\nmemory_mib = {0.memory_mib}\ndesired_count = {0.desired_count}\n"
+)
+_SERVICE_FLAGS = (
+    "enable_exec = {0}\n"
+    "enable_ses_send_email = {1}\n"
+    "enable_service_discovery = {2}\n"
+)
+_ULIMIT = (
+    "\n[[services.ulimits]]\n"
+    'name = "{0.name}"\n'
+    "soft_limit = {0.soft_limit}\n"
+    "hard_limit = {0.hard_limit}\n"
+)
+_EBS_VOLUME = (
+    "\n[[services.ebs_volumes]]\n"
+    'name = "{0.name}"\n'
+    "size_gb = {0.size_gb}\n"
+    'mount_path = "{0.mount_path}"\n'
+    'device_name = "{0.device_name}"\n'
+    'volume_type = "{0.volume_type}"\n'
+    'filesystem_type = "{0.filesystem_type}"\n'
+)
+_RDS = (
+    "# Optional RDS\n[rds]\n"
+    'database_name = "{0.database_name}"\n'
+    'instance_type = "{0.instance_type}"\n'
+    "allocated_storage_gb = {0.allocated_storage_gb}\n"
+    "expose_to = {1}\n"
+    'engine_version = "{0.engine_version}"\n'
+    "backup_retention_days = {0.backup_retention_days}\n"
+    "\n"
+)
+_S3_BUCKET_FLAGS = (
+    "seed_non_prod_only = {0}\npublic_read = {1}\ncloudfront = {2}\ncors = {3}\n"
+)
+_S3_CONNECTION_HEAD = (
+    "\n[[s3_buckets.connections]]\n"
+    'service = "{0.service}"\n'
+    'env_key = "{0.env_key}"\n'
+)
+_ALB_HEAD = (
+    "# [deploy-live] ALB lookup/attachment behavior\n[alb]\n"
+    'mode = "{1}"\n'
+    'shared_alb_name = "{0.shared_alb_name}"\n'
+)
+_ALB_PATH_RULE = (
+    "\n[[alb.path_rules]]\n"
+    'name = "{0.name}"\n'
+    'path_pattern = "{0.path_pattern}"\n'
+    'target_service = "{0.target_service}"\n'
+    "priority = {0.priority}\n"
+)
+_CACHED_BEHAVIOR_HEAD = (
+    "\n[[cloudfront.cached_behaviors]]\n"
+    'name = "{0.name}"\n'
+    'path_pattern = "{0.path_pattern}"\n'
+    "compress = {1}\n"
+    "cache_by_origin_headers = {2}\n"
+    "min_ttl_seconds = {0.min_ttl_seconds}\n"
+    "default_ttl_seconds = {0.default_ttl_seconds}\n"
+    "max_ttl_seconds = {0.max_ttl_seconds}\n"
+)
+
+# realpath -> (st_mtime_ns, st_size, parsed config)
+_CONFIG_CACHE: dict[str, tuple[int, int, ProjectConfig]] = {}
+
+# Opt-in: keep a JSON copy of the raw TOML document next to the config so
+# repeated process launches (CI, watchers) can skip the TOML parse.
+JSON_CACHE_ENV = "DARTH_INFRA_CONFIG_CACHE"
+
 
 def _toml_escape(value: str) -> str:
     """Escape a string value for safe inclusion in TOML double quotes."""
-    return value.replace("\\", "\\\\").replace('"', '\\"')
+    return value.translate(_TOML_ESCAPES)
 
 
 def _toml_multiline(value: str) -> str:
     """Render a string as a TOML multiline basic string."""
-    return '"""\n' + value.replace('"""', '\\"""') + '\n"""'
+    return '"""\n' + value.translate(_TOML_MULTILINE_ESCAPES) + '\n"""'
+
+
+def _toml_str_array(values: Iterable[str]) -> str:
+    """Render strings as an inline TOML array, e.g. ``["a", "b"]``."""
+    items = [_toml_escape(value) for value in values]
+    if not items:
+        return "[]"
+    return '["' + '", "'.join(items) + '"]'
+
+
+def _toml_key(key: str) -> str:
+    """Render a table-header key, quoting it unless it is a valid bare key."""
+    if key and not key.strip(_BARE_KEY_CHARS):
+        return key
+    return f'"{_toml_escape(key)}"'
+
+
+class _TomlEscaped:
+    """Attribute view of a config record with string fields TOML-escaped."""
+
+    __slots__ = ("_record",)
+
+    def __init__(self, record: object) -> None:
+        self._record = record
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._record, name)
+        return _toml_escape(value) if isinstance(value, str) else value
 
 
 def _enum_value(value: object) -> str:
-    return getattr(value, "value", str(value))
+    try:
+        return _ENUM_VALUES[value]  # type: ignore[index]
+    except (KeyError, TypeError):
+        return getattr(value, "value", str(value))
+
+
+def _tomllib() -> ModuleType:
+    """Import the TOML parser on first use.
+
+    The wizard and ``dump_config`` never parse TOML, so callers that only
+    write configs should not pay for the import at startup.
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib  # type: ignore[import-not-found]
+    return tomllib
 
 
 def find_config(start: Path | None = None) -> Path:
-    """Walk up from *start* (default: cwd) to find ``darth-infra.toml``."""
-    current = (start or Path.cwd()).resolve()
+    """Walk up from *start* (default: cwd) to find ``darth-infra.toml``.
+
+    The walk is lexical on plain strings; a ``Path`` is only built for the
+    match. Matches are memoized per starting directory (misses are not);
+    call ``find_config.cache_clear()`` after moving config files around.
+    """
+    return _find_config_cached(
+        os.path.abspath(start if start is not None else os.getcwd())
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _find_config_cached(start: str) -> Path:
+    current = start
     while True:
-        candidate = current / CONFIG_FILENAME
-        if candidate.is_file():
-            return candidate
-        parent = current.parent
+        candidate = os.path.join(current, CONFIG_FILENAME)
+        if os.path.isfile(candidate):
+            return Path(candidate)
+        parent = os.path.dirname(current)
         if parent == current:
             raise FileNotFoundError(
-                f"Could not find {CONFIG_FILENAME} in {start or Path.cwd()} "
+                f"Could not find {CONFIG_FILENAME} in {start} "
                 f"or any parent directory"
             )
         current = parent
 
 
+find_config.cache_clear = _find_config_cached.cache_clear  # type: ignore[attr-defined]
+
+
 def load_config(path: Path | None = None) -> ProjectConfig:
-    """Parse ``darth-infra.toml`` into a ``ProjectConfig``."""
-    config_path = path or find_config()
-    with open(config_path, "rb") as f:
-        raw = tomllib.load(f)
+    """Parse ``darth-infra.toml`` into a ``ProjectConfig``.
 
-    return _parse_project(raw)
+    Parsed configs are cached per file and reused while the file's mtime and
+    size are unchanged. Repeated calls return the same shared object, so
+    callers must not mutate it; ``copy.deepcopy`` the result first if needed.
+    """
+    config_path = path or find_config()
+    st = os.stat(config_path)
+    key = os.path.realpath(config_path)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        raw = _read_raw_config(config_path, st)
+        cached = (st.st_mtime_ns, st.st_size, _parse_project(raw))
+        _CONFIG_CACHE[key] = cached
+
+    return cached[2]
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear  # type: ignore[attr-defined]
+
+
+def _json_cache_path(config_path: str | os.PathLike[str]) -> str:
+    head, tail = os.path.split(os.fspath(config_path))
+    return os.path.join(head, f".{tail}.cache.json")
+
+
+def _read_raw_config(
+    config_path: str | os.PathLike[str], st: os.stat_result
+) -> dict[str, Any]:
+    """Read the raw TOML document, from the JSON sidecar when it is current.
+
+    The sidecar is only consulted and written when ``DARTH_INFRA_CONFIG_CACHE=1``.
+    It records the mtime and size of the TOML file it was built from, so any
+    edit to the TOML invalidates it.
+    """
+    use_json_cache = os.environ.get(JSON_CACHE_ENV) == "1"
+    if use_json_cache:
+        sidecar = _json_cache_path(config_path)
+        try:
+            with open(sidecar, "rb") as f:
+                cached = json.load(f)
+            if cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+                return cached["raw"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    raw = _tomllib().loads(Path(config_path).read_bytes().decode())
+
+    if use_json_cache:
+        _write_json_cache(sidecar, st, raw)
+    return raw
+
+
+def _write_json_cache(sidecar: str, st: os.stat_result, raw: dict[str, Any]) -> None:
+    tmp = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "raw": raw}, f)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        # Read-only checkout or TOML values JSON can't hold (dates); the
+        # sidecar is only an optimization, so carry on without it.
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
 
 def _parse_project(raw: dict[str, Any]) -> ProjectConfig:
@@ -87,16 +355,17 @@ def _parse_project(raw: dict[str, Any]) -> ProjectConfig:
     secrets_raw = raw.get("secrets", [])
     env_overrides_raw = raw.get("environments", {})
 
-    services = [_parse_service(s) for s in services_raw]
+    services = list(map(_parse_service, services_raw))
     rds = _parse_rds(rds_raw) if rds_raw else None
-    s3_buckets = [_parse_s3(b) for b in s3_raw]
+    s3_buckets = list(map(_parse_s3, s3_raw))
     cloudfront = _parse_cloudfront(cloudfront_raw)
     alb = _parse_alb(alb_raw)
-    secrets = [_parse_secret(s) for s in secrets_raw]
+    secrets = list(map(SecretConfig.from_dict, secrets_raw))
+    # TOML tables always decode to plain dicts; skip scalar values.
     environment_overrides = {
         name: _parse_env_override(data)
         for name, data in env_overrides_raw.items()
-        if isinstance(data, dict)
+        if type(data) is dict
     }
 
     return ProjectConfig(
@@ -118,79 +387,95 @@ def _parse_project(raw: dict[str, Any]) -> ProjectConfig:
     )
 
 
+# Plain fields copied from a raw TOML table only when present, so absent
+# keys fall back to the dataclass defaults instead of a second copy here.
+_SERVICE_FIELDS = (
+    "dockerfile",
+    "build_context",
+    "docker_build_target",
+    "image",
+    "health_check_path",
+    "health_check_http_codes",
+    "health_check_timeout_seconds",
+    "health_check_interval_seconds",
+    "healthy_threshold_count",
+    "unhealthy_threshold_count",
+    "health_check_grace_period_seconds",
+    "cpu",
+    "memory_mib",
+    "desired_count",
+    "command",
+    "secrets",
+    "s3_access",
+    "environment_variables",
+    "enable_exec",
+    "enable_ses_send_email",
+    "ec2_instance_type",
+    "user_data_script",
+    "user_data_script_content",
+    "enable_service_discovery",
+)
+_RDS_FIELDS = (
+    "instance_type",
+    "allocated_storage_gb",
+    "expose_to",
+    "engine_version",
+    "backup_retention_days",
+)
+_S3_BUCKET_FIELDS = (
+    "existing_bucket_name",
+    "seed_source_bucket_name",
+    "seed_non_prod_only",
+    "public_read",
+    "cloudfront",
+    "cors",
+)
+_ALB_FIELDS = (
+    "shared_alb_name",
+    "shared_listener_arn",
+    "shared_alb_security_group_id",
+    "certificate_arn",
+    "domain",
+    "default_target_service",
+    "default_listener_priority",
+)
+
+
+def _enum(enum_cls: type[_E], value: str) -> _E:
+    """Resolve a TOML string through the enum's value -> member map.
+
+    Invalid values fall back to the enum call so the usual ValueError is
+    raised.
+    """
+    return enum_cls._value2member_map_.get(value) or enum_cls(value)  # type: ignore[return-value]
+
+
+def _present(raw: dict[str, Any], keys: tuple[str, ...]) -> dict[str, Any]:
+    return {key: raw[key] for key in keys if key in raw}
+
+
 def _parse_service(raw: dict[str, Any]) -> ServiceConfig:
     if "domain" in raw:
         raise ValueError(
             "services[].domain is no longer supported; use alb.domain and alb routing fields"
         )
-    # Port defaults to None if not explicitly set (background workers have no port)
-    port = raw.get("port")
-    launch_type_str = raw.get("launch_type", "fargate")
-    ebs_raw = raw.get("ebs_volumes", [])
-    ebs_volumes = [
-        EbsVolumeConfig(
-            name=v["name"],
-            size_gb=v["size_gb"],
-            mount_path=v["mount_path"],
-            device_name=v.get("device_name", "/dev/xvdf"),
-            volume_type=v.get("volume_type", "gp3"),
-            filesystem_type=v.get("filesystem_type", "ext4"),
-        )
-        for v in ebs_raw
-    ]
-    ulimits_raw = raw.get("ulimits", [])
-    ulimits = [
-        UlimitConfig(
-            name=u["name"],
-            soft_limit=u["soft_limit"],
-            hard_limit=u["hard_limit"],
-        )
-        for u in ulimits_raw
-    ]
     arch_str = raw.get("architecture")
-    architecture = Architecture(arch_str) if arch_str else None
     return ServiceConfig(
         name=raw["name"],
-        dockerfile=raw.get("dockerfile", "Dockerfile"),
-        build_context=raw.get("build_context", "."),
-        docker_build_target=raw.get("docker_build_target"),
-        image=raw.get("image"),
-        port=port,
-        health_check_path=raw.get("health_check_path", "/health"),
-        health_check_http_codes=raw.get("health_check_http_codes", "200-399"),
-        health_check_timeout_seconds=raw.get("health_check_timeout_seconds", 5),
-        health_check_interval_seconds=raw.get("health_check_interval_seconds", 30),
-        healthy_threshold_count=raw.get("healthy_threshold_count", 5),
-        unhealthy_threshold_count=raw.get("unhealthy_threshold_count", 2),
-        health_check_grace_period_seconds=raw.get("health_check_grace_period_seconds"),
-        cpu=raw.get("cpu", 256),
-        memory_mib=raw.get("memory_mib", 512),
-        desired_count=raw.get("desired_count", 1),
-        command=raw.get("command"),
-        secrets=raw.get("secrets", []),
-        s3_access=raw.get("s3_access", []),
-        environment_variables=raw.get("environment_variables", {}),
-        ulimits=ulimits,
-        enable_exec=raw.get("enable_exec", True),
-        enable_ses_send_email=raw.get("enable_ses_send_email", False),
-        launch_type=LaunchType(launch_type_str),
-        ec2_instance_type=raw.get("ec2_instance_type"),
-        architecture=architecture,
-        user_data_script=raw.get("user_data_script"),
-        user_data_script_content=raw.get("user_data_script_content"),
-        ebs_volumes=ebs_volumes,
-        enable_service_discovery=raw.get("enable_service_discovery", False),
+        # Port defaults to None if not explicitly set (background workers have no port)
+        port=raw.get("port"),
+        launch_type=_enum(LaunchType, raw.get("launch_type", "fargate")),
+        architecture=_enum(Architecture, arch_str) if arch_str else None,
+        ulimits=list(map(UlimitConfig.from_dict, raw.get("ulimits", []))),
+        ebs_volumes=list(map(EbsVolumeConfig.from_dict, raw.get("ebs_volumes", []))),
+        **_present(raw, _SERVICE_FIELDS),
     )
 
 
 def _parse_rds(raw: dict[str, Any]) -> RdsConfig:
     return RdsConfig(
         database_name=raw.get("database_name", "app"),
-        instance_type=raw.get("instance_type", "db.t4g.micro"),
-        allocated_storage_gb=raw.get("allocated_storage_gb", 20),
-        expose_to=raw.get("expose_to", []),
-        engine_version=raw.get("engine_version", "15"),
-        backup_retention_days=raw.get("backup_retention_days", 7),
+        **_present(raw, _RDS_FIELDS),
     )
 
 
@@ -206,28 +491,15 @@ def _parse_s3(raw: dict[str, Any]) -> S3BucketConfig:
     ]
     return S3BucketConfig(
         name=raw["name"],
-        mode=S3BucketMode(raw.get("mode", "managed")),
-        existing_bucket_name=raw.get("existing_bucket_name"),
-        seed_source_bucket_name=raw.get("seed_source_bucket_name"),
-        seed_non_prod_only=raw.get("seed_non_prod_only", True),
-        public_read=raw.get("public_read", False),
-        cloudfront=raw.get("cloudfront", False),
-        cors=raw.get("cors", False),
+        mode=_enum(S3BucketMode, raw.get("mode", "managed")),
         connections=connections,
+        **_present(raw, _S3_BUCKET_FIELDS),
     )
 
 
 def _parse_alb(raw: dict[str, Any]) -> AlbConfig:
-    mode_str = raw.get("mode", "shared")
     return AlbConfig(
-        mode=AlbMode(mode_str),
-        shared_alb_name=raw.get("shared_alb_name", ""),
-        shared_listener_arn=raw.get("shared_listener_arn"),
-        shared_alb_security_group_id=raw.get("shared_alb_security_group_id"),
-        certificate_arn=raw.get("certificate_arn"),
-        domain=raw.get("domain"),
-        default_target_service=raw.get("default_target_service"),
-        default_listener_priority=raw.get("default_listener_priority"),
+        mode=_enum(AlbMode, raw.get("mode", "shared")),
         path_rules=[
             AlbPathRule(
                 name=str(rule["name"]),
@@ -237,6 +509,7 @@ def _parse_alb(raw: dict[str, Any]) -> AlbConfig:
             )
             for rule in raw.get("path_rules", [])
         ],
+        **_present(raw, _ALB_FIELDS),
     )
 
 
@@ -265,11 +538,11 @@ def _parse_cloudfront(raw: dict[str, Any]) -> CloudFrontConfig:
                 min_ttl_seconds=behavior.get("min_ttl_seconds", 0),
                 default_ttl_seconds=behavior.get("default_ttl_seconds", 3600),
                 max_ttl_seconds=behavior.get("max_ttl_seconds", 31536000),
-                query_strings=CloudFrontQueryStringsMode(
-                    behavior.get("query_strings", "all")
+                query_strings=_enum(
+                    CloudFrontQueryStringsMode, behavior.get("query_strings", "all")
                 ),
                 query_string_allowlist=list(behavior.get("query_string_allowlist", [])),
-                cookies=CloudFrontCookiesMode(behavior.get("cookies", "none")),
+                cookies=_enum(CloudFrontCookiesMode, behavior.get("cookies", "none")),
                 cookie_allowlist=list(behavior.get("cookie_allowlist", [])),
                 forward_authorization_header=behavior.get(
                     "forward_authorization_header", False
@@ -280,17 +553,6 @@ def _parse_cloudfront(raw: dict[str, Any]) -> CloudFrontConfig:
     )
 
 
-def _parse_secret(raw: dict[str, Any]) -> SecretConfig:
-    source_str = raw.get("source", "generate")
-    return SecretConfig(
-        name=raw["name"],
-        source=SecretSource(source_str),
-        existing_secret_name=raw.get("existing_secret_name"),
-        length=raw.get("length", 50),
-        generate_once=raw.get("generate_once", True),
-    )
-
-
 def _parse_env_override(raw: dict[str, Any]) -> EnvironmentOverride:
     return EnvironmentOverride(
         instance_type_override=raw.get("instance_type_override"),
@@ -299,181 +561,207 @@ def _parse_env_override(raw: dict[str, Any]) -> EnvironmentOverride:
     )
 
 
-def dump_config(config: ProjectConfig) -> str:
-    """Serialize a ``ProjectConfig`` to TOML string."""
-    lines: list[str] = []
-
-    lines.append("#:schema darth-infra.schema.json")
-    lines.append("#")
-    lines.append("# darth-infra config")
-    lines.append("#")
-    lines.append("# This TOML is the main editable config and wizard seed source.")
-    lines.append("")
-    lines.append("# [deploy-live] project and network lookup settings")
-    lines.append("[project]")
-    lines.append(f'name = "{config.project_name}"')
-    lines.append(f'aws_region = "{config.aws_region}"')
-    lines.append(f'vpc_name = "{config.vpc_name}"')
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
+def _toml_value(value: Any) -> Any:
+    """Normalize config values for a TOML writer.
+
+    Dataclasses become tables (walked directly rather than deep-copied by
+    ``asdict``), enums become their values, and ``None`` entries are dropped.
+    """
+    if dataclasses.is_dataclass(value):
+        return {
+            name: _toml_value(field_value)
+            for name in _field_names(type(value))
+            if (field_value := getattr(value, name)) is not None
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {k: _toml_value(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_toml_value(v) for v in value]
+    return value
+
+
+def _config_to_toml_dict(config: ProjectConfig) -> dict[str, Any]:
+    """Map a ``ProjectConfig`` onto the ``darth-infra.toml`` table layout."""
+    data = _toml_value(config)
+    project = {"name": data.pop("project_name")}
+    for key in (
+        "aws_region",
+        "vpc_name",
+        "vpc_id",
+        "private_subnet_ids",
+        "public_subnet_ids",
+        "environments",
+        "tags",
+    ):
+        if key in data:
+            project[key] = data.pop(key)
+    environment_overrides = data.pop("environment_overrides")
+    result: dict[str, Any] = {"project": project, **data}
+    if environment_overrides:
+        result["environments"] = environment_overrides
+    return result
+
+
+def dump_config(config: ProjectConfig, *, use_tomli_w: bool = False) -> str:
+    """Serialize a ``ProjectConfig`` to TOML string.
+
+    With ``use_tomli_w=True`` the document is produced by ``tomli_w`` from the
+    dataclass fields, which escapes every string value. The hand-written
+    writer below stays the default while that output is being verified.
+    """
+    if use_tomli_w:
+        import tomli_w
+
+        return "#:schema darth-infra.schema.json\n\n" + tomli_w.dumps(
+            _config_to_toml_dict(config), multiline_strings=True
+        )
+
+    buf = io.StringIO()
+    _write_config(config, buf.write)
+    return buf.getvalue()
+
+
+def dump_config_to(config: ProjectConfig, path: str | os.PathLike[str]) -> None:
+    """Write the ``dump_config`` document straight to *path*."""
+    with open(path, "w", encoding="utf-8") as f:
+        _write_config(config, f.write)
+
+
+def _write_config(config: ProjectConfig, w: Callable[[str], object]) -> None:
+    w(_HEADER)
+    w(_PROJECT_HEAD.format(_TomlEscaped(config)))
     if config.vpc_id:
-        lines.append(f'vpc_id = "{config.vpc_id}"')
+        w(f'vpc_id = "{_toml_escape(config.vpc_id)}"\n')
     if config.private_subnet_ids:
-        subnet_list = ", ".join(f'"{s}"' for s in config.private_subnet_ids)
-        lines.append(f"private_subnet_ids = [{subnet_list}]")
+        w(f"private_subnet_ids = {_toml_str_array(config.private_subnet_ids)}\n")
     if config.public_subnet_ids:
-        subnet_list = ", ".join(f'"{s}"' for s in config.public_subnet_ids)
-        lines.append(f"public_subnet_ids = [{subnet_list}]")
-    env_list = ", ".join(f'"{e}"' for e in config.environments)
-    lines.append(f"environments = [{env_list}]")
+        w(f"public_subnet_ids = {_toml_str_array(config.public_subnet_ids)}\n")
+    w(f"environments = {_toml_str_array(config.environments)}\n")
     if config.tags:
-        lines.append("")
-        lines.append("[project.tags]")
-        for k, v in config.tags.items():
-            lines.append(f'"{k}" = "{v}"')
-    lines.append("")
+        w("\n[project.tags]\n")
+        w(
+            "".join(
+                f'"{_toml_escape(k)}" = "{_toml_escape(v)}"\n'
+                for k, v in config.tags.items()
+            )
+        )
+    w("\n")
 
-    lines.append("# Service runtime settings")
+    w("# Service runtime settings\n")
     for svc in config.services:
-        lines.append("[[services]]")
-        lines.append(f'name = "{svc.name}"')
-        lines.append(f'dockerfile = "{svc.dockerfile}"')
-        lines.append(f'build_context = "{svc.build_context}"')
+        w(_SERVICE_HEAD.format(_TomlEscaped(svc)))
         if svc.docker_build_target:
-            lines.append(f'docker_build_target = "{svc.docker_build_target}"')
+            w(f'docker_build_target = "{_toml_escape(svc.docker_build_target)}"\n')
         if svc.image:
-            lines.append(f'image = "{svc.image}"')
+            w(f'image = "{_toml_escape(svc.image)}"\n')
         if svc.port is not None:
-            lines.append(f"port = {svc.port}")
+            w(f"port = {svc.port}\n")
         else:
-            lines.append("# port omitted for worker service")
-        lines.append(f'health_check_path = "{svc.health_check_path}"')
-        lines.append(f'health_check_http_codes = "{svc.health_check_http_codes}"')
-        lines.append(
-            f"health_check_timeout_seconds = {svc.health_check_timeout_seconds}"
-        )
-        lines.append(
-            f"health_check_interval_seconds = {svc.health_check_interval_seconds}"
-        )
-        lines.append(f"healthy_threshold_count = {svc.healthy_threshold_count}")
-        lines.append(f"unhealthy_threshold_count = {svc.unhealthy_threshold_count}")
+            w("# port omitted for worker service\n")
+        w(_SERVICE_HEALTH_CHECK.format(_TomlEscaped(svc)))
         if svc.health_check_grace_period_seconds is not None:
-            lines.append(
-                f"health_check_grace_period_seconds = {svc.health_check_grace_period_seconds}"
+            w(
+                "health_check_grace_period_seconds = "
+                f"{svc.health_check_grace_period_seconds}\n"
             )
-        lines.append(f"cpu = {svc.cpu}")
-        lines.append(f"memory_mib = {svc.memory_mib}")
-        lines.append(f"desired_count = {svc.desired_count}")
+        w(_SERVICE_SIZING.format(svc))
         if svc.command:
-            lines.append(f'command = "{_toml_escape(svc.command)}"')
-        lines.append(f'launch_type = "{_enum_value(svc.launch_type)}"')
+            w(f'command = "{_toml_escape(svc.command)}"\n')
+        w(f'launch_type = "{_enum_value(svc.launch_type)}"\n')
         if svc.ec2_instance_type:
-            lines.append(f'ec2_instance_type = "{svc.ec2_instance_type}"')
+            w(f'ec2_instance_type = "{_toml_escape(svc.ec2_instance_type)}"\n')
         if svc.architecture:
-            lines.append(f'architecture = "{_enum_value(svc.architecture)}"')
+            w(f'architecture = "{_enum_value(svc.architecture)}"\n')
         if svc.user_data_script:
-            lines.append(f'user_data_script = "{svc.user_data_script}"')
+            w(f'user_data_script = "{_toml_escape(svc.user_data_script)}"\n')
         if svc.user_data_script_content:
-            lines.append(
-                f"user_data_script_content = {_toml_multiline(svc.user_data_script_content)}"
+            w(
+                "user_data_script_content = "
+                f"{_toml_multiline(svc.user_data_script_content)}\n"
             )
         if svc.secrets:
-            sec_list = ", ".join(f'"{s}"' for s in svc.secrets)
-            lines.append(f"secrets = [{sec_list}]")
+            w(f"secrets = {_toml_str_array(svc.secrets)}\n")
         if svc.environment_variables:
             env_inline = ", ".join(
-                f'"{k}" = "{_toml_escape(v)}"'
+                f'"{_toml_escape(k)}" = "{_toml_escape(v)}"'
                 for k, v in svc.environment_variables.items()
             )
-            lines.append(f"environment_variables = {{ {env_inline} }}")
-        lines.append(f"enable_exec = {str(svc.enable_exec).lower()}")
-        lines.append(
-            f"enable_ses_send_email = {str(svc.enable_ses_send_email).lower()}"
-        )
-        lines.append(
-            f"enable_service_discovery = {str(svc.enable_service_discovery).lower()}"
+            w(f"environment_variables = {{ {env_inline} }}\n")
+        w(
+            _SERVICE_FLAGS.format(
+                _BOOL[svc.enable_exec],
+                _BOOL[svc.enable_ses_send_email],
+                _BOOL[svc.enable_service_discovery],
+            )
         )
         for ul in svc.ulimits:
-            lines.append("")
-            lines.append("[[services.ulimits]]")
-            lines.append(f'name = "{ul.name}"')
-            lines.append(f"soft_limit = {ul.soft_limit}")
-            lines.append(f"hard_limit = {ul.hard_limit}")
+            w(_ULIMIT.format(_TomlEscaped(ul)))
         for vol in svc.ebs_volumes:
-            lines.append("")
-            lines.append("[[services.ebs_volumes]]")
-            lines.append(f'name = "{vol.name}"')
-            lines.append(f"size_gb = {vol.size_gb}")
-            lines.append(f'mount_path = "{vol.mount_path}"')
-            lines.append(f'device_name = "{vol.device_name}"')
-            lines.append(f'volume_type = "{vol.volume_type}"')
-            lines.append(f'filesystem_type = "{vol.filesystem_type}"')
-        lines.append("")
-
-    if config.rds:
-        lines.append("# Optional RDS")
-        lines.append("[rds]")
-        lines.append(f'database_name = "{config.rds.database_name}"')
-        lines.append(f'instance_type = "{config.rds.instance_type}"')
-        lines.append(f"allocated_storage_gb = {config.rds.allocated_storage_gb}")
-        expose_list = ", ".join(f'"{s}"' for s in config.rds.expose_to)
-        lines.append(f"expose_to = [{expose_list}]")
-        lines.append(f'engine_version = "{config.rds.engine_version}"')
-        lines.append(f"backup_retention_days = {config.rds.backup_retention_days}")
-        lines.append("")
+            w(_EBS_VOLUME.format(_TomlEscaped(vol)))
+        w("\n")
+
+    rds = config.rds
+    if rds:
+        w(_RDS.format(_TomlEscaped(rds), _toml_str_array(rds.expose_to)))
 
     if config.s3_buckets:
-        lines.append("# Optional S3 buckets")
+        w("# Optional S3 buckets\n")
     for bucket in config.s3_buckets:
-        lines.append("[[s3_buckets]]")
-        lines.append(f'name = "{bucket.name}"')
-        lines.append(f'mode = "{_enum_value(bucket.mode)}"')
+        w("[[s3_buckets]]\n")
+        w(f'name = "{_toml_escape(bucket.name)}"\n')
+        w(f'mode = "{_enum_value(bucket.mode)}"\n')
         if bucket.existing_bucket_name:
-            lines.append(f'existing_bucket_name = "{bucket.existing_bucket_name}"')
+            w(
+                "existing_bucket_name = "
+                f'"{_toml_escape(bucket.existing_bucket_name)}"\n'
+            )
         if bucket.seed_source_bucket_name:
-            lines.append(
-                f'seed_source_bucket_name = "{bucket.seed_source_bucket_name}"'
+            w(
+                "seed_source_bucket_name = "
+                f'"{_toml_escape(bucket.seed_source_bucket_name)}"\n'
             )
-        lines.append(f"seed_non_prod_only = {str(bucket.seed_non_prod_only).lower()}")
-        lines.append(f"public_read = {str(bucket.public_read).lower()}")
-        lines.append(f"cloudfront = {str(bucket.cloudfront).lower()}")
-        lines.append(f"cors = {str(bucket.cors).lower()}")
+        w(
+            _S3_BUCKET_FLAGS.format(
+                _BOOL[bucket.seed_non_prod_only],
+                _BOOL[bucket.public_read],
+                _BOOL[bucket.cloudfront],
+                _BOOL[bucket.cors],
+            )
+        )
         for conn in bucket.connections:
-            lines.append("")
-            lines.append("[[s3_buckets.connections]]")
-            lines.append(f'service = "{conn.service}"')
-            lines.append(f'env_key = "{conn.env_key}"')
+            w(_S3_CONNECTION_HEAD.format(_TomlEscaped(conn)))
             if conn.cloudfront_env_key:
-                lines.append(f'cloudfront_env_key = "{conn.cloudfront_env_key}"')
-            lines.append(f"read_only = {str(conn.read_only).lower()}")
-        lines.append("")
-
-    lines.append("# [deploy-live] ALB lookup/attachment behavior")
-    lines.append("[alb]")
-    lines.append(f'mode = "{_enum_value(config.alb.mode)}"')
-    lines.append(f'shared_alb_name = "{config.alb.shared_alb_name}"')
-    if config.alb.shared_listener_arn:
-        lines.append(f'shared_listener_arn = "{config.alb.shared_listener_arn}"')
-    if config.alb.shared_alb_security_group_id:
-        lines.append(
-            f'shared_alb_security_group_id = "{config.alb.shared_alb_security_group_id}"'
+                w(f'cloudfront_env_key = "{_toml_escape(conn.cloudfront_env_key)}"\n')
+            w(f"read_only = {_BOOL[conn.read_only]}\n")
+        w("\n")
+
+    alb = config.alb
+    w(_ALB_HEAD.format(_TomlEscaped(alb), _enum_value(alb.mode)))
+    if alb.shared_listener_arn:
+        w(f'shared_listener_arn = "{_toml_escape(alb.shared_listener_arn)}"\n')
+    if alb.shared_alb_security_group_id:
+        w(
+            "shared_alb_security_group_id = "
+            f'"{_toml_escape(alb.shared_alb_security_group_id)}"\n'
         )
-    if config.alb.certificate_arn:
-        lines.append(f'certificate_arn = "{config.alb.certificate_arn}"')
-    if config.alb.domain:
-        lines.append(f'domain = "{config.alb.domain}"')
-    if config.alb.default_target_service:
-        lines.append(f'default_target_service = "{config.alb.default_target_service}"')
-    if config.alb.default_listener_priority is not None:
-        lines.append(
-            f"default_listener_priority = {config.alb.default_listener_priority}"
-        )
-    for rule in config.alb.path_rules:
-        lines.append("")
-        lines.append("[[alb.path_rules]]")
-        lines.append(f'name = "{rule.name}"')
-        lines.append(f'path_pattern = "{rule.path_pattern}"')
-        lines.append(f'target_service = "{rule.target_service}"')
-        lines.append(f"priority = {rule.priority}")
-    lines.append("")
+    if alb.certificate_arn:
+        w(f'certificate_arn = "{_toml_escape(alb.certificate_arn)}"\n')
+    if alb.domain:
+        w(f'domain = "{_toml_escape(alb.domain)}"\n')
+    if alb.default_target_service:
+        w(f'default_target_service = "{_toml_escape(alb.default_target_service)}"\n')
+    if alb.default_listener_priority is not None:
+        w(f"default_listener_priority = {alb.default_listener_priority}\n")
+    for rule in alb.path_rules:
+        w(_ALB_PATH_RULE.format(_TomlEscaped(rule)))
+    w("\n")
 
     cloudfront = config.cloudfront
     if (
@@ -486,94 +774,86 @@ def dump_config(config: ProjectConfig) -> str:
         or cloudfront.certificate_arn
         or cloudfront.price_class != "PriceClass_100"
     ):
-        lines.append("# [deploy-live] CloudFront distribution behavior")
-        lines.append("[cloudfront]")
-        lines.append(f"enabled = {str(cloudfront.enabled).lower()}")
+        w("# [deploy-live] CloudFront distribution behavior\n[cloudfront]\n")
+        w(f"enabled = {_BOOL[cloudfront.enabled]}\n")
         if cloudfront.origin_https_only:
-            lines.append("origin_https_only = true")
+            w("origin_https_only = true\n")
         if cloudfront.custom_domain:
-            lines.append(f'custom_domain = "{_toml_escape(cloudfront.custom_domain)}"')
+            w(f'custom_domain = "{_toml_escape(cloudfront.custom_domain)}"\n')
         if cloudfront.certificate_arn:
-            lines.append(
-                f'certificate_arn = "{_toml_escape(cloudfront.certificate_arn)}"'
-            )
-        lines.append(f'price_class = "{cloudfront.price_class}"')
+            w(f'certificate_arn = "{_toml_escape(cloudfront.certificate_arn)}"\n')
+        w(f'price_class = "{_toml_escape(cloudfront.price_class)}"\n')
         if cloudfront.comment:
-            lines.append(f'comment = "{_toml_escape(cloudfront.comment)}"')
+            w(f'comment = "{_toml_escape(cloudfront.comment)}"\n')
         for conn in cloudfront.connections:
-            lines.append("")
-            lines.append("[[cloudfront.connections]]")
-            lines.append(f'service = "{_toml_escape(conn.service)}"')
-            lines.append(f'env_key = "{_toml_escape(conn.env_key)}"')
+            w("\n[[cloudfront.connections]]\n")
+            w(f'service = "{_toml_escape(conn.service)}"\n')
+            w(f'env_key = "{_toml_escape(conn.env_key)}"\n')
         for behavior in cloudfront.cached_behaviors:
-            lines.append("")
-            lines.append("[[cloudfront.cached_behaviors]]")
-            lines.append(f'name = "{_toml_escape(behavior.name)}"')
-            lines.append(f'path_pattern = "{_toml_escape(behavior.path_pattern)}"')
-            lines.append(f"compress = {str(behavior.compress).lower()}")
-            lines.append(
-                "cache_by_origin_headers = "
-                f"{str(behavior.cache_by_origin_headers).lower()}"
+            w(
+                _CACHED_BEHAVIOR_HEAD.format(
+                    _TomlEscaped(behavior),
+                    _BOOL[behavior.compress],
+                    _BOOL[behavior.cache_by_origin_headers],
+                )
             )
-            lines.append(f"min_ttl_seconds = {behavior.min_ttl_seconds}")
-            lines.append(f"default_ttl_seconds = {behavior.default_ttl_seconds}")
-            lines.append(f"max_ttl_seconds = {behavior.max_ttl_seconds}")
-            lines.append(f'query_strings = "{_enum_value(behavior.query_strings)}"')
+            w(f'query_strings = "{_enum_value(behavior.query_strings)}"\n')
             if behavior.query_string_allowlist:
-                allowlist = ", ".join(
-                    f'"{_toml_escape(v)}"' for v in behavior.query_string_allowlist
-                )
-                lines.append(f"query_string_allowlist = [{allowlist}]")
-            lines.append(f'cookies = "{_enum_value(behavior.cookies)}"')
+                allowlist = _toml_str_array(behavior.query_string_allowlist)
+                w(f"query_string_allowlist = {allowlist}\n")
+            w(f'cookies = "{_enum_value(behavior.cookies)}"\n')
             if behavior.cookie_allowlist:
-                allowlist = ", ".join(
-                    f'"{_toml_escape(v)}"' for v in behavior.cookie_allowlist
-                )
-                lines.append(f"cookie_allowlist = [{allowlist}]")
-            lines.append(
+                w(f"cookie_allowlist = {_toml_str_array(behavior.cookie_allowlist)}\n")
+            w(
                 "forward_authorization_header = "
-                f"{str(behavior.forward_authorization_header).lower()}"
+                f"{_BOOL[behavior.forward_authorization_header]}\n"
             )
-        lines.append("")
+        w("\n")
 
     if config.secrets:
-        lines.append("# Secrets")
-    for secret in config.secrets:
-        lines.append("[[secrets]]")
-        lines.append(f'name = "{secret.name}"')
-        lines.append(f'source = "{_enum_value(secret.source)}"')
-        if secret.existing_secret_name:
-            lines.append(
-                f'existing_secret_name = "{_toml_escape(secret.existing_secret_name)}"'
-            )
-        lines.append(f"length = {secret.length}")
-        lines.append(f"generate_once = {str(secret.generate_once).lower()}")
-        lines.append("")
-    if not config.secrets:
-        lines.append("# No secrets configured")
-        lines.append("")
+        w("# Secrets\n")
+        for secret in config.secrets:
+            w("[[secrets]]\n")
+            w(f'name = "{_toml_escape(secret.name)}"\n')
+            w(f'source = "{_enum_value(secret.source)}"\n')
+            if secret.existing_secret_name:
+                w(
+                    "existing_secret_name = "
+                    f'"{_toml_escape(secret.existing_secret_name)}"\n'
+                )
+            w(f"length = {secret.length}\n")
+            w(f"generate_once = {_BOOL[secret.generate_once]}\n")
+            w("\n")
+    else:
+        w("# No secrets configured\n\n")
 
     if config.environment_overrides:
-        lines.append("# [deploy-live] environment-specific runtime overrides")
-    for env_name, override in config.environment_overrides.items():
-        lines.append(f"[environments.{env_name}]")
-        if override.instance_type_override:
-            lines.append(
-                f'instance_type_override = "{override.instance_type_override}"'
-            )
-        if override.tags:
-            lines.append("")
-            lines.append(f"[environments.{env_name}.tags]")
-            for key, value in override.tags.items():
-                lines.append(f'"{_toml_escape(key)}" = "{_toml_escape(value)}"')
-        if override.ec2_instance_type_override:
-            lines.append("")
-            lines.append(f"[environments.{env_name}.ec2_instance_type_override]")
-            for svc_name, itype in override.ec2_instance_type_override.items():
-                lines.append(f'"{_toml_escape(svc_name)}" = "{_toml_escape(itype)}"')
-        lines.append("")
-    if not config.environment_overrides:
-        lines.append("# [deploy-live] no [environments.<name>] overrides configured")
-        lines.append("")
-
-    return "\n".join(lines) + "\n"
+        w("# [deploy-live] environment-specific runtime overrides\n")
+        for env_name, override in config.environment_overrides.items():
+            env_key = _toml_key(env_name)
+            w(f"[environments.{env_key}]\n")
+            if override.instance_type_override:
+                w(
+                    "instance_type_override = "
+                    f'"{_toml_escape(override.instance_type_override)}"\n'
+                )
+            if override.tags:
+                w(f"\n[environments.{env_key}.tags]\n")
+                w(
+                    "".join(
+                        f'"{_toml_escape(key)}" = "{_toml_escape(value)}"\n'
+                        for key, value in override.tags.items()
+                    )
+                )
+            ec2_overrides = override.ec2_instance_type_override
+            if ec2_overrides:
+                w(f"\n[environments.{env_key}.ec2_instance_type_override]\n")
+                w(
+                    "".join(
+                        f'"{_toml_escape(svc_name)}" = "{_toml_escape(itype)}"\n'
+                        for svc_name, itype in ec2_overrides.items()
+                    )
+                )
+            w("\n")
+    else:
+        w("# [deploy-live] no [environments.<name>] overrides configured\n\n")
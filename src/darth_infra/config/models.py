@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 import re
+from typing import Any
 
 
 class SecretSource(str, Enum):
@@ -61,29 +62,33 @@ class CloudFrontCookiesMode(str, Enum):
     ALLOWLIST = "allowlist"
 
 
+_SECRET_SOURCES = SecretSource._value2member_map_
+
 # Graviton / ARM-based instance type prefixes
-_ARM_PREFIXES = (
-    "a1",
-    "t4g",
-    "m6g",
-    "m6gd",
-    "m7g",
-    "m7gd",
-    "c6g",
-    "c6gd",
-    "c6gn",
-    "c7g",
-    "c7gd",
-    "c7gn",
-    "r6g",
-    "r6gd",
-    "r7g",
-    "r7gd",
-    "x2gd",
-    "im4gn",
-    "is4gen",
-    "g5g",
-    "hpc7g",
+_ARM_PREFIXES = frozenset(
+    {
+        "a1",
+        "t4g",
+        "m6g",
+        "m6gd",
+        "m7g",
+        "m7gd",
+        "c6g",
+        "c6gd",
+        "c6gn",
+        "c7g",
+        "c7gd",
+        "c7gn",
+        "r6g",
+        "r6gd",
+        "r7g",
+        "r7gd",
+        "x2gd",
+        "im4gn",
+        "is4gen",
+        "g5g",
+        "hpc7g",
+    }
 )
 
 
@@ -110,7 +115,7 @@ def _rule_param_suffix(value: str) -> str:
     return cleaned or "Rule"
 
 
-@dataclass
+@dataclass(slots=True)
 class SecretConfig:
     """A secret to inject into containers as an environment variable.
 
@@ -134,8 +139,20 @@ class SecretConfig:
     length: int = 50
     generate_once: bool = True
 
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> SecretConfig:
+        """Build a secret from a TOML table or wizard state entry."""
+        source = raw.get("source", "generate")
+        return cls(
+            name=raw["name"],
+            source=_SECRET_SOURCES.get(source) or SecretSource(source),
+            existing_secret_name=raw.get("existing_secret_name"),
+            length=raw.get("length", 50),
+            generate_once=raw.get("generate_once", True),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class S3BucketConnection:
     """A connection from an S3 bucket to an ECS service.
 
@@ -152,7 +169,7 @@ class S3BucketConnection:
     read_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class S3BucketConfig:
     """An S3 bucket to provision per environment.
 
@@ -184,7 +201,7 @@ class S3BucketConfig:
     connections: list[S3BucketConnection] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudFrontConnection:
     """Inject CloudFront URL/domain into a service env var."""
 
@@ -192,7 +209,7 @@ class CloudFrontConnection:
     env_key: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudFrontCachedBehavior:
     """An allowlisted cached CloudFront behavior for ALB-backed origins."""
 
@@ -210,7 +227,7 @@ class CloudFrontCachedBehavior:
     forward_authorization_header: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudFrontConfig:
     """CloudFront distribution configuration in front of ALB routing."""
 
@@ -224,7 +241,7 @@ class CloudFrontConfig:
     cached_behaviors: list[CloudFrontCachedBehavior] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RdsConfig:
     """Optional RDS PostgreSQL instance configuration.
 
@@ -245,7 +262,7 @@ class RdsConfig:
     backup_retention_days: int = 7
 
 
-@dataclass
+@dataclass(slots=True)
 class UlimitConfig:
     """A Linux ulimit to set on the container.
 
@@ -259,8 +276,17 @@ class UlimitConfig:
     soft_limit: int
     hard_limit: int
 
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> UlimitConfig:
+        """Build a ulimit from a TOML table or wizard state entry."""
+        return cls(
+            name=raw["name"],
+            soft_limit=raw["soft_limit"],
+            hard_limit=raw["hard_limit"],
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class EbsVolumeConfig:
     """An EBS volume to attach to an EC2-backed ECS task.
 
@@ -280,8 +306,20 @@ class EbsVolumeConfig:
     volume_type: str = "gp3"
     filesystem_type: str = "ext4"
 
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> EbsVolumeConfig:
+        """Build a volume from a TOML table or wizard state entry."""
+        return cls(
+            name=raw["name"],
+            size_gb=raw["size_gb"],
+            mount_path=raw["mount_path"],
+            device_name=raw.get("device_name", "/dev/xvdf"),
+            volume_type=raw.get("volume_type", "gp3"),
+            filesystem_type=raw.get("filesystem_type", "ext4"),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class AlbPathRule:
     """Optional host+path listener rule targeting a service."""
 
@@ -291,7 +329,7 @@ class AlbPathRule:
     priority: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AlbConfig:
     """Application Load Balancer configuration.
 
@@ -313,7 +351,7 @@ class AlbConfig:
     path_rules: list[AlbPathRule] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceConfig:
     """A single ECS service (container), running on Fargate or EC2.
 
@@ -386,7 +424,7 @@ class ServiceConfig:
     enable_service_discovery: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentOverride:
     """Per-environment overrides for service-level settings.
 
@@ -403,7 +441,7 @@ class EnvironmentOverride:
     """Additional tags applied only when deploying this environment."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TagParameter:
     """CloudFormation parameter metadata for an additional resource tag."""
 
@@ -413,7 +451,7 @@ class TagParameter:
     default_value: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Top-level project configuration. Written to / read from ``darth-infra.toml``.
 
@@ -456,8 +494,9 @@ class ProjectConfig:
             self.environments.insert(0, "prod")
 
         service_names = [s.name for s in self.services]
+        service_name_set = set(service_names)
         service_ports = {s.name: s.port for s in self.services}
-        if len(service_names) != len(set(service_names)):
+        if len(service_names) != len(service_name_set):
             raise ValueError("Service names must be unique")
 
         for svc in self.services:
@@ -498,7 +537,7 @@ class ProjectConfig:
                 raise ValueError("RDS allocated_storage_gb must be >= 20")
             self.rds.instance_type = normalize_rds_instance_type(self.rds.instance_type)
             for svc_name in self.rds.expose_to:
-                if svc_name not in service_names:
+                if svc_name not in service_name_set:
                     raise ValueError(
                         f"RDS expose_to references unknown service '{svc_name}'"
                     )
@@ -530,7 +569,7 @@ class ProjectConfig:
                     f"Secret '{secret.name}' sets existing_secret_name but source is not 'existing' or 'rds'"
                 )
 
-        secret_names = [s.name for s in self.secrets]
+        secret_names = {s.name for s in self.secrets}
         for svc in self.services:
             for sec_name in svc.secrets:
                 if sec_name not in secret_names:
@@ -575,7 +614,7 @@ class ProjectConfig:
 
             seen: set[str] = set()
             for conn in bucket.connections:
-                if conn.service not in service_names:
+                if conn.service not in service_name_set:
                     raise ValueError(
                         f"S3 bucket '{bucket.name}' connection references unknown service '{conn.service}'"
                     )
@@ -744,7 +783,7 @@ class ProjectConfig:
 
         seen_cf_connection_pairs: set[tuple[str, str]] = set()
         for conn in self.cloudfront.connections:
-            if conn.service not in service_names:
+            if conn.service not in service_name_set:
                 raise ValueError(
                     "cloudfront.connections references unknown service "
                     f"'{conn.service}'"
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
@@ -12,6 +14,17 @@ from ..config.models import ProjectConfig
 
 TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "cfn"
 
+# Shared across generate_project calls so each template is read and compiled
+# once per process. The packaged templates never change at runtime, so the
+# per-render mtime check is switched off.
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    keep_trailing_newline=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
+
 
 def _pascalize(value: str) -> str:
     parts = re.split(r"[^A-Za-z0-9]+", value)
@@ -88,29 +101,19 @@ def generate_project(config: ProjectConfig, output_dir: Path) -> Path:
     output_dir = output_dir.resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    jinja_env = Environment(
-        loader=FileSystemLoader(str(TEMPLATES_DIR)),
-        keep_trailing_newline=True,
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-
     ctx = _build_context(config)
 
-    # Top-level project docs + source config
-    _render(jinja_env, "README.md.j2", output_dir / "README.md", ctx)
+    # Top-level source config
+    from ..config.loader import dump_config_to
 
-    from ..config.loader import dump_config
-
-    toml_path = output_dir / "darth-infra.toml"
-    toml_path.write_text(dump_config(config))
+    dump_config_to(config, output_dir / "darth-infra.toml")
 
     # Copy the JSON schema for editor support
     schema_src = Path(__file__).resolve().parent.parent / "darth-infra.schema.json"
     if schema_src.exists():
         schema_dest = output_dir / "darth-infra.schema.json"
         if schema_src.resolve() != schema_dest.resolve():
-            shutil.copy2(schema_src, schema_dest)
+            _copy_if_changed(schema_src, schema_dest)
 
     templates_dir = output_dir / "templates"
     generated_dir = templates_dir / "generated"
@@ -119,20 +122,28 @@ def generate_project(config: ProjectConfig, output_dir: Path) -> Path:
     services_dir.mkdir(parents=True, exist_ok=True)
     custom_dir.mkdir(parents=True, exist_ok=True)
 
-    _render(jinja_env, "root.yaml.j2", generated_dir / "root.yaml", ctx)
-
+    # Each template renders to its own file from a read-only context, so the
+    # renders run concurrently once the directories exist.
+    renders: list[tuple[str, Path, dict]] = [
+        ("README.md.j2", output_dir / "README.md", ctx),
+        ("root.yaml.j2", generated_dir / "root.yaml", ctx),
+    ]
     for svc_ctx in ctx["services_ctx"]:
-        _render(
-            jinja_env,
-            "nested/service.yaml.j2",
-            services_dir / f"{svc_ctx['name']}.yaml",
-            {**ctx, **svc_ctx},
+        renders.append(
+            (
+                "nested/service.yaml.j2",
+                services_dir / f"{svc_ctx['name']}.yaml",
+                {**ctx, **svc_ctx},
+            )
         )
 
     # Do not overwrite user-owned custom overrides template once created.
     custom_overrides = custom_dir / "overrides.yaml"
     if not custom_overrides.exists():
-        _render(jinja_env, "custom/overrides.yaml.j2", custom_overrides, ctx)
+        renders.append(("custom/overrides.yaml.j2", custom_overrides, ctx))
+
+    with ThreadPoolExecutor(max_workers=min(8, len(renders))) as pool:
+        list(pool.map(lambda job: _render(*job), renders))
 
     # Copy user data scripts for EC2 services
     for svc in config.services:
@@ -144,13 +155,29 @@ def generate_project(config: ProjectConfig, output_dir: Path) -> Path:
                 if src_script == dest_script:
                     continue
                 try:
-                    shutil.copy2(src_script, dest_script)
+                    _copy_if_changed(src_script, dest_script)
                 except shutil.SameFileError:
                     continue
 
     return output_dir
 
 
+def _copy_if_changed(src: Path, dest: Path) -> None:
+    """``shutil.copy2`` *src* unless *dest* already has its size and mtime."""
+    src_stat = src.stat()
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if (
+            dest_stat.st_size == src_stat.st_size
+            and dest_stat.st_mtime_ns == src_stat.st_mtime_ns
+        ):
+            return
+    shutil.copy2(src, dest)
+
+
 def _build_context(config: ProjectConfig) -> dict:
     services_ctx: list[dict[str, object]] = []
     alb_target_services: dict[str, dict[str, str]] = {}
@@ -439,12 +466,22 @@ def _build_context(config: ProjectConfig) -> dict:
 
 
 def _render(
-    env: Environment,
     template_name: str,
     output_path: Path,
     ctx: dict,
 ) -> None:
-    """Render a single template to a file."""
-    template = env.get_template(template_name)
-    content = template.render(**ctx)
-    output_path.write_text(content)
+    """Render a single template to a file, streaming chunks as they render.
+
+    Chunks go to a temporary file next to *output_path* that replaces it only
+    once rendering finishes, so a template error never leaves a partial file.
+    """
+    stream = _JINJA_ENV.get_template(template_name).stream(ctx)
+    stream.enable_buffering(size=16)
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            stream.dump(f)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -187,6 +187,17 @@ class DarthEcsInitApp(App[None]):
         Binding("p", "prev_step", "Prev Step", show=True),
     ]
 
+    _SCREENS = {
+        "existing-resources": ExistingResourcesScreen,
+        "services": ServicesScreen,
+        "alb": AlbScreen,
+        "rds": RdsScreen,
+        "s3": S3Screen,
+        "secrets": SecretsScreen,
+        "tags": TagsScreen,
+        "review": ReviewScreen,
+    }
+
     def __init__(
         self,
         *,
@@ -225,23 +236,14 @@ class DarthEcsInitApp(App[None]):
 
     def advance_to(self, screen_name: str) -> None:
         """Navigate to the next screen in the wizard."""
-        screens = {
-            "existing-resources": ExistingResourcesScreen,
-            "services": ServicesScreen,
-            "alb": AlbScreen,
-            "rds": RdsScreen,
-            "s3": S3Screen,
-            "secrets": SecretsScreen,
-            "tags": TagsScreen,
-            "review": ReviewScreen,
-        }
-        if screen_name in screens:
+        screen_cls = self._SCREENS.get(screen_name)
+        if screen_cls is not None:
             self._state["_wizard_last_screen"] = screen_name
             self._state["_wizard_max_step_index"] = max(
                 int(self._state.get("_wizard_max_step_index", 0)),
                 STEP_ORDER.index(screen_name),
             )
-            self.push_screen(screens[screen_name](self._state))
+            self.push_screen(screen_cls(self._state))
 
     def go_to_step(self, screen_name: str) -> None:
         """Navigate to an arbitrary step while preserving stack semantics."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import threading
 
 import boto3
@@ -232,7 +234,82 @@ class AlbScreen(Screen):
                         variant="error",
                     )
 
+    def _bind_widgets(self) -> None:
+        """Look up the routing and CloudFront widgets once, after compose."""
+        self._widgets = SimpleNamespace(
+            path_rule_list=self.query_one("#path-rule-list", ListView),
+            alb_domain=self.query_one("#alb_domain", Input),
+            default_target_service=self.query_one("#default_target_service", Select),
+            default_listener_priority=self.query_one(
+                "#default_listener_priority", Input
+            ),
+            fetch_next_priority_default=self.query_one(
+                "#fetch_next_priority_default", Button
+            ),
+            path_rule_name=self.query_one("#path_rule_name", Input),
+            path_rule_pattern=self.query_one("#path_rule_pattern", Input),
+            path_rule_target_service=self.query_one(
+                "#path_rule_target_service", Select
+            ),
+            path_rule_priority=self.query_one("#path_rule_priority", Input),
+            fetch_next_priority_rule=self.query_one(
+                "#fetch_next_priority_rule", Button
+            ),
+            cloudfront_enabled=self.query_one("#cloudfront_enabled", Switch),
+            cloudfront_origin_https_only=self.query_one(
+                "#cloudfront_origin_https_only", Switch
+            ),
+            cloudfront_custom_domain=self.query_one("#cloudfront_custom_domain", Input),
+            cloudfront_certificate_arn=self.query_one(
+                "#cloudfront_certificate_arn", Select
+            ),
+            cloudfront_fetch_certificates=self.query_one(
+                "#cloudfront_fetch_certificates", Button
+            ),
+            cloudfront_price_class=self.query_one("#cloudfront_price_class", Select),
+            cloudfront_comment=self.query_one("#cloudfront_comment", Input),
+            cloudfront_conn_list=self.query_one("#cloudfront-conn-list", ListView),
+            cloudfront_conn_service=self.query_one("#cloudfront_conn_service", Select),
+            cloudfront_conn_env_key=self.query_one("#cloudfront_conn_env_key", Input),
+            cloudfront_behavior_list=self.query_one(
+                "#cloudfront-behavior-list", ListView
+            ),
+            cloudfront_behavior_name=self.query_one("#cloudfront_behavior_name", Input),
+            cloudfront_behavior_path=self.query_one("#cloudfront_behavior_path", Input),
+            cloudfront_behavior_query_mode=self.query_one(
+                "#cloudfront_behavior_query_mode", Select
+            ),
+            cloudfront_behavior_query_allowlist=self.query_one(
+                "#cloudfront_behavior_query_allowlist", Input
+            ),
+            cloudfront_behavior_cookie_mode=self.query_one(
+                "#cloudfront_behavior_cookie_mode", Select
+            ),
+            cloudfront_behavior_cookie_allowlist=self.query_one(
+                "#cloudfront_behavior_cookie_allowlist", Input
+            ),
+            cloudfront_behavior_min_ttl=self.query_one(
+                "#cloudfront_behavior_min_ttl", Input
+            ),
+            cloudfront_behavior_default_ttl=self.query_one(
+                "#cloudfront_behavior_default_ttl", Input
+            ),
+            cloudfront_behavior_max_ttl=self.query_one(
+                "#cloudfront_behavior_max_ttl", Input
+            ),
+            cloudfront_behavior_compress=self.query_one(
+                "#cloudfront_behavior_compress", Switch
+            ),
+            cloudfront_behavior_cache_by_origin_headers=self.query_one(
+                "#cloudfront_behavior_cache_by_origin_headers", Switch
+            ),
+            cloudfront_behavior_forward_auth=self.query_one(
+                "#cloudfront_behavior_forward_auth", Switch
+            ),
+        )
+
     def on_mount(self) -> None:
+        self._bind_widgets()
         self._restore_from_draft()
         self._restore_cloudfront_certificate_options()
         self._refresh_path_rule_sidebar()
@@ -247,18 +324,18 @@ class AlbScreen(Screen):
                 self._state.get("cloudfront_price_class", "PriceClass_100"),
             )
         )
-        self.query_one("#cloudfront_price_class", Select).value = price_class
+        self._widgets.cloudfront_price_class.value = price_class
         query_mode = str(draft.get("cloudfront_behavior_query_mode", "all"))
-        self.query_one("#cloudfront_behavior_query_mode", Select).value = query_mode
+        self._widgets.cloudfront_behavior_query_mode.value = query_mode
         cookie_mode = str(draft.get("cloudfront_behavior_cookie_mode", "none"))
-        self.query_one("#cloudfront_behavior_cookie_mode", Select).value = cookie_mode
+        self._widgets.cloudfront_behavior_cookie_mode.value = cookie_mode
 
     def _restore_from_draft(self) -> None:
         draft = self._draft()
-        self.query_one("#alb_domain", Input).value = str(
+        self._widgets.alb_domain.value = str(
             draft.get("alb_domain", self._state.get("alb_domain") or "")
         )
-        self.query_one("#default_listener_priority", Input).value = str(
+        self._widgets.default_listener_priority.value = str(
             draft.get(
                 "default_listener_priority",
                 self._state.get("default_listener_priority") or "",
@@ -286,77 +363,75 @@ class AlbScreen(Screen):
             ]
 
         if draft.get("path_rule_name") is not None:
-            self.query_one("#path_rule_name", Input).value = str(
-                draft.get("path_rule_name", "")
-            )
+            self._widgets.path_rule_name.value = str(draft.get("path_rule_name", ""))
         if draft.get("path_rule_pattern") is not None:
-            self.query_one("#path_rule_pattern", Input).value = str(
+            self._widgets.path_rule_pattern.value = str(
                 draft.get("path_rule_pattern", "")
             )
         if draft.get("path_rule_priority") is not None:
-            self.query_one("#path_rule_priority", Input).value = str(
+            self._widgets.path_rule_priority.value = str(
                 draft.get("path_rule_priority", "")
             )
-        self.query_one("#cloudfront_enabled", Switch).value = bool(
+        self._widgets.cloudfront_enabled.value = bool(
             draft.get(
                 "cloudfront_enabled",
                 self._state.get("cloudfront_enabled", False),
             )
         )
-        self.query_one("#cloudfront_origin_https_only", Switch).value = bool(
+        self._widgets.cloudfront_origin_https_only.value = bool(
             draft.get(
                 "cloudfront_origin_https_only",
                 self._state.get("cloudfront_origin_https_only", False),
             )
         )
-        self.query_one("#cloudfront_custom_domain", Input).value = str(
+        self._widgets.cloudfront_custom_domain.value = str(
             draft.get(
                 "cloudfront_custom_domain",
                 self._state.get("cloudfront_custom_domain") or "",
             )
         )
-        self.query_one("#cloudfront_comment", Input).value = str(
+        self._widgets.cloudfront_comment.value = str(
             draft.get(
                 "cloudfront_comment",
                 self._state.get("cloudfront_comment") or "",
             )
         )
-        self.query_one("#cloudfront_behavior_name", Input).value = str(
+        self._widgets.cloudfront_behavior_name.value = str(
             draft.get("cloudfront_behavior_name", "")
         )
-        self.query_one("#cloudfront_behavior_path", Input).value = str(
+        self._widgets.cloudfront_behavior_path.value = str(
             draft.get("cloudfront_behavior_path", "")
         )
-        self.query_one("#cloudfront_behavior_query_allowlist", Input).value = str(
+        self._widgets.cloudfront_behavior_query_allowlist.value = str(
             draft.get("cloudfront_behavior_query_allowlist", "")
         )
-        self.query_one("#cloudfront_behavior_cookie_allowlist", Input).value = str(
+        self._widgets.cloudfront_behavior_cookie_allowlist.value = str(
             draft.get("cloudfront_behavior_cookie_allowlist", "")
         )
-        self.query_one("#cloudfront_behavior_min_ttl", Input).value = str(
+        self._widgets.cloudfront_behavior_min_ttl.value = str(
             draft.get("cloudfront_behavior_min_ttl", "")
         )
-        self.query_one("#cloudfront_behavior_default_ttl", Input).value = str(
+        self._widgets.cloudfront_behavior_default_ttl.value = str(
             draft.get("cloudfront_behavior_default_ttl", "")
         )
-        self.query_one("#cloudfront_behavior_max_ttl", Input).value = str(
+        self._widgets.cloudfront_behavior_max_ttl.value = str(
             draft.get("cloudfront_behavior_max_ttl", "")
         )
-        self.query_one("#cloudfront_behavior_compress", Switch).value = bool(
+        self._widgets.cloudfront_behavior_compress.value = bool(
             draft.get("cloudfront_behavior_compress", True)
         )
-        self.query_one(
-            "#cloudfront_behavior_cache_by_origin_headers", Switch
-        ).value = bool(draft.get("cloudfront_behavior_cache_by_origin_headers", True))
-        self.query_one("#cloudfront_behavior_forward_auth", Switch).value = bool(
+        self._widgets.cloudfront_behavior_cache_by_origin_headers.value = bool(
+            draft.get("cloudfront_behavior_cache_by_origin_headers", True)
+        )
+        self._widgets.cloudfront_behavior_forward_auth.value = bool(
             draft.get("cloudfront_behavior_forward_auth", False)
         )
-        self.query_one("#cloudfront_conn_env_key", Input).value = str(
+        self._widgets.cloudfront_conn_env_key.value = str(
             draft.get("cloudfront_conn_env_key", "")
         )
 
     def _refresh_path_rule_sidebar(self) -> None:
-        lv = self.query_one("#path-rule-list", ListView)
+        lv = self._widgets.path_rule_list
         lv.clear()
         for rule in self._path_rules:
             lv.append(
@@ -370,7 +445,7 @@ class AlbScreen(Screen):
             )
 
     def _refresh_cloudfront_connection_sidebar(self) -> None:
-        lv = self.query_one("#cloudfront-conn-list", ListView)
+        lv = self._widgets.cloudfront_conn_list
         lv.clear()
         for conn in self._cloudfront_connections:
             lv.append(
@@ -380,7 +455,7 @@ class AlbScreen(Screen):
             )
 
     def _refresh_cloudfront_behavior_sidebar(self) -> None:
-        lv = self.query_one("#cloudfront-behavior-list", ListView)
+        lv = self._widgets.cloudfront_behavior_list
         lv.clear()
         for behavior in self._cloudfront_cached_behaviors:
             lv.append(
@@ -398,7 +473,7 @@ class AlbScreen(Screen):
         all_services = [s["name"] for s in self._state.get("services", [])]
         options = [(svc, svc) for svc in services]
 
-        default_select = self.query_one("#default_target_service", Select)
+        default_select = self._widgets.default_target_service
         current_default = default_select.value
         default_select.set_options(options)
         desired_default = self._draft().get(
@@ -412,7 +487,7 @@ class AlbScreen(Screen):
         else:
             default_select.clear()
 
-        rule_select = self.query_one("#path_rule_target_service", Select)
+        rule_select = self._widgets.path_rule_target_service
         current_rule_target = rule_select.value
         rule_select.set_options(options)
         desired_target = self._draft().get("path_rule_target_service")
@@ -426,7 +501,7 @@ class AlbScreen(Screen):
         else:
             rule_select.clear()
 
-        conn_select = self.query_one("#cloudfront_conn_service", Select)
+        conn_select = self._widgets.cloudfront_conn_service
         current_conn_service = conn_select.value
         conn_select.set_options([(svc, svc) for svc in all_services])
         desired_conn_service = self._draft().get("cloudfront_conn_service")
@@ -460,14 +535,14 @@ class AlbScreen(Screen):
         self._cloudfront_cert_options = options
 
     def _selected_cloudfront_certificate_arn(self) -> str | None:
-        cert_value = self.query_one("#cloudfront_certificate_arn", Select).value
+        cert_value = self._widgets.cloudfront_certificate_arn.value
         if self._is_select_empty(cert_value):
             return None
         arn = str(cert_value).strip()
         return arn or None
 
     def _refresh_cloudfront_certificate_select(self) -> None:
-        cert_select = self.query_one("#cloudfront_certificate_arn", Select)
+        cert_select = self._widgets.cloudfront_certificate_arn
         options = list(self._cloudfront_cert_options)
         option_arns = {value for _, value in options}
         desired_cert_arn = str(
@@ -486,38 +561,28 @@ class AlbScreen(Screen):
             cert_select.clear()
 
     def _capture_draft(self) -> None:
-        default_target = self.query_one("#default_target_service", Select).value
-        path_target = self.query_one("#path_rule_target_service", Select).value
-        conn_service = self.query_one("#cloudfront_conn_service", Select).value
+        default_target = self._widgets.default_target_service.value
+        path_target = self._widgets.path_rule_target_service.value
+        conn_service = self._widgets.cloudfront_conn_service.value
         self._draft().update(
             {
-                "alb_domain": self.query_one("#alb_domain", Input).value,
+                "alb_domain": self._widgets.alb_domain.value,
                 "default_target_service": (
                     str(default_target)
                     if not self._is_select_empty(default_target)
                     else None
                 ),
-                "default_listener_priority": self.query_one(
-                    "#default_listener_priority", Input
-                ).value,
+                "default_listener_priority": self._widgets.default_listener_priority.value,
                 "alb_path_rules": [dict(v) for v in self._path_rules],
-                "path_rule_name": self.query_one("#path_rule_name", Input).value,
-                "path_rule_pattern": self.query_one("#path_rule_pattern", Input).value,
+                "path_rule_name": self._widgets.path_rule_name.value,
+                "path_rule_pattern": self._widgets.path_rule_pattern.value,
                 "path_rule_target_service": (
                     str(path_target) if not self._is_select_empty(path_target) else None
                 ),
-                "path_rule_priority": self.query_one(
-                    "#path_rule_priority", Input
-                ).value,
-                "cloudfront_enabled": self.query_one(
-                    "#cloudfront_enabled", Switch
-                ).value,
-                "cloudfront_origin_https_only": self.query_one(
-                    "#cloudfront_origin_https_only", Switch
-                ).value,
-                "cloudfront_custom_domain": self.query_one(
-                    "#cloudfront_custom_domain", Input
-                ).value,
+                "path_rule_priority": self._widgets.path_rule_priority.value,
+                "cloudfront_enabled": self._widgets.cloudfront_enabled.value,
+                "cloudfront_origin_https_only": self._widgets.cloudfront_origin_https_only.value,
+                "cloudfront_custom_domain": self._widgets.cloudfront_custom_domain.value,
                 "cloudfront_certificate_arn": (
                     self._selected_cloudfront_certificate_arn() or ""
                 ),
@@ -525,12 +590,8 @@ class AlbScreen(Screen):
                     {"label": label, "arn": arn}
                     for label, arn in self._cloudfront_cert_options
                 ],
-                "cloudfront_price_class": self.query_one(
-                    "#cloudfront_price_class", Select
-                ).value,
-                "cloudfront_comment": self.query_one(
-                    "#cloudfront_comment", Input
-                ).value,
+                "cloudfront_price_class": self._widgets.cloudfront_price_class.value,
+                "cloudfront_comment": self._widgets.cloudfront_comment.value,
                 "cloudfront_connections": [
                     dict(v) for v in self._cloudfront_connections
                 ],
@@ -542,45 +603,19 @@ class AlbScreen(Screen):
                     if not self._is_select_empty(conn_service)
                     else None
                 ),
-                "cloudfront_conn_env_key": self.query_one(
-                    "#cloudfront_conn_env_key", Input
-                ).value,
-                "cloudfront_behavior_name": self.query_one(
-                    "#cloudfront_behavior_name", Input
-                ).value,
-                "cloudfront_behavior_path": self.query_one(
-                    "#cloudfront_behavior_path", Input
-                ).value,
-                "cloudfront_behavior_query_mode": self.query_one(
-                    "#cloudfront_behavior_query_mode", Select
-                ).value,
-                "cloudfront_behavior_query_allowlist": self.query_one(
-                    "#cloudfront_behavior_query_allowlist", Input
-                ).value,
-                "cloudfront_behavior_cookie_mode": self.query_one(
-                    "#cloudfront_behavior_cookie_mode", Select
-                ).value,
-                "cloudfront_behavior_cookie_allowlist": self.query_one(
-                    "#cloudfront_behavior_cookie_allowlist", Input
-                ).value,
-                "cloudfront_behavior_min_ttl": self.query_one(
-                    "#cloudfront_behavior_min_ttl", Input
-                ).value,
-                "cloudfront_behavior_default_ttl": self.query_one(
-                    "#cloudfront_behavior_default_ttl", Input
-                ).value,
-                "cloudfront_behavior_max_ttl": self.query_one(
-                    "#cloudfront_behavior_max_ttl", Input
-                ).value,
-                "cloudfront_behavior_compress": self.query_one(
-                    "#cloudfront_behavior_compress", Switch
-                ).value,
-                "cloudfront_behavior_cache_by_origin_headers": self.query_one(
-                    "#cloudfront_behavior_cache_by_origin_headers", Switch
-                ).value,
-                "cloudfront_behavior_forward_auth": self.query_one(
-                    "#cloudfront_behavior_forward_auth", Switch
-                ).value,
+                "cloudfront_conn_env_key": self._widgets.cloudfront_conn_env_key.value,
+                "cloudfront_behavior_name": self._widgets.cloudfront_behavior_name.value,
+                "cloudfront_behavior_path": self._widgets.cloudfront_behavior_path.value,
+                "cloudfront_behavior_query_mode": self._widgets.cloudfront_behavior_query_mode.value,
+                "cloudfront_behavior_query_allowlist": self._widgets.cloudfront_behavior_query_allowlist.value,
+                "cloudfront_behavior_cookie_mode": self._widgets.cloudfront_behavior_cookie_mode.value,
+                "cloudfront_behavior_cookie_allowlist": self._widgets.cloudfront_behavior_cookie_allowlist.value,
+                "cloudfront_behavior_min_ttl": self._widgets.cloudfront_behavior_min_ttl.value,
+                "cloudfront_behavior_default_ttl": self._widgets.cloudfront_behavior_default_ttl.value,
+                "cloudfront_behavior_max_ttl": self._widgets.cloudfront_behavior_max_ttl.value,
+                "cloudfront_behavior_compress": self._widgets.cloudfront_behavior_compress.value,
+                "cloudfront_behavior_cache_by_origin_headers": self._widgets.cloudfront_behavior_cache_by_origin_headers.value,
+                "cloudfront_behavior_forward_auth": self._widgets.cloudfront_behavior_forward_auth.value,
             }
         )
 
@@ -589,40 +624,34 @@ class AlbScreen(Screen):
             return False
         self._capture_draft()
         self._state["alb_mode"] = "shared"
-        self._state["alb_domain"] = (
-            self.query_one("#alb_domain", Input).value.strip() or None
-        )
-        default_target = self.query_one("#default_target_service", Select).value
+        self._state["alb_domain"] = self._widgets.alb_domain.value.strip() or None
+        default_target = self._widgets.default_target_service.value
         self._state["default_target_service"] = (
             str(default_target).strip()
             if not self._is_select_empty(default_target)
             else None
         )
-        default_priority = self.query_one(
-            "#default_listener_priority", Input
-        ).value.strip()
+        default_priority = self._widgets.default_listener_priority.value.strip()
         self._state["default_listener_priority"] = (
             int(default_priority) if default_priority else None
         )
         self._state["alb_path_rules"] = [dict(v) for v in self._path_rules]
-        self._state["cloudfront_enabled"] = self.query_one(
-            "#cloudfront_enabled", Switch
-        ).value
-        price_value = self.query_one("#cloudfront_price_class", Select).value
+        self._state["cloudfront_enabled"] = self._widgets.cloudfront_enabled.value
+        price_value = self._widgets.cloudfront_price_class.value
         self._state["cloudfront_price_class"] = (
             str(price_value).strip()
             if not self._is_select_empty(price_value)
             else "PriceClass_100"
         )
         self._state["cloudfront_comment"] = (
-            self.query_one("#cloudfront_comment", Input).value.strip() or None
+            self._widgets.cloudfront_comment.value.strip() or None
         )
         if self._state["cloudfront_enabled"]:
-            self._state["cloudfront_origin_https_only"] = self.query_one(
-                "#cloudfront_origin_https_only", Switch
-            ).value
+            self._state["cloudfront_origin_https_only"] = (
+                self._widgets.cloudfront_origin_https_only.value
+            )
             self._state["cloudfront_custom_domain"] = (
-                self.query_one("#cloudfront_custom_domain", Input).value.strip() or None
+                self._widgets.cloudfront_custom_domain.value.strip() or None
             )
             self._state["cloudfront_certificate_arn"] = (
                 self._selected_cloudfront_certificate_arn()
@@ -646,16 +675,14 @@ class AlbScreen(Screen):
         return True
 
     def _validate_routing(self) -> bool:
-        domain = self.query_one("#alb_domain", Input).value.strip()
-        target_value = self.query_one("#default_target_service", Select).value
+        domain = self._widgets.alb_domain.value.strip()
+        target_value = self._widgets.default_target_service.value
         target = (
             str(target_value).strip()
             if not self._is_select_empty(target_value)
             else None
         )
-        default_priority_raw = self.query_one(
-            "#default_listener_priority", Input
-        ).value.strip()
+        default_priority_raw = self._widgets.default_listener_priority.value.strip()
         if domain:
             if not target:
                 self.notify(
@@ -725,18 +752,18 @@ class AlbScreen(Screen):
         return self._validate_cloudfront()
 
     def _validate_cloudfront(self) -> bool:
-        enabled = self.query_one("#cloudfront_enabled", Switch).value
+        enabled = self._widgets.cloudfront_enabled.value
         if not enabled:
             return True
 
-        domain = self.query_one("#alb_domain", Input).value.strip()
+        domain = self._widgets.alb_domain.value.strip()
         if not domain:
             self.notify(
                 "Cluster domain is required when CloudFront is enabled",
                 severity="error",
             )
             return False
-        custom_domain = self.query_one("#cloudfront_custom_domain", Input).value.strip()
+        custom_domain = self._widgets.cloudfront_custom_domain.value.strip()
         cert_arn = self._selected_cloudfront_certificate_arn() or ""
         if bool(custom_domain) != bool(cert_arn):
             self.notify(
@@ -756,9 +783,7 @@ class AlbScreen(Screen):
                 severity="information",
             )
 
-        origin_https_only = self.query_one(
-            "#cloudfront_origin_https_only", Switch
-        ).value
+        origin_https_only = self._widgets.cloudfront_origin_https_only.value
         if origin_https_only:
             mode = str(self._state.get("alb_mode", "shared")).strip() or "shared"
             if mode == "shared":
@@ -910,68 +935,60 @@ class AlbScreen(Screen):
                 return
             self._editing_path_rule_index = idx
             rule = self._path_rules[idx]
-            self.query_one("#path_rule_name", Input).value = rule.get("name", "")
-            self.query_one("#path_rule_pattern", Input).value = rule.get(
-                "path_pattern", ""
-            )
-            self.query_one("#path_rule_priority", Input).value = str(
-                rule.get("priority", "")
-            )
+            self._widgets.path_rule_name.value = rule.get("name", "")
+            self._widgets.path_rule_pattern.value = rule.get("path_pattern", "")
+            self._widgets.path_rule_priority.value = str(rule.get("priority", ""))
             target = rule.get("target_service")
             if target:
-                self.query_one("#path_rule_target_service", Select).value = target
+                self._widgets.path_rule_target_service.value = target
             return
         if event.list_view.id == "cloudfront-conn-list":
             if idx >= len(self._cloudfront_connections):
                 return
             self._editing_cloudfront_conn_index = idx
             conn = self._cloudfront_connections[idx]
-            self.query_one("#cloudfront_conn_env_key", Input).value = conn.get(
-                "env_key", ""
-            )
+            self._widgets.cloudfront_conn_env_key.value = conn.get("env_key", "")
             service = conn.get("service")
             if service:
-                self.query_one("#cloudfront_conn_service", Select).value = service
+                self._widgets.cloudfront_conn_service.value = service
             return
         if event.list_view.id == "cloudfront-behavior-list":
             if idx >= len(self._cloudfront_cached_behaviors):
                 return
             self._editing_cloudfront_behavior_index = idx
             behavior = self._cloudfront_cached_behaviors[idx]
-            self.query_one("#cloudfront_behavior_name", Input).value = behavior.get(
-                "name", ""
-            )
-            self.query_one("#cloudfront_behavior_path", Input).value = behavior.get(
+            self._widgets.cloudfront_behavior_name.value = behavior.get("name", "")
+            self._widgets.cloudfront_behavior_path.value = behavior.get(
                 "path_pattern", ""
             )
-            self.query_one(
-                "#cloudfront_behavior_query_mode", Select
-            ).value = behavior.get("query_strings", "all")
-            self.query_one(
-                "#cloudfront_behavior_query_allowlist", Input
-            ).value = ", ".join(behavior.get("query_string_allowlist", []))
-            self.query_one(
-                "#cloudfront_behavior_cookie_mode", Select
-            ).value = behavior.get("cookies", "none")
-            self.query_one(
-                "#cloudfront_behavior_cookie_allowlist", Input
-            ).value = ", ".join(behavior.get("cookie_allowlist", []))
-            self.query_one("#cloudfront_behavior_min_ttl", Input).value = str(
+            self._widgets.cloudfront_behavior_query_mode.value = behavior.get(
+                "query_strings", "all"
+            )
+            self._widgets.cloudfront_behavior_query_allowlist.value = ", ".join(
+                behavior.get("query_string_allowlist", [])
+            )
+            self._widgets.cloudfront_behavior_cookie_mode.value = behavior.get(
+                "cookies", "none"
+            )
+            self._widgets.cloudfront_behavior_cookie_allowlist.value = ", ".join(
+                behavior.get("cookie_allowlist", [])
+            )
+            self._widgets.cloudfront_behavior_min_ttl.value = str(
                 behavior.get("min_ttl_seconds", 0)
             )
-            self.query_one("#cloudfront_behavior_default_ttl", Input).value = str(
+            self._widgets.cloudfront_behavior_default_ttl.value = str(
                 behavior.get("default_ttl_seconds", 3600)
             )
-            self.query_one("#cloudfront_behavior_max_ttl", Input).value = str(
+            self._widgets.cloudfront_behavior_max_ttl.value = str(
                 behavior.get("max_ttl_seconds", 31536000)
             )
-            self.query_one("#cloudfront_behavior_compress", Switch).value = bool(
+            self._widgets.cloudfront_behavior_compress.value = bool(
                 behavior.get("compress", True)
             )
-            self.query_one(
-                "#cloudfront_behavior_cache_by_origin_headers", Switch
-            ).value = bool(behavior.get("cache_by_origin_headers", True))
-            self.query_one("#cloudfront_behavior_forward_auth", Switch).value = bool(
+            self._widgets.cloudfront_behavior_cache_by_origin_headers.value = bool(
+                behavior.get("cache_by_origin_headers", True)
+            )
+            self._widgets.cloudfront_behavior_forward_auth.value = bool(
                 behavior.get("forward_authorization_header", False)
             )
 
@@ -1015,20 +1032,20 @@ class AlbScreen(Screen):
         return self._persist_to_state()
 
     def _clear_path_rule_form(self) -> None:
-        self.query_one("#path_rule_name", Input).value = ""
-        self.query_one("#path_rule_pattern", Input).value = ""
-        self.query_one("#path_rule_priority", Input).value = ""
-        self.query_one("#path_rule_target_service", Select).clear()
+        self._widgets.path_rule_name.value = ""
+        self._widgets.path_rule_pattern.value = ""
+        self._widgets.path_rule_priority.value = ""
+        self._widgets.path_rule_target_service.clear()
         self._editing_path_rule_index = None
 
     def _add_path_rule(self) -> None:
-        name = self.query_one("#path_rule_name", Input).value.strip()
-        path_pattern = self.query_one("#path_rule_pattern", Input).value.strip()
-        target_raw = self.query_one("#path_rule_target_service", Select).value
+        name = self._widgets.path_rule_name.value.strip()
+        path_pattern = self._widgets.path_rule_pattern.value.strip()
+        target_raw = self._widgets.path_rule_target_service.value
         target = (
             str(target_raw).strip() if not self._is_select_empty(target_raw) else ""
         )
-        priority_raw = self.query_one("#path_rule_priority", Input).value.strip()
+        priority_raw = self._widgets.path_rule_priority.value.strip()
         if not name or not path_pattern or not target or not priority_raw:
             self.notify(
                 "Rule name, path pattern, target service, and priority are required",
@@ -1065,18 +1082,18 @@ class AlbScreen(Screen):
         self.notify(f"Removed path rule '{name}'", severity="information")
 
     def _clear_cloudfront_connection_form(self) -> None:
-        self.query_one("#cloudfront_conn_env_key", Input).value = ""
-        self.query_one("#cloudfront_conn_service", Select).clear()
+        self._widgets.cloudfront_conn_env_key.value = ""
+        self._widgets.cloudfront_conn_service.clear()
         self._editing_cloudfront_conn_index = None
 
     def _add_cloudfront_connection(self) -> None:
-        service_value = self.query_one("#cloudfront_conn_service", Select).value
+        service_value = self._widgets.cloudfront_conn_service.value
         service = (
             str(service_value).strip()
             if not self._is_select_empty(service_value)
             else ""
         )
-        env_key = self.query_one("#cloudfront_conn_env_key", Input).value.strip()
+        env_key = self._widgets.cloudfront_conn_env_key.value.strip()
         if not service or not env_key:
             self.notify(
                 "CloudFront connection requires service and env var key",
@@ -1108,25 +1125,23 @@ class AlbScreen(Screen):
         return [part.strip() for part in value.split(",") if part.strip()]
 
     def _clear_cloudfront_behavior_form(self) -> None:
-        self.query_one("#cloudfront_behavior_name", Input).value = ""
-        self.query_one("#cloudfront_behavior_path", Input).value = ""
-        self.query_one("#cloudfront_behavior_query_mode", Select).value = "all"
-        self.query_one("#cloudfront_behavior_query_allowlist", Input).value = ""
-        self.query_one("#cloudfront_behavior_cookie_mode", Select).value = "none"
-        self.query_one("#cloudfront_behavior_cookie_allowlist", Input).value = ""
-        self.query_one("#cloudfront_behavior_min_ttl", Input).value = ""
-        self.query_one("#cloudfront_behavior_default_ttl", Input).value = ""
-        self.query_one("#cloudfront_behavior_max_ttl", Input).value = ""
-        self.query_one("#cloudfront_behavior_compress", Switch).value = True
-        self.query_one(
-            "#cloudfront_behavior_cache_by_origin_headers", Switch
-        ).value = True
-        self.query_one("#cloudfront_behavior_forward_auth", Switch).value = False
+        self._widgets.cloudfront_behavior_name.value = ""
+        self._widgets.cloudfront_behavior_path.value = ""
+        self._widgets.cloudfront_behavior_query_mode.value = "all"
+        self._widgets.cloudfront_behavior_query_allowlist.value = ""
+        self._widgets.cloudfront_behavior_cookie_mode.value = "none"
+        self._widgets.cloudfront_behavior_cookie_allowlist.value = ""
+        self._widgets.cloudfront_behavior_min_ttl.value = ""
+        self._widgets.cloudfront_behavior_default_ttl.value = ""
+        self._widgets.cloudfront_behavior_max_ttl.value = ""
+        self._widgets.cloudfront_behavior_compress.value = True
+        self._widgets.cloudfront_behavior_cache_by_origin_headers.value = True
+        self._widgets.cloudfront_behavior_forward_auth.value = False
         self._editing_cloudfront_behavior_index = None
 
     def _add_cloudfront_behavior(self) -> None:
-        name = self.query_one("#cloudfront_behavior_name", Input).value.strip()
-        path_pattern = self.query_one("#cloudfront_behavior_path", Input).value.strip()
+        name = self._widgets.cloudfront_behavior_name.value.strip()
+        path_pattern = self._widgets.cloudfront_behavior_path.value.strip()
         if not name or not path_pattern:
             self.notify(
                 "CloudFront behavior requires name and path pattern",
@@ -1135,32 +1150,25 @@ class AlbScreen(Screen):
             return
         try:
             min_ttl = int(
-                self.query_one("#cloudfront_behavior_min_ttl", Input).value.strip()
-                or "0"
+                self._widgets.cloudfront_behavior_min_ttl.value.strip() or "0"
             )
             default_ttl = int(
-                self.query_one("#cloudfront_behavior_default_ttl", Input).value.strip()
-                or "3600"
+                self._widgets.cloudfront_behavior_default_ttl.value.strip() or "3600"
             )
             max_ttl = int(
-                self.query_one("#cloudfront_behavior_max_ttl", Input).value.strip()
-                or "31536000"
+                self._widgets.cloudfront_behavior_max_ttl.value.strip() or "31536000"
             )
         except ValueError:
             self.notify("CloudFront TTL values must be integers", severity="error")
             return
 
-        query_mode_value = self.query_one(
-            "#cloudfront_behavior_query_mode", Select
-        ).value
+        query_mode_value = self._widgets.cloudfront_behavior_query_mode.value
         query_mode = (
             str(query_mode_value)
             if not self._is_select_empty(query_mode_value)
             else "all"
         )
-        cookie_mode_value = self.query_one(
-            "#cloudfront_behavior_cookie_mode", Select
-        ).value
+        cookie_mode_value = self._widgets.cloudfront_behavior_cookie_mode.value
         cookie_mode = (
             str(cookie_mode_value)
             if not self._is_select_empty(cookie_mode_value)
@@ -1170,24 +1178,20 @@ class AlbScreen(Screen):
         behavior = {
             "name": name,
             "path_pattern": path_pattern,
-            "compress": self.query_one("#cloudfront_behavior_compress", Switch).value,
-            "cache_by_origin_headers": self.query_one(
-                "#cloudfront_behavior_cache_by_origin_headers", Switch
-            ).value,
+            "compress": self._widgets.cloudfront_behavior_compress.value,
+            "cache_by_origin_headers": self._widgets.cloudfront_behavior_cache_by_origin_headers.value,
             "min_ttl_seconds": min_ttl,
             "default_ttl_seconds": default_ttl,
             "max_ttl_seconds": max_ttl,
             "query_strings": query_mode,
             "query_string_allowlist": self._parse_csv(
-                self.query_one("#cloudfront_behavior_query_allowlist", Input).value
+                self._widgets.cloudfront_behavior_query_allowlist.value
             ),
             "cookies": cookie_mode,
             "cookie_allowlist": self._parse_csv(
-                self.query_one("#cloudfront_behavior_cookie_allowlist", Input).value
+                self._widgets.cloudfront_behavior_cookie_allowlist.value
             ),
-            "forward_authorization_header": self.query_one(
-                "#cloudfront_behavior_forward_auth", Switch
-            ).value,
+            "forward_authorization_header": self._widgets.cloudfront_behavior_forward_auth.value,
         }
         if self._editing_cloudfront_behavior_index is not None:
             self._cloudfront_cached_behaviors[
@@ -1212,7 +1216,7 @@ class AlbScreen(Screen):
         if self._cloudfront_certs_fetch_inflight:
             return
         self._cloudfront_certs_fetch_inflight = True
-        self.query_one("#cloudfront_fetch_certificates", Button).disabled = True
+        self._widgets.cloudfront_fetch_certificates.disabled = True
         self.notify(
             "Fetching ACM certificates from us-east-1...", severity="information"
         )
@@ -1252,7 +1256,7 @@ class AlbScreen(Screen):
         err: str | None,
     ) -> None:
         self._cloudfront_certs_fetch_inflight = False
-        self.query_one("#cloudfront_fetch_certificates", Button).disabled = False
+        self._widgets.cloudfront_fetch_certificates.disabled = False
         if err:
             self.notify(f"Certificate lookup failed: {err}", severity="error")
             return
@@ -1266,7 +1270,7 @@ class AlbScreen(Screen):
 
     def _used_listener_priorities(self) -> set[int]:
         used = set()
-        default_raw = self.query_one("#default_listener_priority", Input).value.strip()
+        default_raw = self._widgets.default_listener_priority.value.strip()
         if default_raw:
             try:
                 used.add(int(default_raw))
@@ -1288,8 +1292,8 @@ class AlbScreen(Screen):
             self.notify("Select a path rule first", severity="error")
             return
         self._priority_fetch_inflight = True
-        self.query_one("#fetch_next_priority_default", Button).disabled = True
-        self.query_one("#fetch_next_priority_rule", Button).disabled = True
+        self._widgets.fetch_next_priority_default.disabled = True
+        self._widgets.fetch_next_priority_rule.disabled = True
         used = self._used_listener_priorities()
         region = str(self._state.get("aws_region", "us-east-1"))
         listener_arn = str(self._state.get("shared_listener_arn") or "").strip()
@@ -1367,16 +1371,16 @@ class AlbScreen(Screen):
         self, target: str, priority: int | None, err: str | None
     ) -> None:
         self._priority_fetch_inflight = False
-        self.query_one("#fetch_next_priority_default", Button).disabled = False
-        self.query_one("#fetch_next_priority_rule", Button).disabled = False
+        self._widgets.fetch_next_priority_default.disabled = False
+        self._widgets.fetch_next_priority_rule.disabled = False
         if err:
             self.notify(f"Priority lookup failed: {err}", severity="error")
             return
         if priority is None:
             return
         if target == "default":
-            self.query_one("#default_listener_priority", Input).value = str(priority)
+            self._widgets.default_listener_priority.value = str(priority)
         else:
-            self.query_one("#path_rule_priority", Input).value = str(priority)
+            self._widgets.path_rule_priority.value = str(priority)
         self._capture_draft()
         self.notify(f"Next available priority: {priority}", severity="information")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.screen import Screen
@@ -48,13 +50,11 @@ class RdsScreen(Screen):
         return d.setdefault("rds", {})
 
     def _service_names(self) -> list[str]:
-        names: list[str] = []
-        for svc in self._state.get("services", []):
-            name = str(svc.get("name", "")).strip()
-            if not name or name in names:
-                continue
-            names.append(name)
-        return names
+        names = (
+            str(svc.get("name", "")).strip() for svc in self._state.get("services", [])
+        )
+        # dict.fromkeys drops repeats in O(n) while keeping first-seen order.
+        return list(dict.fromkeys(name for name in names if name))
 
     def compose(self) -> ComposeResult:
         draft = self._draft()
@@ -104,7 +104,19 @@ class RdsScreen(Screen):
             )
             yield SelectionList[str](id="db_expose")
 
+    def _bind_widgets(self) -> None:
+        """Look up the RDS form widgets once, after compose."""
+        self._widgets = SimpleNamespace(
+            enable_rds=self.query_one("#enable_rds", Switch),
+            db_name=self.query_one("#db_name", Input),
+            db_instance=self.query_one("#db_instance", Input),
+            db_storage=self.query_one("#db_storage", Input),
+            rds_expose_empty=self.query_one("#rds-expose-empty", Static),
+            db_expose=self.query_one("#db_expose", SelectionList),
+        )
+
     def on_mount(self) -> None:
+        self._bind_widgets()
         self._refresh_expose_services()
 
     def _refresh_expose_services(self) -> None:
@@ -117,8 +129,8 @@ class RdsScreen(Screen):
             current_expose = set(rds.get("expose_to", []))
 
         service_names = self._service_names()
-        empty = self.query_one("#rds-expose-empty", Static)
-        selection = self.query_one("#db_expose", SelectionList)
+        empty = self._widgets.rds_expose_empty
+        selection = self._widgets.db_expose
         selection.clear_options()
         if service_names:
             selection.add_options(
@@ -131,16 +143,16 @@ class RdsScreen(Screen):
             empty.display = True
 
     def _read_expose_checkboxes(self) -> list[str]:
-        selection = self.query_one("#db_expose", SelectionList)
+        selection = self._widgets.db_expose
         return [str(v) for v in selection.selected]
 
     def _capture_draft(self) -> None:
         self._draft().update(
             {
-                "enable_rds": self.query_one("#enable_rds", Switch).value,
-                "db_name": self.query_one("#db_name", Input).value,
-                "db_instance": self.query_one("#db_instance", Input).value,
-                "db_storage": self.query_one("#db_storage", Input).value,
+                "enable_rds": self._widgets.enable_rds.value,
+                "db_name": self._widgets.db_name.value,
+                "db_instance": self._widgets.db_instance.value,
+                "db_storage": self._widgets.db_storage.value,
                 "db_expose_list": self._read_expose_checkboxes(),
             }
         )
@@ -165,21 +177,20 @@ class RdsScreen(Screen):
 
     def _apply_to_state(self) -> bool:
         self._capture_draft()
-        enabled = self.query_one("#enable_rds", Switch).value
-        if enabled:
-            db_name = self.query_one("#db_name", Input).value.strip()
+        # The draft was just filled from the widgets; read the values back
+        # from it rather than going through each Input again.
+        draft = self._draft()
+        if draft["enable_rds"]:
+            db_name = draft["db_name"].strip()
             if not db_name:
                 self.notify("Database name is required", severity="error")
                 return False
 
-            expose_to = self._read_expose_checkboxes()
+            expose_to = list(draft["db_expose_list"])
             self._state["rds"] = {
                 "database_name": db_name,
-                "instance_type": self.query_one("#db_instance", Input).value.strip()
-                or "db.t4g.micro",
-                "allocated_storage_gb": int(
-                    self.query_one("#db_storage", Input).value.strip() or "20"
-                ),
+                "instance_type": draft["db_instance"].strip() or "db.t4g.micro",
+                "allocated_storage_gb": int(draft["db_storage"].strip() or "20"),
                 "expose_to": expose_to,
             }
             self._ensure_rds_managed_secrets(expose_to)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 from textual.app import ComposeResult
 from textual.containers import Vertical, VerticalScroll
 from textual.screen import Screen
@@ -28,11 +30,18 @@ from ...config.models import (
     S3BucketConnection,
     S3BucketMode,
     SecretConfig,
-    SecretSource,
     ServiceConfig,
     UlimitConfig,
 )
 
+_ALB_MODES = AlbMode._value2member_map_
+
+
+def _escape_markup(text: str) -> str:
+    """Escape every ``[`` so bracketed text like ``[CF]`` or ``[discovery]``
+    is shown literally (``textual.markup.escape`` skips uppercase tags)."""
+    return text.replace("[", "\\[")
+
 
 def build_config_from_state(state: dict) -> ProjectConfig:
     s = state
@@ -78,25 +87,10 @@ def build_config_from_state(state: dict) -> ProjectConfig:
             ec2_instance_type=svc.get("ec2_instance_type"),
             user_data_script=svc.get("user_data_script"),
             user_data_script_content=svc.get("user_data_script_content"),
-            ebs_volumes=[
-                EbsVolumeConfig(
-                    name=v["name"],
-                    size_gb=v["size_gb"],
-                    mount_path=v["mount_path"],
-                    device_name=v.get("device_name", "/dev/xvdf"),
-                    volume_type=v.get("volume_type", "gp3"),
-                    filesystem_type=v.get("filesystem_type", "ext4"),
-                )
-                for v in svc.get("ebs_volumes", [])
-            ],
-            ulimits=[
-                UlimitConfig(
-                    name=u["name"],
-                    soft_limit=u["soft_limit"],
-                    hard_limit=u["hard_limit"],
-                )
-                for u in svc.get("ulimits", [])
-            ],
+            ebs_volumes=list(
+                map(EbsVolumeConfig.from_dict, svc.get("ebs_volumes", []))
+            ),
+            ulimits=list(map(UlimitConfig.from_dict, svc.get("ulimits", []))),
             environment_variables=svc.get("environment_variables", {}),
             enable_ses_send_email=svc.get("enable_ses_send_email", False),
             enable_service_discovery=svc.get("enable_service_discovery", False),
@@ -149,19 +143,11 @@ def build_config_from_state(state: dict) -> ProjectConfig:
             )
         )
 
-    secrets = [
-        SecretConfig(
-            name=sec["name"],
-            source=SecretSource(sec.get("source", "generate")),
-            existing_secret_name=sec.get("existing_secret_name"),
-            length=sec.get("length", 50),
-            generate_once=sec.get("generate_once", True),
-        )
-        for sec in s.get("secrets", [])
-    ]
+    secrets = list(map(SecretConfig.from_dict, s.get("secrets", [])))
 
+    alb_mode = s.get("alb_mode", "shared")
     alb = AlbConfig(
-        mode=AlbMode(s.get("alb_mode", "shared")),
+        mode=_ALB_MODES.get(alb_mode) or AlbMode(alb_mode),
         shared_alb_name=s.get("shared_alb_name", ""),
         shared_listener_arn=s.get("shared_listener_arn"),
         shared_alb_security_group_id=s.get("shared_alb_security_group_id"),
@@ -288,25 +274,48 @@ class ReviewScreen(Screen):
             yield StepRail("review")
             yield Static("Review & Confirm", classes="title")
             with VerticalScroll():
-                yield Static(self._build_summary(), id="summary")
+                yield self._summary_widget()
             with Vertical(classes="button-row"):
                 yield Button("Create Project ✓", id="confirm", variant="primary")
 
-    def _build_summary(self) -> str:
+    def _summary_widget(self) -> Static:
+        if self.app.is_headless:
+            # Nobody reads a headless run (CI, recordings); skip markup parsing.
+            return Static(self._build_summary(markup=False), id="summary", markup=False)
+        return Static(self._build_summary(), id="summary")
+
+    def _build_summary(self, *, markup: bool = True) -> str:
+        """Render the summary text; with *markup*, headings are bold and every
+        other fragment is escaped so it displays exactly as in plain mode."""
         s = self._state
         resolved_service_secrets = self._resolve_service_secrets()
-        lines = [
-            f"[bold]Project:[/bold] {s['project_name']}",
-            f"[bold]Region:[/bold]  {s['aws_region']}",
-            f"[bold]VPC:[/bold]     {s['vpc_name']}",
-            f"[bold]VPC ID:[/bold]  {s.get('vpc_id') or '(auto)'}",
-            f"[bold]Envs:[/bold]    {', '.join(s['environments'])}",
-        ]
+        buf = io.StringIO()
+        if markup:
+
+            def w(text: str) -> None:
+                buf.write(_escape_markup(text))
+
+            def h(title: str) -> None:
+                buf.write(f"[bold]{_escape_markup(title)}[/bold]")
+
+        else:
+            w = h = buf.write
+        h("Project:")
+        w(f" {s['project_name']}\n")
+        h("Region:")
+        w(f"  {s['aws_region']}\n")
+        h("VPC:")
+        w(f"     {s['vpc_name']}\n")
+        h("VPC ID:")
+        w(f"  {s.get('vpc_id') or '(auto)'}\n")
+        h("Envs:")
+        w(f"    {', '.join(s['environments'])}\n")
         project_tags = s.get("project_tags", {})
         if project_tags:
-            lines.append(f"[bold]Project Tags:[/bold] {len(project_tags)}")
+            h("Project Tags:")
+            w(f" {len(project_tags)}\n")
             for key, value in sorted(project_tags.items()):
-                lines.append(f"  {key}={value}")
+                w(f"  {key}={value}\n")
 
         environment_overrides = s.get("environment_overrides", {})
         tagged_envs = [
@@ -315,82 +324,76 @@ class ReviewScreen(Screen):
             if environment_overrides.get(env_name, {}).get("tags")
         ]
         if tagged_envs:
-            lines.append("")
-            lines.append("[bold]Environment Tags:[/bold]")
+            w("\n")
+            h("Environment Tags:")
+            w("\n")
             for env_name in tagged_envs:
-                lines.append(f"  {env_name}:")
+                w(f"  {env_name}:\n")
                 for key, value in sorted(
                     environment_overrides.get(env_name, {}).get("tags", {}).items()
                 ):
-                    lines.append(f"    {key}={value}")
+                    w(f"    {key}={value}\n")
 
-        lines.extend(
-            [
-                "",
-                f"[bold]Services ({len(s['services'])}):[/bold]",
-            ]
-        )
+        w("\n")
+        h(f"Services ({len(s['services'])}):")
+        w("\n")
         for svc in s["services"]:
-            port_info = f":{svc['port']}" if svc.get("port") else " (worker)"
-            lt_info = ""
-            if svc.get("launch_type") == "ec2":
-                lt_info = f" [EC2: {svc.get('ec2_instance_type', '?')}]"
-            disc_info = " [discovery]" if svc.get("enable_service_discovery") else ""
-            image_info = f" [image: {svc['image']}]" if svc.get("image") else ""
-            lines.append(
-                f"  • {svc['name']}{port_info}{lt_info}{disc_info}{image_info}"
-            )
-            lines.append(
-                f"    CPU: {svc.get('cpu', 256)} | Memory: {svc.get('memory_mib', 512)} MiB"
+            get = svc.get
+            port_info = f":{svc['port']}" if get("port") else " (worker)"
+            lt_info = (
+                f" [EC2: {get('ec2_instance_type', '?')}]"
+                if get("launch_type") == "ec2"
+                else ""
             )
-            lines.append(
-                f"    Health check: {svc.get('health_check_path', '/health')} "
-                f"[{svc.get('health_check_http_codes', '200-399')}]"
-            )
-            lines.append(
+            disc_info = " [discovery]" if get("enable_service_discovery") else ""
+            image_info = f" [image: {svc['image']}]" if get("image") else ""
+            w(
+                f"  • {svc['name']}{port_info}{lt_info}{disc_info}{image_info}\n"
+                f"    CPU: {get('cpu', 256)} | Memory: {get('memory_mib', 512)} MiB\n"
+                f"    Health check: {get('health_check_path', '/health')} "
+                f"[{get('health_check_http_codes', '200-399')}]\n"
                 "    Health timing: "
-                f"timeout={svc.get('health_check_timeout_seconds', 5)}s "
-                f"interval={svc.get('health_check_interval_seconds', 30)}s "
-                f"healthy={svc.get('healthy_threshold_count', 5)} "
-                f"unhealthy={svc.get('unhealthy_threshold_count', 2)} "
-                f"grace={svc.get('health_check_grace_period_seconds') or 0}s"
+                f"timeout={get('health_check_timeout_seconds', 5)}s "
+                f"interval={get('health_check_interval_seconds', 30)}s "
+                f"healthy={get('healthy_threshold_count', 5)} "
+                f"unhealthy={get('unhealthy_threshold_count', 2)} "
+                f"grace={get('health_check_grace_period_seconds') or 0}s\n"
             )
-            if svc.get("user_data_script"):
-                lines.append(f"    User data: {svc['user_data_script']}")
-            if svc.get("user_data_script_content"):
+            if get("user_data_script"):
+                w(f"    User data: {svc['user_data_script']}\n")
+            if get("user_data_script_content"):
                 line_count = len(str(svc["user_data_script_content"]).splitlines())
-                lines.append(f"    User data inline script: {line_count} lines")
-            if svc.get("ebs_volumes"):
-                for vol in svc["ebs_volumes"]:
-                    lines.append(
-                        f"    EBS: {vol['name']} "
-                        f"({vol['size_gb']}G → {vol['mount_path']}, "
-                        f"{vol.get('filesystem_type', 'ext4')})"
-                    )
-            if svc.get("ulimits"):
-                for ul in svc["ulimits"]:
-                    lines.append(
-                        f"    Ulimit: {ul['name']} "
-                        f"(soft={ul['soft_limit']}, hard={ul['hard_limit']})"
-                    )
-            if svc.get("environment_variables"):
-                for k, v in svc["environment_variables"].items():
-                    lines.append(f"    Env: {k}={v}")
+                w(f"    User data inline script: {line_count} lines\n")
+            for vol in get("ebs_volumes") or ():
+                w(
+                    f"    EBS: {vol['name']} "
+                    f"({vol['size_gb']}G → {vol['mount_path']}, "
+                    f"{vol.get('filesystem_type', 'ext4')})\n"
+                )
+            for ul in get("ulimits") or ():
+                w(
+                    f"    Ulimit: {ul['name']} "
+                    f"(soft={ul['soft_limit']}, hard={ul['hard_limit']})\n"
+                )
+            for k, v in (get("environment_variables") or {}).items():
+                w(f"    Env: {k}={v}\n")
             service_secrets = resolved_service_secrets.get(svc["name"], [])
             if service_secrets:
-                lines.append(f"    Service secrets: {', '.join(service_secrets)}")
+                w(f"    Service secrets: {', '.join(service_secrets)}\n")
 
         if s.get("rds"):
             rds = s["rds"]
-            lines.append("")
-            lines.append(
-                f"[bold]RDS:[/bold] {rds['database_name']} ({rds['instance_type']})"
+            w("\n")
+            h("RDS:")
+            w(
+                f" {rds['database_name']} ({rds['instance_type']})\n"
+                f"  Exposed to: {', '.join(rds['expose_to'])}\n"
             )
-            lines.append(f"  Exposed to: {', '.join(rds['expose_to'])}")
 
         if s.get("s3_buckets"):
-            lines.append("")
-            lines.append(f"[bold]S3 Buckets ({len(s['s3_buckets'])}):[/bold]")
+            w("\n")
+            h(f"S3 Buckets ({len(s['s3_buckets'])}):")
+            w("\n")
             for b in s["s3_buckets"]:
                 flags = []
                 if b.get("cloudfront"):
@@ -401,21 +404,21 @@ class ReviewScreen(Screen):
                     flags.append("public")
                 flag_str = f" [{', '.join(flags)}]" if flags else ""
                 mode = b.get("mode", "managed")
-                lines.append(f"  • {b['name']} ({mode}){flag_str}")
+                w(f"  • {b['name']} ({mode}){flag_str}\n")
                 if mode == "existing":
-                    lines.append(
-                        f"      existing: {b.get('existing_bucket_name') or '(missing)'}"
+                    w(
+                        "      existing: "
+                        f"{b.get('existing_bucket_name') or '(missing)'}\n"
                     )
                 if mode == "seed-copy":
-                    lines.append(
-                        f"      seed source: {b.get('seed_source_bucket_name') or '(missing)'}"
-                    )
-                    lines.append(
+                    w(
+                        "      seed source: "
+                        f"{b.get('seed_source_bucket_name') or '(missing)'}\n"
                         "      seed scope: "
                         + (
-                            "non-prod only"
+                            "non-prod only\n"
                             if b.get("seed_non_prod_only", True)
-                            else "all environments"
+                            else "all environments\n"
                         )
                     )
                 for conn in b.get("connections", []):
@@ -427,69 +430,68 @@ class ReviewScreen(Screen):
                         )
                     else:
                         service_label = str(conn.get("service", "")).strip()
-                    lines.append(
-                        f"      → {service_label} as {conn['env_key']} [{access}]"
-                    )
+                    w(f"      → {service_label} as {conn['env_key']} [{access}]\n")
                     if conn.get("cloudfront_env_key"):
-                        lines.append(f"        CF URL → {conn['cloudfront_env_key']}")
-
-        lines.append("")
-        lines.append(f"[bold]ALB:[/bold] {s.get('alb_mode', 'shared')}")
-        lines.append(f"  Cluster domain: {s.get('alb_domain') or '(none)'}")
-        lines.append(f"  Default target: {s.get('default_target_service') or '(none)'}")
-        lines.append(
-            f"  Default priority: {s.get('default_listener_priority') or '(none)'}"
+                        w(f"        CF URL → {conn['cloudfront_env_key']}\n")
+
+        alb_mode = s.get("alb_mode", "shared")
+        w("\n")
+        h("ALB:")
+        w(
+            f" {alb_mode}\n"
+            f"  Cluster domain: {s.get('alb_domain') or '(none)'}\n"
+            f"  Default target: {s.get('default_target_service') or '(none)'}\n"
+            f"  Default priority: {s.get('default_listener_priority') or '(none)'}\n"
         )
         if s.get("alb_path_rules"):
-            lines.append("  Path rules:")
+            w("  Path rules:\n")
             for rule in s.get("alb_path_rules", []):
-                lines.append(
+                w(
                     f"    - {rule.get('name')}: {rule.get('path_pattern')} -> "
-                    f"{rule.get('target_service')} ({rule.get('priority')})"
+                    f"{rule.get('target_service')} ({rule.get('priority')})\n"
                 )
-        if s.get("alb_mode", "shared") == "shared":
-            lines.append(f"  Name: {s.get('shared_alb_name') or '(auto)'}")
-            lines.append(f"  Listener: {s.get('shared_listener_arn') or '(auto)'}")
-            lines.append(
-                f"  ALB SG: {s.get('shared_alb_security_group_id') or '(auto)'}"
+        if alb_mode == "shared":
+            w(
+                f"  Name: {s.get('shared_alb_name') or '(auto)'}\n"
+                f"  Listener: {s.get('shared_listener_arn') or '(auto)'}\n"
+                f"  ALB SG: {s.get('shared_alb_security_group_id') or '(auto)'}\n"
             )
 
-        lines.append("")
         cf_enabled = bool(s.get("cloudfront_enabled", False))
-        lines.append(
-            f"[bold]CloudFront:[/bold] {'enabled' if cf_enabled else 'disabled'}"
-        )
+        w("\n")
+        h("CloudFront:")
+        w(f" {'enabled' if cf_enabled else 'disabled'}\n")
         if cf_enabled:
-            lines.append(
-                "  ALB origin protocol: "
-                f"{'https-only' if s.get('cloudfront_origin_https_only', False) else 'http-only'}"
-            )
-            lines.append(
-                f"  Custom domain: {s.get('cloudfront_custom_domain') or '(none)'}"
-            )
-            lines.append(
-                f"  Certificate ARN: {s.get('cloudfront_certificate_arn') or '(none)'}"
-            )
-            lines.append(
-                f"  Price class: {s.get('cloudfront_price_class', 'PriceClass_100')}"
-            )
-            lines.append(f"  Comment: {s.get('cloudfront_comment') or '(none)'}")
-            lines.append(
-                f"  Service connections: {len(s.get('cloudfront_connections', []))}"
+            origin_protocol = (
+                "https-only"
+                if s.get("cloudfront_origin_https_only", False)
+                else "http-only"
             )
-            lines.append(
-                f"  Cached behaviors: {len(s.get('cloudfront_cached_behaviors', []))}"
+            w(
+                f"  ALB origin protocol: {origin_protocol}\n"
+                f"  Custom domain: {s.get('cloudfront_custom_domain') or '(none)'}\n"
+                "  Certificate ARN: "
+                f"{s.get('cloudfront_certificate_arn') or '(none)'}\n"
+                "  Price class: "
+                f"{s.get('cloudfront_price_class', 'PriceClass_100')}\n"
+                f"  Comment: {s.get('cloudfront_comment') or '(none)'}\n"
+                "  Service connections: "
+                f"{len(s.get('cloudfront_connections', []))}\n"
+                "  Cached behaviors: "
+                f"{len(s.get('cloudfront_cached_behaviors', []))}\n"
             )
 
         if s.get("secrets"):
-            lines.append("")
-            lines.append(f"[bold]Secrets ({len(s['secrets'])}):[/bold]")
+            w("\n")
+            h(f"Secrets ({len(s['secrets'])}):")
+            w("\n")
             for sec in s["secrets"]:
                 expose = sec.get("expose_to", [])
                 expose_suffix = f" -> {', '.join(expose)}" if expose else ""
-                lines.append(f"  • {sec['name']} ({sec['source']}){expose_suffix}")
+                w(f"  • {sec['name']} ({sec['source']}){expose_suffix}\n")
 
-        return "\n".join(lines)
+        # Every line above is newline-terminated; drop the final one.
+        return buf.getvalue()[:-1]
 
     def _resolve_service_secrets(self) -> dict[str, list[str]]:
         """Resolve per-service secret attachments from both screens."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
@@ -157,6 +159,7 @@ class S3Screen(Screen):
                     yield Button("Remove", id="remove", variant="error")
 
     def on_mount(self) -> None:
+        self._bind_widgets()
         draft = self._draft()
         self._connections = self._normalize_connections(draft.get("connections", []))
         self._editing_conn_index = draft.get("editing_conn_index")
@@ -168,32 +171,58 @@ class S3Screen(Screen):
         self._toggle_cf_fields()
         self._update_conn_mode()
 
+    def _bind_widgets(self) -> None:
+        """Look up the bucket and connection form widgets once, after compose."""
+        self._widgets = SimpleNamespace(
+            item_list=self.query_one("#item-list", ListView),
+            bucket_name=self.query_one("#bucket_name", Input),
+            bucket_mode=self.query_one("#bucket_mode", Select),
+            existing_bucket_name_label=self.query_one(
+                "#existing_bucket_name_label", Label
+            ),
+            existing_bucket_name=self.query_one("#existing_bucket_name", Input),
+            seed_source_bucket_name_label=self.query_one(
+                "#seed_source_bucket_name_label", Label
+            ),
+            seed_source_bucket_name=self.query_one("#seed_source_bucket_name", Input),
+            seed_non_prod_only_label=self.query_one("#seed_non_prod_only_label", Label),
+            seed_non_prod_only=self.query_one("#seed_non_prod_only", Switch),
+            bucket_cf=self.query_one("#bucket_cf", Switch),
+            bucket_cors=self.query_one("#bucket_cors", Switch),
+            bucket_public=self.query_one("#bucket_public", Switch),
+            conn_list=self.query_one("#conn-list", ListView),
+            conn_services_empty=self.query_one("#conn-services-empty", Static),
+            conn_services=self.query_one("#conn_services", SelectionList),
+            conn_env_key=self.query_one("#conn_env_key", Input),
+            conn_cf_label=self.query_one("#conn_cf_label", Label),
+            conn_cloudfront_env_key=self.query_one("#conn_cloudfront_env_key", Input),
+            conn_read_only=self.query_one("#conn_read_only", Switch),
+            conn_add=self.query_one("#conn_add", Button),
+            conn_save=self.query_one("#conn_save", Button),
+            conn_remove=self.query_one("#conn_remove", Button),
+            add=self.query_one("#add", Button),
+            save=self.query_one("#save", Button),
+            remove=self.query_one("#remove", Button),
+        )
+
     def _capture_draft(self) -> None:
         self._draft().update(
             {
-                "bucket_name": self.query_one("#bucket_name", Input).value,
+                "bucket_name": self._widgets.bucket_name.value,
                 "bucket_mode": self._bucket_mode(),
-                "existing_bucket_name": self.query_one(
-                    "#existing_bucket_name", Input
-                ).value,
-                "seed_source_bucket_name": self.query_one(
-                    "#seed_source_bucket_name", Input
-                ).value,
-                "seed_non_prod_only": self.query_one(
-                    "#seed_non_prod_only", Switch
-                ).value,
-                "bucket_cf": self.query_one("#bucket_cf", Switch).value,
-                "bucket_cors": self.query_one("#bucket_cors", Switch).value,
-                "bucket_public": self.query_one("#bucket_public", Switch).value,
+                "existing_bucket_name": self._widgets.existing_bucket_name.value,
+                "seed_source_bucket_name": self._widgets.seed_source_bucket_name.value,
+                "seed_non_prod_only": self._widgets.seed_non_prod_only.value,
+                "bucket_cf": self._widgets.bucket_cf.value,
+                "bucket_cors": self._widgets.bucket_cors.value,
+                "bucket_public": self._widgets.bucket_public.value,
                 "connections": [dict(conn) for conn in self._connections],
                 "editing_bucket_index": self._editing_index,
                 "editing_conn_index": self._editing_conn_index,
                 "conn_services": self._read_selected_conn_services(),
-                "conn_env_key": self.query_one("#conn_env_key", Input).value,
-                "conn_cloudfront_env_key": self.query_one(
-                    "#conn_cloudfront_env_key", Input
-                ).value,
-                "conn_read_only": self.query_one("#conn_read_only", Switch).value,
+                "conn_env_key": self._widgets.conn_env_key.value,
+                "conn_cloudfront_env_key": self._widgets.conn_cloudfront_env_key.value,
+                "conn_read_only": self._widgets.conn_read_only.value,
             }
         )
 
@@ -204,7 +233,7 @@ class S3Screen(Screen):
 
     def _maybe_autofill_env_key(self, bucket_name: str) -> None:
         """Auto-fill conn_env_key with a default when bucket name changes."""
-        env_key_input = self.query_one("#conn_env_key", Input)
+        env_key_input = self._widgets.conn_env_key
         default = f"S3_BUCKET_{bucket_name.upper().replace('-', '_')}"
         current = env_key_input.value
         if not current or current.startswith("S3_BUCKET_"):
@@ -222,7 +251,7 @@ class S3Screen(Screen):
             self._toggle_cf_fields()
 
     def _bucket_mode(self) -> str:
-        mode = self.query_one("#bucket_mode", Select).value
+        mode = self._widgets.bucket_mode.value
         blank = getattr(Select, "BLANK", object())
         null = getattr(Select, "NULL", object())
         if mode in {blank, null, None}:
@@ -239,26 +268,26 @@ class S3Screen(Screen):
         mode = self._bucket_mode()
         is_existing = mode == "existing"
         is_seed_copy = mode == "seed-copy"
-        self.query_one("#existing_bucket_name_label", Label).display = is_existing
-        self.query_one("#existing_bucket_name", Input).display = is_existing
-        self.query_one("#seed_source_bucket_name_label", Label).display = is_seed_copy
-        self.query_one("#seed_source_bucket_name", Input).display = is_seed_copy
-        self.query_one("#seed_non_prod_only_label", Label).display = is_seed_copy
-        self.query_one("#seed_non_prod_only", Switch).display = is_seed_copy
-
-        cloudfront_switch = self.query_one("#bucket_cf", Switch)
+        self._widgets.existing_bucket_name_label.display = is_existing
+        self._widgets.existing_bucket_name.display = is_existing
+        self._widgets.seed_source_bucket_name_label.display = is_seed_copy
+        self._widgets.seed_source_bucket_name.display = is_seed_copy
+        self._widgets.seed_non_prod_only_label.display = is_seed_copy
+        self._widgets.seed_non_prod_only.display = is_seed_copy
+
+        cloudfront_switch = self._widgets.bucket_cf
         if is_existing and cloudfront_switch.value:
             cloudfront_switch.value = False
 
     def _toggle_cf_fields(self) -> None:
         """Show/hide CloudFront URL input based on bucket_cf switch value."""
         if self._bucket_mode() == "existing":
-            self.query_one("#conn_cf_label", Label).display = False
-            self.query_one("#conn_cloudfront_env_key", Input).display = False
+            self._widgets.conn_cf_label.display = False
+            self._widgets.conn_cloudfront_env_key.display = False
             return
-        cf_enabled = self.query_one("#bucket_cf", Switch).value
-        self.query_one("#conn_cf_label", Label).display = cf_enabled
-        self.query_one("#conn_cloudfront_env_key", Input).display = cf_enabled
+        cf_enabled = self._widgets.bucket_cf.value
+        self._widgets.conn_cf_label.display = cf_enabled
+        self._widgets.conn_cloudfront_env_key.display = cf_enabled
 
     def _refresh_conn_service_options(self) -> None:
         """Populate the service multi-select from state services."""
@@ -268,8 +297,8 @@ class S3Screen(Screen):
 
     def _set_conn_service_options(self, selected_services: set[str]) -> None:
         service_names = self._service_names()
-        empty = self.query_one("#conn-services-empty", Static)
-        selection = self.query_one("#conn_services", SelectionList)
+        empty = self._widgets.conn_services_empty
+        selection = self._widgets.conn_services
         selection.clear_options()
         if service_names:
             selection.add_options(
@@ -291,19 +320,37 @@ class S3Screen(Screen):
         return names
 
     def _read_selected_conn_services(self) -> list[str]:
-        selection = self.query_one("#conn_services", SelectionList)
+        selection = self._widgets.conn_services
         return [str(v) for v in selection.selected]
 
     def _refresh_sidebar(self) -> None:
         """Rebuild the sidebar list from current state."""
-        lv = self.query_one("#item-list", ListView)
+        lv = self._widgets.item_list
         lv.clear()
         for bucket in self._state.get("s3_buckets", []):
             lv.append(ListItem(Static(bucket["name"])))
 
+    def _sidebar_append(self, bucket: dict) -> None:
+        """Add a sidebar row for a newly added bucket."""
+        lv = self._widgets.item_list
+        lv.append(ListItem(Static(bucket["name"])))
+        lv.index = None
+
+    def _sidebar_replace(self, idx: int, bucket: dict) -> None:
+        """Relabel the sidebar row of an edited bucket in place."""
+        lv = self._widgets.item_list
+        lv.children[idx].query_one(Static).update(bucket["name"])
+        lv.index = None
+
+    def _sidebar_remove(self, idx: int) -> None:
+        """Drop the sidebar row of a removed bucket."""
+        lv = self._widgets.item_list
+        lv.index = None
+        lv.remove_items([idx])
+
     def _refresh_conn_list(self) -> None:
         """Rebuild the connection list from self._connections."""
-        lv = self.query_one("#conn-list", ListView)
+        lv = self._widgets.conn_list
         lv.clear()
         for conn in self._connections:
             access = "R" if conn.get("read_only") else "R/W"
@@ -361,16 +408,16 @@ class S3Screen(Screen):
     def _update_mode(self) -> None:
         """Toggle button visibility based on add vs edit mode."""
         editing = self._editing_index is not None
-        self.query_one("#add", Button).display = not editing
-        self.query_one("#save", Button).display = editing
-        self.query_one("#remove", Button).display = editing
+        self._widgets.add.display = not editing
+        self._widgets.save.display = editing
+        self._widgets.remove.display = editing
 
     def _update_conn_mode(self) -> None:
         """Toggle connection button visibility based on add vs edit mode."""
         editing = self._editing_conn_index is not None
-        self.query_one("#conn_add", Button).display = not editing
-        self.query_one("#conn_save", Button).display = editing
-        self.query_one("#conn_remove", Button).display = editing
+        self._widgets.conn_add.display = not editing
+        self._widgets.conn_save.display = editing
+        self._widgets.conn_remove.display = editing
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Route selection by list view id."""
@@ -385,25 +432,21 @@ class S3Screen(Screen):
         if idx is not None and idx < len(buckets):
             self._editing_index = idx
             bucket = buckets[idx]
-            self.query_one("#bucket_name", Input).value = str(
-                bucket.get("name", "") or ""
-            )
+            self._widgets.bucket_name.value = str(bucket.get("name", "") or "")
             bucket_mode = str(bucket.get("mode", "managed") or "managed")
-            self.query_one("#bucket_mode", Select).value = bucket_mode
-            self.query_one("#existing_bucket_name", Input).value = str(
+            self._widgets.bucket_mode.value = bucket_mode
+            self._widgets.existing_bucket_name.value = str(
                 bucket.get("existing_bucket_name") or ""
             )
-            self.query_one("#seed_source_bucket_name", Input).value = str(
+            self._widgets.seed_source_bucket_name.value = str(
                 bucket.get("seed_source_bucket_name") or ""
             )
-            self.query_one("#seed_non_prod_only", Switch).value = bucket.get(
+            self._widgets.seed_non_prod_only.value = bucket.get(
                 "seed_non_prod_only", True
             )
-            self.query_one("#bucket_cf", Switch).value = bucket.get("cloudfront", False)
-            self.query_one("#bucket_cors", Switch).value = bucket.get("cors", False)
-            self.query_one("#bucket_public", Switch).value = bucket.get(
-                "public_read", False
-            )
+            self._widgets.bucket_cf.value = bucket.get("cloudfront", False)
+            self._widgets.bucket_cors.value = bucket.get("cors", False)
+            self._widgets.bucket_public.value = bucket.get("public_read", False)
             self._connections = self._normalize_connections(
                 bucket.get("connections", [])
             )
@@ -425,13 +468,11 @@ class S3Screen(Screen):
                 if str(service).strip()
             }
             self._set_conn_service_options(selected)
-            self.query_one("#conn_env_key", Input).value = conn.get("env_key", "")
-            self.query_one("#conn_cloudfront_env_key", Input).value = (
+            self._widgets.conn_env_key.value = conn.get("env_key", "")
+            self._widgets.conn_cloudfront_env_key.value = (
                 conn.get("cloudfront_env_key") or ""
             )
-            self.query_one("#conn_read_only", Switch).value = conn.get(
-                "read_only", False
-            )
+            self._widgets.conn_read_only.value = conn.get("read_only", False)
             self._update_conn_mode()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -468,7 +509,7 @@ class S3Screen(Screen):
     def _persist_for_navigation(self) -> None:
         self._flush_active_connection_edit()
         self._capture_draft()
-        name = self.query_one("#bucket_name", Input).value.strip()
+        name = self._widgets.bucket_name.value.strip()
         if name and self._editing_index is not None:
             self._save_bucket()
             return
@@ -494,19 +535,15 @@ class S3Screen(Screen):
 
     def _read_form(self) -> dict | None:
         """Read and validate the bucket form fields."""
-        name = self.query_one("#bucket_name", Input).value.strip()
+        name = self._widgets.bucket_name.value.strip()
         if not name:
             self.notify("Bucket name is required", severity="error")
             return None
 
         mode = self._bucket_mode()
-        existing_bucket_name = self.query_one(
-            "#existing_bucket_name", Input
-        ).value.strip()
-        seed_source_bucket_name = self.query_one(
-            "#seed_source_bucket_name", Input
-        ).value.strip()
-        seed_non_prod_only = self.query_one("#seed_non_prod_only", Switch).value
+        existing_bucket_name = self._widgets.existing_bucket_name.value.strip()
+        seed_source_bucket_name = self._widgets.seed_source_bucket_name.value.strip()
+        seed_non_prod_only = self._widgets.seed_non_prod_only.value
 
         if mode == "existing" and not existing_bucket_name:
             self.notify(
@@ -527,9 +564,9 @@ class S3Screen(Screen):
             "existing_bucket_name": existing_bucket_name or None,
             "seed_source_bucket_name": seed_source_bucket_name or None,
             "seed_non_prod_only": seed_non_prod_only,
-            "cloudfront": self.query_one("#bucket_cf", Switch).value,
-            "cors": self.query_one("#bucket_cors", Switch).value,
-            "public_read": self.query_one("#bucket_public", Switch).value,
+            "cloudfront": self._widgets.bucket_cf.value,
+            "cors": self._widgets.bucket_cors.value,
+            "public_read": self._widgets.bucket_public.value,
             "connections": [dict(conn) for conn in self._connections],
         }
 
@@ -540,18 +577,18 @@ class S3Screen(Screen):
             self.notify("Select at least one service", severity="error")
             return None
 
-        env_key = self.query_one("#conn_env_key", Input).value.strip()
+        env_key = self._widgets.conn_env_key.value.strip()
         if not env_key:
             self.notify("Env var name is required", severity="error")
             return None
 
-        cf_enabled = self.query_one("#bucket_cf", Switch).value
+        cf_enabled = self._widgets.bucket_cf.value
         cloudfront_env_key: str | None = None
         if cf_enabled:
-            cf_val = self.query_one("#conn_cloudfront_env_key", Input).value.strip()
+            cf_val = self._widgets.conn_cloudfront_env_key.value.strip()
             cloudfront_env_key = cf_val if cf_val else None
 
-        read_only = self.query_one("#conn_read_only", Switch).value
+        read_only = self._widgets.conn_read_only.value
 
         return {
             "services": services,
@@ -653,9 +690,9 @@ class S3Screen(Screen):
         """Reset connection form to add mode."""
         self._editing_conn_index = None
         self._set_conn_service_options(set())
-        self.query_one("#conn_env_key", Input).value = ""
-        self.query_one("#conn_cloudfront_env_key", Input).value = ""
-        self.query_one("#conn_read_only", Switch).value = False
+        self._widgets.conn_env_key.value = ""
+        self._widgets.conn_cloudfront_env_key.value = ""
+        self._widgets.conn_read_only.value = False
         self._update_conn_mode()
 
     def _add_bucket(self) -> None:
@@ -664,7 +701,7 @@ class S3Screen(Screen):
             return
         self._state.setdefault("s3_buckets", []).append(bucket)
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_append(bucket)
         self.notify(f"Added bucket '{bucket['name']}'")
 
     def _save_bucket(self) -> None:
@@ -673,18 +710,20 @@ class S3Screen(Screen):
         bucket = self._read_form()
         if bucket is None:
             return
-        self._state["s3_buckets"][self._editing_index] = bucket
+        idx = self._editing_index
+        self._state["s3_buckets"][idx] = bucket
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_replace(idx, bucket)
         self.notify(f"Updated bucket '{bucket['name']}'")
 
     def _remove_bucket(self) -> None:
         if self._editing_index is None:
             return
-        name = self._state["s3_buckets"][self._editing_index]["name"]
-        del self._state["s3_buckets"][self._editing_index]
+        idx = self._editing_index
+        name = self._state["s3_buckets"][idx]["name"]
+        del self._state["s3_buckets"][idx]
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_remove(idx)
         self.notify(f"Removed bucket '{name}'")
 
     def _clear_form(self) -> None:
@@ -692,14 +731,14 @@ class S3Screen(Screen):
         self._editing_index = None
         self._connections = []
         self._editing_conn_index = None
-        self.query_one("#bucket_name", Input).value = ""
-        self.query_one("#bucket_mode", Select).value = "managed"
-        self.query_one("#existing_bucket_name", Input).value = ""
-        self.query_one("#seed_source_bucket_name", Input).value = ""
-        self.query_one("#seed_non_prod_only", Switch).value = True
-        self.query_one("#bucket_cf", Switch).value = False
-        self.query_one("#bucket_cors", Switch).value = False
-        self.query_one("#bucket_public", Switch).value = False
+        self._widgets.bucket_name.value = ""
+        self._widgets.bucket_mode.value = "managed"
+        self._widgets.existing_bucket_name.value = ""
+        self._widgets.seed_source_bucket_name.value = ""
+        self._widgets.seed_non_prod_only.value = True
+        self._widgets.bucket_cf.value = False
+        self._widgets.bucket_cors.value = False
+        self._widgets.bucket_public.value = False
         self._refresh_conn_list()
         self._clear_conn_form()
         self._update_mode()
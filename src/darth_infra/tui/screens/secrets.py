@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from types import SimpleNamespace
 
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
@@ -152,7 +153,34 @@ class SecretsScreen(Screen):
                     yield Button("Update", id="save", variant="success")
                     yield Button("Remove", id="remove", variant="error")
 
+    def _bind_widgets(self) -> None:
+        """Look up the secret form and sidebar widgets once, after compose."""
+        self._widgets = SimpleNamespace(
+            item_list=self.query_one("#item-list", ListView),
+            sec_name=self.query_one("#sec_name", Input),
+            sec_source=self.query_one("#sec_source", RadioSet),
+            src_gen=self.query_one("#src_gen", RadioButton),
+            src_env=self.query_one("#src_env", RadioButton),
+            src_rds=self.query_one("#src_rds", RadioButton),
+            src_existing=self.query_one("#src_existing", RadioButton),
+            sec_existing_label=self.query_one("#sec_existing_label", Label),
+            sec_existing_name=self.query_one("#sec_existing_name", Input),
+            sec_existing_filter_label=self.query_one(
+                "#sec_existing_filter_label", Label
+            ),
+            sec_existing_filter=self.query_one("#sec_existing_filter", Input),
+            fetch_existing_secrets=self.query_one("#fetch_existing_secrets", Button),
+            sec_existing_list=self.query_one("#sec_existing_list", ListView),
+            sec_length=self.query_one("#sec_length", Input),
+            sec_expose_empty=self.query_one("#sec-expose-empty", Static),
+            sec_expose_services=self.query_one("#sec-expose-services", SelectionList),
+            add=self.query_one("#add", Button),
+            save=self.query_one("#save", Button),
+            remove=self.query_one("#remove", Button),
+        )
+
     def on_mount(self) -> None:
+        self._bind_widgets()
         self._restore_from_draft()
         self._refresh_expose_services()
         self._refresh_sidebar()
@@ -169,7 +197,7 @@ class SecretsScreen(Screen):
 
     def _capture_draft(self) -> None:
         self._expose_to = self._read_expose_checkboxes()
-        radio_set = self.query_one("#sec_source", RadioSet)
+        radio_set = self._widgets.sec_source
         pressed = radio_set.pressed_button
         source = "generate"
         if pressed and pressed.id == "src_env":
@@ -181,14 +209,12 @@ class SecretsScreen(Screen):
 
         self._draft().update(
             {
-                "sec_name": self.query_one("#sec_name", Input).value,
+                "sec_name": self._widgets.sec_name.value,
                 "sec_source": source,
-                "sec_existing_name": self.query_one("#sec_existing_name", Input).value,
-                "sec_existing_filter": self.query_one(
-                    "#sec_existing_filter", Input
-                ).value,
+                "sec_existing_name": self._widgets.sec_existing_name.value,
+                "sec_existing_filter": self._widgets.sec_existing_filter.value,
                 "sec_existing_selected_id": self._selected_existing_secret_id,
-                "sec_length": self.query_one("#sec_length", Input).value,
+                "sec_length": self._widgets.sec_length.value,
                 "sec_expose_to": list(self._expose_to),
             }
         )
@@ -208,28 +234,28 @@ class SecretsScreen(Screen):
         is_existing = source == "existing"
         is_rds = source == "rds"
 
-        self.query_one("#sec_length", Input).disabled = not is_generated
-        self.query_one("#sec_existing_label", Label).display = is_existing or is_rds
-        self.query_one("#sec_existing_name", Input).display = is_existing or is_rds
-        self.query_one("#sec_existing_filter_label", Label).display = is_existing
-        self.query_one("#sec_existing_filter", Input).display = is_existing
-        self.query_one("#fetch_existing_secrets", Button).display = is_existing
-        self.query_one("#sec_existing_list", ListView).display = is_existing
-        self.query_one("#sec_existing_name", Input).disabled = is_rds
+        self._widgets.sec_length.disabled = not is_generated
+        self._widgets.sec_existing_label.display = is_existing or is_rds
+        self._widgets.sec_existing_name.display = is_existing or is_rds
+        self._widgets.sec_existing_filter_label.display = is_existing
+        self._widgets.sec_existing_filter.display = is_existing
+        self._widgets.fetch_existing_secrets.display = is_existing
+        self._widgets.sec_existing_list.display = is_existing
+        self._widgets.sec_existing_name.disabled = is_rds
         if (
             is_rds
             and self._editing_index is not None
             and self._editing_index < len(self._state.get("secrets", []))
         ):
             current = self._state.get("secrets", [])[self._editing_index]
-            self.query_one("#sec_existing_name", Input).value = str(
+            self._widgets.sec_existing_name.value = str(
                 current.get("existing_secret_display_name")
                 or current.get("existing_secret_name")
                 or ""
             )
 
     def _selected_source(self) -> str:
-        radio_set = self.query_one("#sec_source", RadioSet)
+        radio_set = self._widgets.sec_source
         pressed = radio_set.pressed_button
         if pressed and pressed.id == "src_env":
             return "env"
@@ -241,29 +267,47 @@ class SecretsScreen(Screen):
 
     def _set_selected_source(self, source: str) -> None:
         if source == "env":
-            self.query_one("#src_env", RadioButton).value = True
+            self._widgets.src_env.value = True
             return
         if source == "rds":
-            self.query_one("#src_rds", RadioButton).value = True
+            self._widgets.src_rds.value = True
             return
         if source == "existing":
-            self.query_one("#src_existing", RadioButton).value = True
+            self._widgets.src_existing.value = True
             return
-        self.query_one("#src_gen", RadioButton).value = True
+        self._widgets.src_gen.value = True
 
     def _refresh_sidebar(self) -> None:
         """Rebuild the sidebar list from current state."""
-        lv = self.query_one("#item-list", ListView)
+        lv = self._widgets.item_list
         lv.clear()
         for secret in self._state.get("secrets", []):
             lv.append(ListItem(Static(secret["name"])))
 
+    def _sidebar_append(self, secret: dict) -> None:
+        """Add a sidebar row for a newly added secret."""
+        lv = self._widgets.item_list
+        lv.append(ListItem(Static(secret["name"])))
+        lv.index = None
+
+    def _sidebar_replace(self, idx: int, secret: dict) -> None:
+        """Relabel the sidebar row of an edited secret in place."""
+        lv = self._widgets.item_list
+        lv.children[idx].query_one(Static).update(secret["name"])
+        lv.index = None
+
+    def _sidebar_remove(self, idx: int) -> None:
+        """Drop the sidebar row of a removed secret."""
+        lv = self._widgets.item_list
+        lv.index = None
+        lv.remove_items([idx])
+
     def _update_mode(self) -> None:
         """Toggle button visibility based on add vs edit mode."""
         editing = self._editing_index is not None
-        self.query_one("#add", Button).display = not editing
-        self.query_one("#save", Button).display = editing
-        self.query_one("#remove", Button).display = editing
+        self._widgets.add.display = not editing
+        self._widgets.save.display = editing
+        self._widgets.remove.display = editing
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle selection in secret sidebars/lists."""
@@ -273,7 +317,7 @@ class SecretsScreen(Screen):
                 return
             rec = self._filtered_existing_secret_records[idx]
             self._selected_existing_secret_id = rec["secret_id"]
-            self.query_one("#sec_existing_name", Input).value = rec["name"]
+            self._widgets.sec_existing_name.value = rec["name"]
             self._capture_draft()
             return
 
@@ -282,8 +326,8 @@ class SecretsScreen(Screen):
         if event.list_view.id == "item-list" and idx is not None and idx < len(secrets):
             self._editing_index = idx
             secret = secrets[idx]
-            self.query_one("#sec_name", Input).value = secret.get("name", "")
-            self.query_one("#sec_length", Input).value = str(secret.get("length", 50))
+            self._widgets.sec_name.value = secret.get("name", "")
+            self._widgets.sec_length.value = str(secret.get("length", 50))
             self._expose_to = [str(s) for s in secret.get("expose_to", [])]
             self._refresh_expose_services()
             if secret.get("source") == "env":
@@ -291,7 +335,7 @@ class SecretsScreen(Screen):
                 self._selected_existing_secret_id = None
             elif secret.get("source") == "rds":
                 self._set_selected_source("rds")
-                self.query_one("#sec_existing_name", Input).value = str(
+                self._widgets.sec_existing_name.value = str(
                     secret.get("existing_secret_display_name")
                     or secret.get("existing_secret_name")
                     or ""
@@ -299,7 +343,7 @@ class SecretsScreen(Screen):
                 self._selected_existing_secret_id = None
             elif secret.get("source") == "existing":
                 self._set_selected_source("existing")
-                self.query_one("#sec_existing_name", Input).value = str(
+                self._widgets.sec_existing_name.value = str(
                     secret.get("existing_secret_display_name")
                     or secret.get("existing_secret_name")
                     or ""
@@ -337,7 +381,7 @@ class SecretsScreen(Screen):
         if self._fetching_existing_secrets:
             return
         self._fetching_existing_secrets = True
-        self.query_one("#fetch_existing_secrets", Button).disabled = True
+        self._widgets.fetch_existing_secrets.disabled = True
         threading.Thread(
             target=self._fetch_existing_secrets_worker, daemon=True
         ).start()
@@ -380,7 +424,7 @@ class SecretsScreen(Screen):
     ) -> None:
         scroll = self._capture_form_scroll()
         self._fetching_existing_secrets = False
-        self.query_one("#fetch_existing_secrets", Button).disabled = False
+        self._widgets.fetch_existing_secrets.disabled = False
         if err:
             self.notify(f"Failed to load existing secrets: {err}", severity="error")
             self._restore_form_scroll(scroll)
@@ -398,10 +442,8 @@ class SecretsScreen(Screen):
         return None
 
     def _apply_existing_secret_filter(self) -> None:
-        filter_text = (
-            self.query_one("#sec_existing_filter", Input).value.strip().lower()
-        )
-        lv = self.query_one("#sec_existing_list", ListView)
+        filter_text = self._widgets.sec_existing_filter.value.strip().lower()
+        lv = self._widgets.sec_existing_list
 
         self._filtered_existing_secret_records = [
             rec
@@ -430,7 +472,7 @@ class SecretsScreen(Screen):
 
     def _persist_for_navigation(self) -> None:
         self._capture_draft()
-        name = self.query_one("#sec_name", Input).value.strip()
+        name = self._widgets.sec_name.value.strip()
         if self._editing_index is not None:
             self._save_secret()
         elif name:
@@ -450,17 +492,17 @@ class SecretsScreen(Screen):
 
     def _read_form(self) -> dict | None:
         """Read and validate the form fields."""
-        name = self.query_one("#sec_name", Input).value.strip()
+        name = self._widgets.sec_name.value.strip()
         if not name:
             self.notify("Secret name is required", severity="error")
             return None
 
         source = self._selected_source()
 
-        length = int(self.query_one("#sec_length", Input).value.strip() or "50")
+        length = int(self._widgets.sec_length.value.strip() or "50")
         self._expose_to = self._read_expose_checkboxes()
 
-        existing_secret_name = self.query_one("#sec_existing_name", Input).value.strip()
+        existing_secret_name = self._widgets.sec_existing_name.value.strip()
         if source in {"existing", "rds"} and not existing_secret_name:
             self.notify(
                 "Existing secret name is required for source=existing/rds",
@@ -495,14 +537,14 @@ class SecretsScreen(Screen):
         }
 
     def _read_expose_checkboxes(self) -> list[str]:
-        selection = self.query_one("#sec-expose-services", SelectionList)
+        selection = self._widgets.sec_expose_services
         return [str(v) for v in selection.selected]
 
     def _refresh_expose_services(self) -> None:
         service_names = self._service_names()
         selected = set(self._expose_to)
-        empty = self.query_one("#sec-expose-empty", Static)
-        selection = self.query_one("#sec-expose-services", SelectionList)
+        empty = self._widgets.sec_expose_empty
+        selection = self._widgets.sec_expose_services
         selection.clear_options()
         if service_names:
             selection.add_options(
@@ -520,7 +562,7 @@ class SecretsScreen(Screen):
             return
         self._state.setdefault("secrets", []).append(secret)
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_append(secret)
         self.notify(f"Added secret '{secret['name']}'")
 
     def _save_secret(self) -> None:
@@ -529,32 +571,34 @@ class SecretsScreen(Screen):
         secret = self._read_form()
         if secret is None:
             return
-        self._state["secrets"][self._editing_index] = secret
+        idx = self._editing_index
+        self._state["secrets"][idx] = secret
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_replace(idx, secret)
         self.notify(f"Updated secret '{secret['name']}'")
 
     def _remove_secret(self) -> None:
         if self._editing_index is None:
             return
-        name = self._state["secrets"][self._editing_index]["name"]
-        del self._state["secrets"][self._editing_index]
+        idx = self._editing_index
+        name = self._state["secrets"][idx]["name"]
+        del self._state["secrets"][idx]
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_remove(idx)
         self.notify(f"Removed secret '{name}'")
 
     def _clear_form(self) -> None:
         """Reset form to add mode."""
         self._editing_index = None
-        self.query_one("#sec_name", Input).value = ""
-        self.query_one("#sec_length", Input).value = "50"
+        self._widgets.sec_name.value = ""
+        self._widgets.sec_length.value = "50"
         self._set_selected_source("generate")
-        self.query_one("#sec_existing_name", Input).value = ""
-        self.query_one("#sec_existing_filter", Input).value = ""
+        self._widgets.sec_existing_name.value = ""
+        self._widgets.sec_existing_filter.value = ""
         self._existing_secret_records = []
         self._filtered_existing_secret_records = []
         self._selected_existing_secret_id = None
-        self.query_one("#sec_existing_list", ListView).clear()
+        self._widgets.sec_existing_list.clear()
         self._expose_to = []
         self._refresh_expose_services()
         self._sync_source_fields()
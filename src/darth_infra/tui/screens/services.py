@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from types import SimpleNamespace
 from typing import Any
 
 import boto3
@@ -43,13 +44,24 @@ class ServicesScreen(Screen):
     def __init__(self, state: dict) -> None:
         super().__init__()
         self._state = state
+        # Services are only ever mutated in place, so hold the list directly.
+        self._services: list[dict] = state.setdefault("services", [])
         self._editing_index: int | None = None
         self._ebs_volumes: list[dict] = []
+        # True while _ebs_volumes is still the selected service's own list.
+        self._ebs_volumes_shared = False
         self._editing_ebs_index: int | None = None
         self._ulimits: list[dict] = []
+        # True while _ulimits is still the selected service's own list.
+        self._ulimits_shared = False
         self._editing_ulimit_index: int | None = None
         self._env_vars: list[dict] = []
         self._editing_env_var_index: int | None = None
+        # (label, item, label widget) for each row shown in the EBS, ulimit
+        # and env var lists, so refreshes only touch rows that changed.
+        self._ebs_rows: list[tuple[str, ListItem, Static]] = []
+        self._ulimit_rows: list[tuple[str, ListItem, Static]] = []
+        self._env_var_rows: list[tuple[str, ListItem, Static]] = []
         self._active_section: str = "details"
         self._alb_fetch_inflight = False
         self._path_rules: list[dict] = []
@@ -273,7 +285,68 @@ class ServicesScreen(Screen):
                     yield Button("Update", id="save", variant="success")
                     yield Button("Remove", id="remove", variant="error")
 
+    def _bind_widgets(self) -> None:
+        """Look up the service form, section and sidebar widgets once, after compose."""
+        self._widgets = SimpleNamespace(
+            item_list=self.query_one("#item-list", ListView),
+            service_tab_details=self.query_one("#service_tab_details", Button),
+            service_tab_env=self.query_one("#service_tab_env", Button),
+            service_tab_ulimits=self.query_one("#service_tab_ulimits", Button),
+            service_tab_ebs=self.query_one("#service_tab_ebs", Button),
+            service_section_details=self.query_one(
+                "#service_section_details", Vertical
+            ),
+            svc_name=self.query_one("#svc_name", Input),
+            svc_dockerfile=self.query_one("#svc_dockerfile", Input),
+            svc_context=self.query_one("#svc_context", Input),
+            svc_build_target=self.query_one("#svc_build_target", Input),
+            svc_image=self.query_one("#svc_image", Input),
+            svc_port=self.query_one("#svc_port", Input),
+            svc_health=self.query_one("#svc_health", Input),
+            svc_health_codes=self.query_one("#svc_health_codes", Input),
+            svc_health_timeout=self.query_one("#svc_health_timeout", Input),
+            svc_health_interval=self.query_one("#svc_health_interval", Input),
+            svc_health_healthy=self.query_one("#svc_health_healthy", Input),
+            svc_health_unhealthy=self.query_one("#svc_health_unhealthy", Input),
+            svc_health_grace=self.query_one("#svc_health_grace", Input),
+            svc_cpu=self.query_one("#svc_cpu", Input),
+            svc_memory=self.query_one("#svc_memory", Input),
+            svc_command=self.query_one("#svc_command", Input),
+            svc_discovery=self.query_one("#svc_discovery", Checkbox),
+            svc_ses_send_email=self.query_one("#svc_ses_send_email", Checkbox),
+            launch_type=self.query_one("#launch_type", RadioSet),
+            lt_ec2=self.query_one("#lt_ec2", RadioButton),
+            lt_fargate=self.query_one("#lt_fargate", RadioButton),
+            ec2_fields=self.query_one("#ec2_fields", Vertical),
+            svc_ec2_instance_type=self.query_one("#svc_ec2_instance_type", Input),
+            svc_user_data_script_content=self.query_one(
+                "#svc_user_data_script_content", TextArea
+            ),
+            service_section_env=self.query_one("#service_section_env", Vertical),
+            env_var_list=self.query_one("#env-var-list", ListView),
+            env_var_key=self.query_one("#env_var_key", Input),
+            env_var_value=self.query_one("#env_var_value", Input),
+            service_section_ulimits=self.query_one(
+                "#service_section_ulimits", Vertical
+            ),
+            ulimit_list=self.query_one("#ulimit-list", ListView),
+            ulimit_name=self.query_one("#ulimit_name", Input),
+            ulimit_soft=self.query_one("#ulimit_soft", Input),
+            ulimit_hard=self.query_one("#ulimit_hard", Input),
+            service_section_ebs=self.query_one("#service_section_ebs", Vertical),
+            ebs_list=self.query_one("#ebs-list", ListView),
+            ebs_name=self.query_one("#ebs_name", Input),
+            ebs_size=self.query_one("#ebs_size", Input),
+            ebs_mount=self.query_one("#ebs_mount", Input),
+            ebs_device=self.query_one("#ebs_device", Input),
+            ebs_fs_type=self.query_one("#ebs_fs_type", Input),
+            add=self.query_one("#add", Button),
+            save=self.query_one("#save", Button),
+            remove=self.query_one("#remove", Button),
+        )
+
     def on_mount(self) -> None:
+        self._bind_widgets()
         self._restore_from_draft()
         self._refresh_sidebar()
         self._update_mode()
@@ -284,72 +357,62 @@ class ServicesScreen(Screen):
 
     def _restore_from_draft(self) -> None:
         draft = self._draft()
-        if self._state.get("services"):
+        if self._services:
             # Avoid stale seeded draft values overriding real service entries.
             draft = {}
 
         if draft.get("svc_name") is not None:
-            self.query_one("#svc_name", Input).value = str(draft.get("svc_name", ""))
+            self._widgets.svc_name.value = str(draft.get("svc_name", ""))
         if draft.get("svc_dockerfile") is not None:
-            self.query_one("#svc_dockerfile", Input).value = str(
+            self._widgets.svc_dockerfile.value = str(
                 draft.get("svc_dockerfile", "Dockerfile")
             )
         if draft.get("svc_context") is not None:
-            self.query_one("#svc_context", Input).value = str(
-                draft.get("svc_context", ".")
-            )
+            self._widgets.svc_context.value = str(draft.get("svc_context", "."))
         if draft.get("svc_build_target") is not None:
-            self.query_one("#svc_build_target", Input).value = str(
+            self._widgets.svc_build_target.value = str(
                 draft.get("svc_build_target", "")
             )
         if draft.get("svc_image") is not None:
-            self.query_one("#svc_image", Input).value = str(draft.get("svc_image", ""))
+            self._widgets.svc_image.value = str(draft.get("svc_image", ""))
         if draft.get("svc_port") is not None:
-            self.query_one("#svc_port", Input).value = str(draft.get("svc_port", ""))
+            self._widgets.svc_port.value = str(draft.get("svc_port", ""))
         if draft.get("svc_health") is not None:
-            self.query_one("#svc_health", Input).value = str(
-                draft.get("svc_health", "/health")
-            )
+            self._widgets.svc_health.value = str(draft.get("svc_health", "/health"))
         if draft.get("svc_health_codes") is not None:
-            self.query_one("#svc_health_codes", Input).value = str(
+            self._widgets.svc_health_codes.value = str(
                 draft.get("svc_health_codes", "200-399")
             )
         if draft.get("svc_health_timeout") is not None:
-            self.query_one("#svc_health_timeout", Input).value = str(
+            self._widgets.svc_health_timeout.value = str(
                 draft.get("svc_health_timeout", "5")
             )
         if draft.get("svc_health_interval") is not None:
-            self.query_one("#svc_health_interval", Input).value = str(
+            self._widgets.svc_health_interval.value = str(
                 draft.get("svc_health_interval", "30")
             )
         if draft.get("svc_health_healthy") is not None:
-            self.query_one("#svc_health_healthy", Input).value = str(
+            self._widgets.svc_health_healthy.value = str(
                 draft.get("svc_health_healthy", "5")
             )
         if draft.get("svc_health_unhealthy") is not None:
-            self.query_one("#svc_health_unhealthy", Input).value = str(
+            self._widgets.svc_health_unhealthy.value = str(
                 draft.get("svc_health_unhealthy", "2")
             )
         if draft.get("svc_health_grace") is not None:
-            self.query_one("#svc_health_grace", Input).value = str(
+            self._widgets.svc_health_grace.value = str(
                 draft.get("svc_health_grace", "")
             )
         if draft.get("svc_cpu") is not None:
-            self.query_one("#svc_cpu", Input).value = str(draft.get("svc_cpu", "256"))
+            self._widgets.svc_cpu.value = str(draft.get("svc_cpu", "256"))
         if draft.get("svc_memory") is not None:
-            self.query_one("#svc_memory", Input).value = str(
-                draft.get("svc_memory", "512")
-            )
+            self._widgets.svc_memory.value = str(draft.get("svc_memory", "512"))
         if draft.get("svc_command") is not None:
-            self.query_one("#svc_command", Input).value = str(
-                draft.get("svc_command", "")
-            )
+            self._widgets.svc_command.value = str(draft.get("svc_command", ""))
         if draft.get("svc_discovery") is not None:
-            self.query_one("#svc_discovery", Checkbox).value = bool(
-                draft.get("svc_discovery", False)
-            )
+            self._widgets.svc_discovery.value = bool(draft.get("svc_discovery", False))
         if draft.get("svc_ses_send_email") is not None:
-            self.query_one("#svc_ses_send_email", Checkbox).value = bool(
+            self._widgets.svc_ses_send_email.value = bool(
                 draft.get("svc_ses_send_email", False)
             )
         launch_type = draft.get("launch_type")
@@ -358,74 +421,64 @@ class ServicesScreen(Screen):
         elif launch_type == "fargate":
             self._select_launch_type("fargate")
         if draft.get("svc_ec2_instance_type") is not None:
-            self.query_one("#svc_ec2_instance_type", Input).value = str(
+            self._widgets.svc_ec2_instance_type.value = str(
                 draft.get("svc_ec2_instance_type", "")
             )
         if draft.get("svc_user_data_script_content") is not None:
-            self.query_one("#svc_user_data_script_content", TextArea).text = str(
+            self._widgets.svc_user_data_script_content.text = str(
                 draft.get("svc_user_data_script_content", "")
             )
         if isinstance(draft.get("ebs_volumes"), list):
             self._ebs_volumes = [dict(v) for v in draft.get("ebs_volumes", [])]
+            self._ebs_volumes_shared = False
             self._refresh_ebs_sidebar()
         if isinstance(draft.get("ulimits"), list):
             self._ulimits = [dict(v) for v in draft.get("ulimits", [])]
+            self._ulimits_shared = False
             self._refresh_ulimit_sidebar()
         if isinstance(draft.get("env_vars"), list):
             self._env_vars = [dict(v) for v in draft.get("env_vars", [])]
             self._refresh_env_var_sidebar()
 
     def _capture_draft(self) -> None:
-        lt_set = self.query_one("#launch_type", RadioSet)
+        lt_set = self._widgets.launch_type
         lt_pressed = lt_set.pressed_button
         lt = "ec2" if lt_pressed and lt_pressed.id == "lt_ec2" else "fargate"
         self._draft().update(
             {
-                "svc_name": self.query_one("#svc_name", Input).value,
-                "svc_dockerfile": self.query_one("#svc_dockerfile", Input).value,
-                "svc_context": self.query_one("#svc_context", Input).value,
-                "svc_build_target": self.query_one("#svc_build_target", Input).value,
-                "svc_image": self.query_one("#svc_image", Input).value,
-                "svc_port": self.query_one("#svc_port", Input).value,
-                "svc_health": self.query_one("#svc_health", Input).value,
-                "svc_health_codes": self.query_one("#svc_health_codes", Input).value,
-                "svc_health_timeout": self.query_one(
-                    "#svc_health_timeout", Input
-                ).value,
-                "svc_health_interval": self.query_one(
-                    "#svc_health_interval", Input
-                ).value,
-                "svc_health_healthy": self.query_one(
-                    "#svc_health_healthy", Input
-                ).value,
-                "svc_health_unhealthy": self.query_one(
-                    "#svc_health_unhealthy", Input
-                ).value,
-                "svc_health_grace": self.query_one("#svc_health_grace", Input).value,
-                "svc_cpu": self.query_one("#svc_cpu", Input).value,
-                "svc_memory": self.query_one("#svc_memory", Input).value,
-                "svc_command": self.query_one("#svc_command", Input).value,
-                "svc_discovery": self.query_one("#svc_discovery", Checkbox).value,
-                "svc_ses_send_email": self.query_one(
-                    "#svc_ses_send_email", Checkbox
-                ).value,
+                "svc_name": self._widgets.svc_name.value,
+                "svc_dockerfile": self._widgets.svc_dockerfile.value,
+                "svc_context": self._widgets.svc_context.value,
+                "svc_build_target": self._widgets.svc_build_target.value,
+                "svc_image": self._widgets.svc_image.value,
+                "svc_port": self._widgets.svc_port.value,
+                "svc_health": self._widgets.svc_health.value,
+                "svc_health_codes": self._widgets.svc_health_codes.value,
+                "svc_health_timeout": self._widgets.svc_health_timeout.value,
+                "svc_health_interval": self._widgets.svc_health_interval.value,
+                "svc_health_healthy": self._widgets.svc_health_healthy.value,
+                "svc_health_unhealthy": self._widgets.svc_health_unhealthy.value,
+                "svc_health_grace": self._widgets.svc_health_grace.value,
+                "svc_cpu": self._widgets.svc_cpu.value,
+                "svc_memory": self._widgets.svc_memory.value,
+                "svc_command": self._widgets.svc_command.value,
+                "svc_discovery": self._widgets.svc_discovery.value,
+                "svc_ses_send_email": self._widgets.svc_ses_send_email.value,
                 "launch_type": lt,
-                "svc_ec2_instance_type": self.query_one(
-                    "#svc_ec2_instance_type", Input
-                ).value,
-                "svc_user_data_script_content": self.query_one(
-                    "#svc_user_data_script_content", TextArea
-                ).text,
-                "ebs_name": self.query_one("#ebs_name", Input).value,
-                "ebs_size": self.query_one("#ebs_size", Input).value,
-                "ebs_mount": self.query_one("#ebs_mount", Input).value,
-                "ebs_device": self.query_one("#ebs_device", Input).value,
-                "ebs_fs_type": self.query_one("#ebs_fs_type", Input).value,
-                "ulimit_name": self.query_one("#ulimit_name", Input).value,
-                "ulimit_soft": self.query_one("#ulimit_soft", Input).value,
-                "ulimit_hard": self.query_one("#ulimit_hard", Input).value,
-                "env_var_key": self.query_one("#env_var_key", Input).value,
-                "env_var_value": self.query_one("#env_var_value", Input).value,
+                "svc_ec2_instance_type": self._widgets.svc_ec2_instance_type.value,
+                "svc_user_data_script_content": (
+                    self._widgets.svc_user_data_script_content.text
+                ),
+                "ebs_name": self._widgets.ebs_name.value,
+                "ebs_size": self._widgets.ebs_size.value,
+                "ebs_mount": self._widgets.ebs_mount.value,
+                "ebs_device": self._widgets.ebs_device.value,
+                "ebs_fs_type": self._widgets.ebs_fs_type.value,
+                "ulimit_name": self._widgets.ulimit_name.value,
+                "ulimit_soft": self._widgets.ulimit_soft.value,
+                "ulimit_hard": self._widgets.ulimit_hard.value,
+                "env_var_key": self._widgets.env_var_key.value,
+                "env_var_value": self._widgets.env_var_value.value,
                 "ebs_volumes": [dict(v) for v in self._ebs_volumes],
                 "ulimits": [dict(v) for v in self._ulimits],
                 "env_vars": [dict(v) for v in self._env_vars],
@@ -434,46 +487,89 @@ class ServicesScreen(Screen):
 
     def _refresh_sidebar(self) -> None:
         """Rebuild the sidebar list from current state."""
-        lv = self.query_one("#item-list", ListView)
+        lv = self._widgets.item_list
         lv.clear()
-        for svc in self._state.get("services", []):
-            label = svc["name"]
-            if svc.get("launch_type") == "ec2":
-                label += " [EC2]"
-            lv.append(ListItem(Static(label)))
+        for svc in self._services:
+            lv.append(ListItem(Static(self._sidebar_label(svc))))
         # Keep the form in add mode after list refresh; user can explicitly select to edit.
         lv.index = None
 
+    @staticmethod
+    def _sidebar_label(svc: dict) -> str:
+        label = svc["name"]
+        if svc.get("launch_type") == "ec2":
+            label += " [EC2]"
+        return label
+
+    def _sidebar_append(self, svc: dict) -> None:
+        """Add a sidebar row for a newly added service."""
+        lv = self._widgets.item_list
+        lv.append(ListItem(Static(self._sidebar_label(svc))))
+        lv.index = None
+
+    def _sidebar_replace(self, idx: int, svc: dict) -> None:
+        """Relabel the sidebar row of an edited service in place."""
+        lv = self._widgets.item_list
+        lv.children[idx].query_one(Static).update(self._sidebar_label(svc))
+        lv.index = None
+
+    def _sidebar_remove(self, idx: int) -> None:
+        """Drop the sidebar row of a removed service."""
+        lv = self._widgets.item_list
+        lv.index = None
+        lv.remove_items([idx])
+
+    @staticmethod
+    def _sync_list(
+        lv: ListView, rows: list[tuple[str, ListItem, Static]], labels: list[str]
+    ) -> None:
+        """Make *lv* show *labels*, relabelling, adding or dropping only the
+        rows that differ from *rows* (updated in place)."""
+        lv.index = None
+        for i, label in enumerate(labels[: len(rows)]):
+            old_label, item, static = rows[i]
+            if old_label != label:
+                static.update(label)
+                rows[i] = (label, item, static)
+        if len(rows) > len(labels):
+            stale = [item for _, item, _ in rows[len(labels) :]]
+            del rows[len(labels) :]
+            lv.remove_children(stale)
+        for label in labels[len(rows) :]:
+            static = Static(label)
+            item = ListItem(static)
+            rows.append((label, item, static))
+            lv.append(item)
+
     def _refresh_ebs_sidebar(self) -> None:
-        """Rebuild the EBS volume list."""
-        lv = self.query_one("#ebs-list", ListView)
-        lv.clear()
-        for vol in self._ebs_volumes:
-            lv.append(
-                ListItem(
-                    Static(f"{vol['name']} ({vol['size_gb']}G → {vol['mount_path']})")
-                )
-            )
+        """Sync the EBS volume list with the current volumes."""
+        self._sync_list(
+            self._widgets.ebs_list,
+            self._ebs_rows,
+            [
+                f"{vol['name']} ({vol['size_gb']}G → {vol['mount_path']})"
+                for vol in self._ebs_volumes
+            ],
+        )
 
     def _refresh_ulimit_sidebar(self) -> None:
-        """Rebuild the ulimit list."""
-        lv = self.query_one("#ulimit-list", ListView)
-        lv.clear()
-        for ul in self._ulimits:
-            lv.append(
-                ListItem(
-                    Static(
-                        f"{ul['name']} (soft={ul['soft_limit']}, hard={ul['hard_limit']})"
-                    )
-                )
-            )
+        """Sync the ulimit list with the current ulimits."""
+        self._sync_list(
+            self._widgets.ulimit_list,
+            self._ulimit_rows,
+            [
+                f"{ul['name']} (soft={ul['soft_limit']}, hard={ul['hard_limit']})"
+                for ul in self._ulimits
+            ],
+        )
 
     def _refresh_env_var_sidebar(self) -> None:
-        """Rebuild the environment variable list."""
-        lv = self.query_one("#env-var-list", ListView)
-        lv.clear()
-        for ev in self._env_vars:
-            lv.append(ListItem(Static(f"{ev['key']}={ev['value']}")))
+        """Sync the environment variable list with the current variables."""
+        self._sync_list(
+            self._widgets.env_var_list,
+            self._env_var_rows,
+            [f"{ev['key']}={ev['value']}" for ev in self._env_vars],
+        )
 
     def _refresh_path_rule_sidebar(self) -> None:
         lv = self.query_one("#path-rule-list", ListView)
@@ -489,9 +585,7 @@ class ServicesScreen(Screen):
             )
 
     def _refresh_routing_service_selects(self) -> None:
-        services = [
-            svc["name"] for svc in self._state.get("services", []) if svc.get("port")
-        ]
+        services = [svc["name"] for svc in self._services if svc.get("port")]
         options = [(svc, svc) for svc in services]
 
         default_select = self.query_one("#default_target_service", Select)
@@ -516,15 +610,16 @@ class ServicesScreen(Screen):
 
     def _toggle_ec2_fields(self) -> None:
         """Show or hide EC2-specific fields and EC2-only tabs."""
-        lt_set = self.query_one("#launch_type", RadioSet)
+        lt_set = self._widgets.launch_type
         lt_pressed = lt_set.pressed_button
         is_ec2 = bool(lt_pressed and lt_pressed.id == "lt_ec2")
-        ec2_container = self.query_one("#ec2_fields", Vertical)
-        ec2_container.display = is_ec2
-        if is_ec2 and not self.query_one("#svc_ec2_instance_type", Input).value.strip():
-            self.query_one("#svc_ec2_instance_type", Input).value = "t3.medium"
-        self.query_one("#service_tab_ulimits", Button).disabled = not is_ec2
-        self.query_one("#service_tab_ebs", Button).disabled = not is_ec2
+        ec2_container = self._widgets.ec2_fields
+        if ec2_container.display != is_ec2:
+            ec2_container.display = is_ec2
+        if is_ec2 and not self._widgets.svc_ec2_instance_type.value.strip():
+            self._widgets.svc_ec2_instance_type.value = "t3.medium"
+        self._widgets.service_tab_ulimits.disabled = not is_ec2
+        self._widgets.service_tab_ebs.disabled = not is_ec2
         if not is_ec2 and self._active_section in {"ulimits", "ebs"}:
             self._set_active_section("details")
         else:
@@ -537,9 +632,8 @@ class ServicesScreen(Screen):
         self.query_one("#alb_shared_fields", Vertical).display = is_shared
 
     def _select_launch_type(self, launch_type: str) -> None:
-        target = self.query_one(
-            "#lt_ec2" if launch_type == "ec2" else "#lt_fargate",
-            RadioButton,
+        target = (
+            self._widgets.lt_ec2 if launch_type == "ec2" else self._widgets.lt_fargate
         )
         if not target.value:
             target.value = True
@@ -601,34 +695,31 @@ class ServicesScreen(Screen):
             return
 
         self._active_section = section
-        self.query_one("#service_section_details", Vertical).display = (
-            section == "details"
-        )
-        self.query_one("#service_section_env", Vertical).display = section == "env"
-        self.query_one("#service_section_ulimits", Vertical).display = (
-            section == "ulimits"
-        )
-        self.query_one("#service_section_ebs", Vertical).display = section == "ebs"
+        self._widgets.service_section_details.display = section == "details"
+        self._widgets.service_section_env.display = section == "env"
+        self._widgets.service_section_ulimits.display = section == "ulimits"
+        self._widgets.service_section_ebs.display = section == "ebs"
 
-        self.query_one("#service_tab_details", Button).variant = (
+        self._widgets.service_tab_details.variant = (
             "primary" if section == "details" else "default"
         )
-        self.query_one("#service_tab_env", Button).variant = (
+        self._widgets.service_tab_env.variant = (
             "primary" if section == "env" else "default"
         )
-        self.query_one("#service_tab_ulimits", Button).variant = (
+        self._widgets.service_tab_ulimits.variant = (
             "primary" if section == "ulimits" else "default"
         )
-        self.query_one("#service_tab_ebs", Button).variant = (
+        self._widgets.service_tab_ebs.variant = (
             "primary" if section == "ebs" else "default"
         )
 
     def _update_mode(self) -> None:
         """Toggle button visibility based on add vs edit mode."""
         editing = self._editing_index is not None
-        self.query_one("#add", Button).display = not editing
-        self.query_one("#save", Button).display = editing
-        self.query_one("#remove", Button).display = editing
+        if self._widgets.save.display != editing:
+            self._widgets.add.display = not editing
+            self._widgets.save.display = editing
+            self._widgets.remove.display = editing
 
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         if event.radio_set.id == "launch_type":
@@ -651,15 +742,12 @@ class ServicesScreen(Screen):
             if idx is not None and idx < len(self._ebs_volumes):
                 self._editing_ebs_index = idx
                 vol = self._ebs_volumes[idx]
-                self.query_one("#ebs_name", Input).value = vol.get("name", "")
-                self.query_one("#ebs_size", Input).value = str(vol.get("size_gb", ""))
-                self.query_one("#ebs_mount", Input).value = vol.get("mount_path", "")
-                self.query_one("#ebs_device", Input).value = vol.get(
-                    "device_name", "/dev/xvdf"
-                )
-                self.query_one("#ebs_fs_type", Input).value = vol.get(
-                    "filesystem_type", "ext4"
-                )
+                with self.app.batch_update():
+                    self._widgets.ebs_name.value = vol.get("name", "")
+                    self._widgets.ebs_size.value = str(vol.get("size_gb", ""))
+                    self._widgets.ebs_mount.value = vol.get("mount_path", "")
+                    self._widgets.ebs_device.value = vol.get("device_name", "/dev/xvdf")
+                    self._widgets.ebs_fs_type.value = vol.get("filesystem_type", "ext4")
             return
 
         if event.list_view.id == "ulimit-list":
@@ -667,13 +755,9 @@ class ServicesScreen(Screen):
             if idx is not None and idx < len(self._ulimits):
                 self._editing_ulimit_index = idx
                 ul = self._ulimits[idx]
-                self.query_one("#ulimit_name", Input).value = ul.get("name", "")
-                self.query_one("#ulimit_soft", Input).value = str(
-                    ul.get("soft_limit", "")
-                )
-                self.query_one("#ulimit_hard", Input).value = str(
-                    ul.get("hard_limit", "")
-                )
+                self._widgets.ulimit_name.value = ul.get("name", "")
+                self._widgets.ulimit_soft.value = str(ul.get("soft_limit", ""))
+                self._widgets.ulimit_hard.value = str(ul.get("hard_limit", ""))
             return
 
         if event.list_view.id == "env-var-list":
@@ -681,93 +765,95 @@ class ServicesScreen(Screen):
             if idx is not None and idx < len(self._env_vars):
                 self._editing_env_var_index = idx
                 ev = self._env_vars[idx]
-                self.query_one("#env_var_key", Input).value = ev.get("key", "")
-                self.query_one("#env_var_value", Input).value = ev.get("value", "")
+                self._widgets.env_var_key.value = ev.get("key", "")
+                self._widgets.env_var_value.value = ev.get("value", "")
             return
 
         idx = event.list_view.index
-        services = self._state.get("services", [])
+        services = self._services
         if idx is not None and idx < len(services):
             self._editing_index = idx
-            self._set_active_section("details")
-            svc = services[idx]
-            self.query_one("#svc_name", Input).value = svc.get("name", "")
-            self.query_one("#svc_dockerfile", Input).value = svc.get(
-                "dockerfile", "Dockerfile"
-            )
-            self.query_one("#svc_context", Input).value = svc.get("build_context", ".")
-            self.query_one("#svc_build_target", Input).value = (
-                svc.get("docker_build_target") or ""
-            )
-            self.query_one("#svc_port", Input).value = (
-                str(svc["port"]) if svc.get("port") else ""
-            )
-            self.query_one("#svc_health", Input).value = svc.get(
-                "health_check_path", "/health"
-            )
-            self.query_one("#svc_health_codes", Input).value = svc.get(
-                "health_check_http_codes", "200-399"
-            )
-            self.query_one("#svc_health_timeout", Input).value = str(
-                svc.get("health_check_timeout_seconds", 5)
-            )
-            self.query_one("#svc_health_interval", Input).value = str(
-                svc.get("health_check_interval_seconds", 30)
-            )
-            self.query_one("#svc_health_healthy", Input).value = str(
-                svc.get("healthy_threshold_count", 5)
-            )
-            self.query_one("#svc_health_unhealthy", Input).value = str(
-                svc.get("unhealthy_threshold_count", 2)
-            )
-            self.query_one("#svc_health_grace", Input).value = (
-                str(svc.get("health_check_grace_period_seconds"))
-                if svc.get("health_check_grace_period_seconds") is not None
-                else ""
-            )
-            self.query_one("#svc_cpu", Input).value = str(svc.get("cpu", 256))
-            self.query_one("#svc_memory", Input).value = str(svc.get("memory_mib", 512))
-            self.query_one("#svc_command", Input).value = svc.get("command") or ""
-            self.query_one("#svc_image", Input).value = svc.get("image") or ""
-
-            # Service discovery
-            self.query_one("#svc_discovery", Checkbox).value = svc.get(
-                "enable_service_discovery", False
-            )
-            self.query_one("#svc_ses_send_email", Checkbox).value = svc.get(
-                "enable_ses_send_email", False
-            )
-
-            # Launch type
-            is_ec2 = svc.get("launch_type") == "ec2"
-            self._select_launch_type("ec2" if is_ec2 else "fargate")
-            self._toggle_ec2_fields()
-
-            # EC2 fields
-            self.query_one("#svc_ec2_instance_type", Input).value = (
-                svc.get("ec2_instance_type") or ""
-            )
-            self.query_one("#svc_user_data_script_content", TextArea).text = (
-                svc.get("user_data_script_content") or ""
-            )
-
-            # EBS volumes
-            self._ebs_volumes = [dict(v) for v in svc.get("ebs_volumes", [])]
-            self._editing_ebs_index = None
-            self._refresh_ebs_sidebar()
+            with self.app.batch_update():
+                self._set_active_section("details")
+                svc = services[idx]
+                self._widgets.svc_name.value = svc.get("name", "")
+                self._widgets.svc_dockerfile.value = svc.get("dockerfile", "Dockerfile")
+                self._widgets.svc_context.value = svc.get("build_context", ".")
+                self._widgets.svc_build_target.value = (
+                    svc.get("docker_build_target") or ""
+                )
+                self._widgets.svc_port.value = (
+                    str(svc["port"]) if svc.get("port") else ""
+                )
+                self._widgets.svc_health.value = svc.get("health_check_path", "/health")
+                self._widgets.svc_health_codes.value = svc.get(
+                    "health_check_http_codes", "200-399"
+                )
+                self._widgets.svc_health_timeout.value = str(
+                    svc.get("health_check_timeout_seconds", 5)
+                )
+                self._widgets.svc_health_interval.value = str(
+                    svc.get("health_check_interval_seconds", 30)
+                )
+                self._widgets.svc_health_healthy.value = str(
+                    svc.get("healthy_threshold_count", 5)
+                )
+                self._widgets.svc_health_unhealthy.value = str(
+                    svc.get("unhealthy_threshold_count", 2)
+                )
+                self._widgets.svc_health_grace.value = (
+                    str(svc.get("health_check_grace_period_seconds"))
+                    if svc.get("health_check_grace_period_seconds") is not None
+                    else ""
+                )
+                self._widgets.svc_cpu.value = str(svc.get("cpu", 256))
+                self._widgets.svc_memory.value = str(svc.get("memory_mib", 512))
+                self._widgets.svc_command.value = svc.get("command") or ""
+                self._widgets.svc_image.value = svc.get("image") or ""
+
+                # Service discovery
+                self._widgets.svc_discovery.value = svc.get(
+                    "enable_service_discovery", False
+                )
+                self._widgets.svc_ses_send_email.value = svc.get(
+                    "enable_ses_send_email", False
+                )
 
-            # Ulimits
-            self._ulimits = [dict(u) for u in svc.get("ulimits", [])]
-            self._editing_ulimit_index = None
-            self._refresh_ulimit_sidebar()
+                # Launch type
+                is_ec2 = svc.get("launch_type") == "ec2"
+                self._select_launch_type("ec2" if is_ec2 else "fargate")
+                self._toggle_ec2_fields()
 
-            # Environment variables
-            env_vars_dict = svc.get("environment_variables", {})
-            self._env_vars = [{"key": k, "value": v} for k, v in env_vars_dict.items()]
-            self._editing_env_var_index = None
-            self._refresh_env_var_sidebar()
+                # EC2 fields
+                self._widgets.svc_ec2_instance_type.value = (
+                    svc.get("ec2_instance_type") or ""
+                )
+                self._widgets.svc_user_data_script_content.text = (
+                    svc.get("user_data_script_content") or ""
+                )
 
-            self._update_mode()
+                # EBS volumes
+                # Copied on first edit; viewing a service does not clone its volumes.
+                self._ebs_volumes = svc.get("ebs_volumes", [])
+                self._ebs_volumes_shared = True
+                self._editing_ebs_index = None
+                self._refresh_ebs_sidebar()
+
+                # Ulimits
+                self._ulimits = svc.get("ulimits", [])
+                self._ulimits_shared = True
+                self._editing_ulimit_index = None
+                self._refresh_ulimit_sidebar()
+
+                # Environment variables
+                env_vars_dict = svc.get("environment_variables", {})
+                self._env_vars = [
+                    {"key": k, "value": v} for k, v in env_vars_dict.items()
+                ]
+                self._editing_env_var_index = None
+                self._refresh_env_var_sidebar()
+
+                self._update_mode()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id.startswith("service_tab_"):
@@ -817,7 +903,7 @@ class ServicesScreen(Screen):
 
     def _persist_services_for_navigation(self, *, require_non_empty: bool) -> bool:
         self._capture_draft()
-        name = self.query_one("#svc_name", Input).value.strip()
+        name = self._widgets.svc_name.value.strip()
         if self._editing_index is not None:
             if not self._save_service():
                 return False
@@ -825,7 +911,7 @@ class ServicesScreen(Screen):
             existing_index = next(
                 (
                     i
-                    for i, svc in enumerate(self._state.get("services", []))
+                    for i, svc in enumerate(self._services)
                     if str(svc.get("name", "")).strip() == name
                 ),
                 None,
@@ -837,7 +923,7 @@ class ServicesScreen(Screen):
             else:
                 if not self._add_service():
                     return False
-        if require_non_empty and not self._state.get("services"):
+        if require_non_empty and not self._services:
             self.notify("Add at least one service", severity="error")
             return False
         return True
@@ -945,10 +1031,10 @@ class ServicesScreen(Screen):
 
     def _add_ebs_volume(self) -> None:
         """Add an EBS volume to the current service being edited."""
-        name = self.query_one("#ebs_name", Input).value.strip()
-        size_str = self.query_one("#ebs_size", Input).value.strip()
-        mount = self.query_one("#ebs_mount", Input).value.strip()
-        device = self.query_one("#ebs_device", Input).value.strip() or "/dev/xvdf"
+        name = self._widgets.ebs_name.value.strip()
+        size_str = self._widgets.ebs_size.value.strip()
+        mount = self._widgets.ebs_mount.value.strip()
+        device = self._widgets.ebs_device.value.strip() or "/dev/xvdf"
 
         if not name or not size_str or not mount:
             self.notify(
@@ -968,15 +1054,14 @@ class ServicesScreen(Screen):
             "mount_path": mount,
             "device_name": device,
             "volume_type": "gp3",
-            "filesystem_type": self.query_one("#ebs_fs_type", Input).value.strip()
-            or "ext4",
+            "filesystem_type": self._widgets.ebs_fs_type.value.strip() or "ext4",
         }
 
         if self._editing_ebs_index is not None:
-            self._ebs_volumes[self._editing_ebs_index] = vol
+            self._own_ebs_volumes()[self._editing_ebs_index] = vol
             self._editing_ebs_index = None
         else:
-            self._ebs_volumes.append(vol)
+            self._own_ebs_volumes().append(vol)
 
         self._clear_ebs_form()
         self._refresh_ebs_sidebar()
@@ -986,26 +1071,38 @@ class ServicesScreen(Screen):
         """Remove the selected EBS volume."""
         if self._editing_ebs_index is not None:
             name = self._ebs_volumes[self._editing_ebs_index]["name"]
-            del self._ebs_volumes[self._editing_ebs_index]
+            del self._own_ebs_volumes()[self._editing_ebs_index]
             self._editing_ebs_index = None
             self._clear_ebs_form()
             self._refresh_ebs_sidebar()
             self.notify(f"Removed EBS volume '{name}'")
 
+    def _own_ebs_volumes(self) -> list[dict]:
+        """Detach the EBS volume list from the selected service before editing.
+
+        Volume dicts are replaced rather than mutated, so copying the list is
+        enough.
+        """
+        if self._ebs_volumes_shared:
+            self._ebs_volumes = list(self._ebs_volumes)
+            self._ebs_volumes_shared = False
+        return self._ebs_volumes
+
     def _clear_ebs_form(self) -> None:
         """Reset EBS volume form fields."""
-        self.query_one("#ebs_name", Input).value = ""
-        self.query_one("#ebs_size", Input).value = ""
-        self.query_one("#ebs_mount", Input).value = ""
-        self.query_one("#ebs_device", Input).value = "/dev/xvdf"
-        self.query_one("#ebs_fs_type", Input).value = "ext4"
+        with self.app.batch_update():
+            self._widgets.ebs_name.value = ""
+            self._widgets.ebs_size.value = ""
+            self._widgets.ebs_mount.value = ""
+            self._widgets.ebs_device.value = "/dev/xvdf"
+            self._widgets.ebs_fs_type.value = "ext4"
         self._editing_ebs_index = None
 
     def _add_ulimit(self) -> None:
         """Add a ulimit to the current service being edited."""
-        name = self.query_one("#ulimit_name", Input).value.strip()
-        soft_str = self.query_one("#ulimit_soft", Input).value.strip()
-        hard_str = self.query_one("#ulimit_hard", Input).value.strip()
+        name = self._widgets.ulimit_name.value.strip()
+        soft_str = self._widgets.ulimit_soft.value.strip()
+        hard_str = self._widgets.ulimit_hard.value.strip()
 
         if not name or not soft_str or not hard_str:
             self.notify(
@@ -1028,10 +1125,10 @@ class ServicesScreen(Screen):
         }
 
         if self._editing_ulimit_index is not None:
-            self._ulimits[self._editing_ulimit_index] = ul
+            self._own_ulimits()[self._editing_ulimit_index] = ul
             self._editing_ulimit_index = None
         else:
-            self._ulimits.append(ul)
+            self._own_ulimits().append(ul)
 
         self._clear_ulimit_form()
         self._refresh_ulimit_sidebar()
@@ -1041,23 +1138,30 @@ class ServicesScreen(Screen):
         """Remove the selected ulimit."""
         if self._editing_ulimit_index is not None:
             name = self._ulimits[self._editing_ulimit_index]["name"]
-            del self._ulimits[self._editing_ulimit_index]
+            del self._own_ulimits()[self._editing_ulimit_index]
             self._editing_ulimit_index = None
             self._clear_ulimit_form()
             self._refresh_ulimit_sidebar()
             self.notify(f"Removed ulimit '{name}'")
 
+    def _own_ulimits(self) -> list[dict]:
+        """Detach the ulimit list from the selected service before editing."""
+        if self._ulimits_shared:
+            self._ulimits = list(self._ulimits)
+            self._ulimits_shared = False
+        return self._ulimits
+
     def _clear_ulimit_form(self) -> None:
         """Reset ulimit form fields."""
-        self.query_one("#ulimit_name", Input).value = ""
-        self.query_one("#ulimit_soft", Input).value = ""
-        self.query_one("#ulimit_hard", Input).value = ""
+        self._widgets.ulimit_name.value = ""
+        self._widgets.ulimit_soft.value = ""
+        self._widgets.ulimit_hard.value = ""
         self._editing_ulimit_index = None
 
     def _add_env_var(self) -> None:
         """Add an environment variable to the current service."""
-        key = self.query_one("#env_var_key", Input).value.strip()
-        value = self.query_one("#env_var_value", Input).value.strip()
+        key = self._widgets.env_var_key.value.strip()
+        value = self._widgets.env_var_value.value.strip()
 
         if not key:
             self.notify("Variable name is required", severity="error")
@@ -1095,8 +1199,8 @@ class ServicesScreen(Screen):
 
     def _clear_env_var_form(self) -> None:
         """Reset environment variable form fields."""
-        self.query_one("#env_var_key", Input).value = ""
-        self.query_one("#env_var_value", Input).value = ""
+        self._widgets.env_var_key.value = ""
+        self._widgets.env_var_value.value = ""
         self._editing_env_var_index = None
 
     def _add_path_rule(self) -> None:
@@ -1290,12 +1394,12 @@ class ServicesScreen(Screen):
 
     def _read_form(self) -> dict | None:
         """Read and validate the form fields."""
-        name = self.query_one("#svc_name", Input).value.strip()
+        name = self._widgets.svc_name.value.strip()
         if not name:
             self.notify("Service name is required", severity="error")
             return None
 
-        port_str = self.query_one("#svc_port", Input).value.strip()
+        port_str = self._widgets.svc_port.value.strip()
         if port_str:
             try:
                 port = int(port_str)
@@ -1304,27 +1408,27 @@ class ServicesScreen(Screen):
                 return None
         else:
             port = None
-        command = self.query_one("#svc_command", Input).value.strip() or None
-        image = self.query_one("#svc_image", Input).value.strip() or None
+        command = self._widgets.svc_command.value.strip() or None
+        image = self._widgets.svc_image.value.strip() or None
 
-        cpu_str = self.query_one("#svc_cpu", Input).value.strip()
+        cpu_str = self._widgets.svc_cpu.value.strip()
         try:
             cpu = int(cpu_str) if cpu_str else 256
         except ValueError:
             self.notify("CPU must be an integer", severity="error")
             return None
 
-        memory_str = self.query_one("#svc_memory", Input).value.strip()
+        memory_str = self._widgets.svc_memory.value.strip()
         try:
             memory_mib = int(memory_str) if memory_str else 512
         except ValueError:
             self.notify("Memory must be an integer", severity="error")
             return None
-        timeout_str = self.query_one("#svc_health_timeout", Input).value.strip()
-        interval_str = self.query_one("#svc_health_interval", Input).value.strip()
-        healthy_str = self.query_one("#svc_health_healthy", Input).value.strip()
-        unhealthy_str = self.query_one("#svc_health_unhealthy", Input).value.strip()
-        grace_str = self.query_one("#svc_health_grace", Input).value.strip()
+        timeout_str = self._widgets.svc_health_timeout.value.strip()
+        interval_str = self._widgets.svc_health_interval.value.strip()
+        healthy_str = self._widgets.svc_health_healthy.value.strip()
+        unhealthy_str = self._widgets.svc_health_unhealthy.value.strip()
+        grace_str = self._widgets.svc_health_grace.value.strip()
         try:
             health_check_timeout_seconds = int(timeout_str) if timeout_str else 5
             health_check_interval_seconds = int(interval_str) if interval_str else 30
@@ -1361,7 +1465,7 @@ class ServicesScreen(Screen):
             return None
 
         # Launch type
-        is_ec2 = self.query_one("#lt_ec2", RadioButton).value
+        is_ec2 = self._widgets.lt_ec2.value
         launch_type = "ec2" if is_ec2 else "fargate"
 
         ec2_instance_type = None
@@ -1370,7 +1474,7 @@ class ServicesScreen(Screen):
 
         if is_ec2:
             ec2_instance_type = (
-                self.query_one("#svc_ec2_instance_type", Input).value.strip() or None
+                self._widgets.svc_ec2_instance_type.value.strip() or None
             )
             if not ec2_instance_type:
                 self.notify(
@@ -1379,8 +1483,7 @@ class ServicesScreen(Screen):
                 )
                 return None
             user_data_script_content = (
-                self.query_one("#svc_user_data_script_content", TextArea).text.strip()
-                or None
+                self._widgets.svc_user_data_script_content.text.strip() or None
             )
             ebs_volumes = list(self._ebs_volumes)
 
@@ -1390,19 +1493,15 @@ class ServicesScreen(Screen):
 
         return {
             "name": name,
-            "dockerfile": self.query_one("#svc_dockerfile", Input).value.strip()
-            or "Dockerfile",
-            "build_context": self.query_one("#svc_context", Input).value.strip() or ".",
+            "dockerfile": self._widgets.svc_dockerfile.value.strip() or "Dockerfile",
+            "build_context": self._widgets.svc_context.value.strip() or ".",
             "docker_build_target": (
-                self.query_one("#svc_build_target", Input).value.strip() or None
+                self._widgets.svc_build_target.value.strip() or None
             ),
             "image": image,
             "port": port,
-            "health_check_path": self.query_one("#svc_health", Input).value.strip()
-            or "/health",
-            "health_check_http_codes": self.query_one(
-                "#svc_health_codes", Input
-            ).value.strip()
+            "health_check_path": self._widgets.svc_health.value.strip() or "/health",
+            "health_check_http_codes": self._widgets.svc_health_codes.value.strip()
             or "200-399",
             "health_check_timeout_seconds": health_check_timeout_seconds,
             "health_check_interval_seconds": health_check_interval_seconds,
@@ -1412,12 +1511,8 @@ class ServicesScreen(Screen):
             "cpu": cpu,
             "memory_mib": memory_mib,
             "command": command,
-            "enable_service_discovery": self.query_one(
-                "#svc_discovery", Checkbox
-            ).value,
-            "enable_ses_send_email": self.query_one(
-                "#svc_ses_send_email", Checkbox
-            ).value,
+            "enable_service_discovery": self._widgets.svc_discovery.value,
+            "enable_ses_send_email": self._widgets.svc_ses_send_email.value,
             "launch_type": launch_type,
             "ec2_instance_type": ec2_instance_type,
             "user_data_script": None,
@@ -1431,9 +1526,9 @@ class ServicesScreen(Screen):
         svc = self._read_form()
         if svc is None:
             return False
-        self._state.setdefault("services", []).append(svc)
+        self._services.append(svc)
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_append(svc)
         self.notify(f"Added service '{svc['name']}'")
         return True
 
@@ -1443,57 +1538,62 @@ class ServicesScreen(Screen):
         svc = self._read_form()
         if svc is None:
             return False
-        existing = self._state["services"][self._editing_index]
-        self._state["services"][self._editing_index] = merge_service_state(existing, svc)
+        idx = self._editing_index
+        merged = merge_service_state(self._services[idx], svc)
+        self._services[idx] = merged
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_replace(idx, merged)
         self.notify(f"Updated service '{svc['name']}'")
         return True
 
     def _remove_service(self) -> None:
         if self._editing_index is None:
             return
-        name = self._state["services"][self._editing_index]["name"]
-        del self._state["services"][self._editing_index]
+        idx = self._editing_index
+        name = self._services[idx]["name"]
+        del self._services[idx]
         self._clear_form()
-        self._refresh_sidebar()
+        self._sidebar_remove(idx)
         self.notify(f"Removed service '{name}'")
 
     def _clear_form(self) -> None:
         """Reset form to add mode."""
         self._editing_index = None
-        self.query_one("#svc_name", Input).value = ""
-        self.query_one("#svc_dockerfile", Input).value = "Dockerfile"
-        self.query_one("#svc_context", Input).value = "."
-        self.query_one("#svc_build_target", Input).value = ""
-        self.query_one("#svc_port", Input).value = "8000"
-        self.query_one("#svc_health", Input).value = "/health"
-        self.query_one("#svc_health_codes", Input).value = "200-399"
-        self.query_one("#svc_health_timeout", Input).value = "5"
-        self.query_one("#svc_health_interval", Input).value = "30"
-        self.query_one("#svc_health_healthy", Input).value = "5"
-        self.query_one("#svc_health_unhealthy", Input).value = "2"
-        self.query_one("#svc_health_grace", Input).value = ""
-        self.query_one("#svc_cpu", Input).value = "256"
-        self.query_one("#svc_memory", Input).value = "512"
-        self.query_one("#svc_command", Input).value = ""
-        self.query_one("#svc_image", Input).value = ""
-        self._select_launch_type("fargate")
-        self.query_one("#svc_discovery", Checkbox).value = False
-        self.query_one("#svc_ses_send_email", Checkbox).value = False
-        self.query_one("#svc_ec2_instance_type", Input).value = ""
-        self.query_one("#svc_user_data_script_content", TextArea).text = ""
-        self._ebs_volumes = []
-        self._editing_ebs_index = None
-        self._clear_ebs_form()
-        self._refresh_ebs_sidebar()
-        self._ulimits = []
-        self._editing_ulimit_index = None
-        self._clear_ulimit_form()
-        self._refresh_ulimit_sidebar()
-        self._env_vars = []
-        self._editing_env_var_index = None
-        self._clear_env_var_form()
-        self._refresh_env_var_sidebar()
-        self._toggle_ec2_fields()
-        self._update_mode()
+        with self.app.batch_update():
+            self._widgets.svc_name.value = ""
+            self._widgets.svc_dockerfile.value = "Dockerfile"
+            self._widgets.svc_context.value = "."
+            self._widgets.svc_build_target.value = ""
+            self._widgets.svc_port.value = "8000"
+            self._widgets.svc_health.value = "/health"
+            self._widgets.svc_health_codes.value = "200-399"
+            self._widgets.svc_health_timeout.value = "5"
+            self._widgets.svc_health_interval.value = "30"
+            self._widgets.svc_health_healthy.value = "5"
+            self._widgets.svc_health_unhealthy.value = "2"
+            self._widgets.svc_health_grace.value = ""
+            self._widgets.svc_cpu.value = "256"
+            self._widgets.svc_memory.value = "512"
+            self._widgets.svc_command.value = ""
+            self._widgets.svc_image.value = ""
+            self._select_launch_type("fargate")
+            self._widgets.svc_discovery.value = False
+            self._widgets.svc_ses_send_email.value = False
+            self._widgets.svc_ec2_instance_type.value = ""
+            self._widgets.svc_user_data_script_content.text = ""
+            self._ebs_volumes = []
+            self._ebs_volumes_shared = False
+            self._editing_ebs_index = None
+            self._clear_ebs_form()
+            self._refresh_ebs_sidebar()
+            self._ulimits = []
+            self._ulimits_shared = False
+            self._editing_ulimit_index = None
+            self._clear_ulimit_form()
+            self._refresh_ulimit_sidebar()
+            self._env_vars = []
+            self._editing_env_var_index = None
+            self._clear_env_var_form()
+            self._refresh_env_var_sidebar()
+            self._toggle_ec2_fields()
+            self._update_mode()
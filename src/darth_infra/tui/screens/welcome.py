@@ -1,6 +1,9 @@
 """Welcome screen — project name, region, VPC, environments."""
 
 from __future__ import annotations
+
+from types import SimpleNamespace
+
 from textual.app import ComposeResult
 from textual.containers import Vertical, VerticalScroll
 from textual.screen import Screen
@@ -64,13 +67,25 @@ class WelcomeScreen(Screen):
                 ),
             )
 
+    def _bind_widgets(self) -> None:
+        """Look up the project form inputs once, after compose."""
+        self._widgets = SimpleNamespace(
+            project_name=self.query_one("#project_name", Input),
+            aws_region=self.query_one("#aws_region", Input),
+            vpc_name=self.query_one("#vpc_name", Input),
+            environments=self.query_one("#environments", Input),
+        )
+
+    def on_mount(self) -> None:
+        self._bind_widgets()
+
     def on_input_changed(self, _event: Input.Changed) -> None:
         self._draft().update(
             {
-                "project_name": self.query_one("#project_name", Input).value,
-                "aws_region": self.query_one("#aws_region", Input).value,
-                "vpc_name": self.query_one("#vpc_name", Input).value,
-                "environments": self.query_one("#environments", Input).value,
+                "project_name": self._widgets.project_name.value,
+                "aws_region": self._widgets.aws_region.value,
+                "vpc_name": self._widgets.vpc_name.value,
+                "environments": self._widgets.environments.value,
             }
         )
 
@@ -85,21 +100,20 @@ class WelcomeScreen(Screen):
                 self.app.advance_to("existing-resources")
 
     def _apply_form_to_state(self) -> bool:
-        project_name = self.query_one("#project_name", Input).value.strip()
+        project_name = self._widgets.project_name.value.strip()
         if not project_name:
             self.notify("Project name is required", severity="error")
             return False
 
         self._state["project_name"] = project_name
         self._state["aws_region"] = (
-            self.query_one("#aws_region", Input).value.strip() or "us-east-1"
+            self._widgets.aws_region.value.strip() or "us-east-1"
         )
         self._state["vpc_name"] = (
-            self.query_one("#vpc_name", Input).value.strip()
-            or "artshumrc-prod-standard"
+            self._widgets.vpc_name.value.strip() or "artshumrc-prod-standard"
         )
 
-        env_text = self.query_one("#environments", Input).value.strip()
+        env_text = self._widgets.environments.value.strip()
         envs = [e.strip() for e in env_text.split(",") if e.strip()]
         if "prod" not in envs:
             envs.insert(0, "prod")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import tomllib
+from pathlib import Path
+
+from darth_infra.config.loader import dump_config, load_config
+from darth_infra.config.models import (
+    AlbConfig,
+    AlbPathRule,
+    EbsVolumeConfig,
+    EnvironmentOverride,
+    LaunchType,
+    ProjectConfig,
+    S3BucketConfig,
+    S3BucketConnection,
+    S3BucketMode,
+    SecretConfig,
+    SecretSource,
+    ServiceConfig,
+)
+
+
+def test_dump_config_escapes_user_strings(tmp_path: Path) -> None:
+    config = ProjectConfig(
+        project_name="demo",
+        tags={"owner": 'team "platform"', "note": "line one\nline\ttwo"},
+        services=[
+            ServiceConfig(
+                name="web",
+                command='echo "hi"',
+                environment_variables={"WIN_PATH": "C:\\infra", 'ODD"KEY': "x"},
+            )
+        ],
+        alb=AlbConfig(
+            domain="app.example.com",
+            default_target_service="web",
+            default_listener_priority=100,
+        ),
+    )
+
+    config_path = tmp_path / "darth-infra.toml"
+    config_path.write_text(dump_config(config))
+
+    assert load_config(config_path) == config
+
+
+def test_dump_config_escapes_backslashes_and_quotes_everywhere(
+    tmp_path: Path,
+) -> None:
+    config = ProjectConfig(
+        project_name='demo"x',
+        vpc_name="vpc\\main",
+        environments=["prod", 'qa "one"'],
+        private_subnet_ids=["subnet\\a", 'subnet"b'],
+        services=[
+            ServiceConfig(
+                name='web"1',
+                dockerfile="docker\\Dockerfile",
+                build_context='ctx"dir',
+                docker_build_target="t\\1",
+                image='repo/"img":1',
+                health_check_path='/h"x',
+                launch_type=LaunchType.EC2,
+                ec2_instance_type='t3"small',
+                user_data_script="C:\\scripts\\init.sh",
+                secrets=["KEY\\1", 'KEY"2'],
+                ebs_volumes=[
+                    EbsVolumeConfig(
+                        name='data"1',
+                        size_gb=10,
+                        mount_path="/mnt\\data",
+                        device_name='/dev/"xvdf"',
+                    )
+                ],
+            )
+        ],
+        s3_buckets=[
+            S3BucketConfig(
+                name='media"1',
+                mode=S3BucketMode.SEED_COPY,
+                seed_source_bucket_name="src\\bucket",
+                cloudfront=True,
+                connections=[
+                    S3BucketConnection(
+                        service='web"1',
+                        env_key="MEDIA\\BUCKET",
+                        cloudfront_env_key='CF"URL',
+                    )
+                ],
+            )
+        ],
+        alb=AlbConfig(
+            shared_alb_name='alb"shared',
+            shared_listener_arn="arn\\listener",
+            domain='app"x.example.com',
+            default_target_service='web"1',
+            default_listener_priority=10,
+            path_rules=[
+                AlbPathRule(
+                    name='api"1',
+                    path_pattern="/api\\*",
+                    target_service='web"1',
+                    priority=20,
+                )
+            ],
+        ),
+        secrets=[
+            SecretConfig(name="KEY\\1"),
+            SecretConfig(
+                name='KEY"2',
+                source=SecretSource.EXISTING,
+                existing_secret_name="arn\\secret",
+            ),
+        ],
+        environment_overrides={
+            'qa "one"': EnvironmentOverride(
+                instance_type_override="db\\small",
+                ec2_instance_type_override={'web"1': "t3\\large"},
+            )
+        },
+    )
+
+    text = dump_config(config)
+    raw = tomllib.loads(text)
+    assert raw["services"][0]["user_data_script"] == "C:\\scripts\\init.sh"
+    assert raw["services"][0]["health_check_path"] == '/h"x'
+    assert raw["project"]["private_subnet_ids"] == ["subnet\\a", 'subnet"b']
+    assert list(raw["environments"]) == ['qa "one"']
+
+    config_path = tmp_path / "darth-infra.toml"
+    config_path.write_text(text)
+    assert load_config(config_path) == config
+
+
+def test_dump_config_escapes_user_data_script_content() -> None:
+    content = 'echo "C:\\tmp"\r\n""""'
+    config = ProjectConfig(
+        project_name="demo",
+        services=[
+            ServiceConfig(
+                name="web",
+                launch_type=LaunchType.EC2,
+                ec2_instance_type="t3.small",
+                user_data_script_content=content,
+            )
+        ],
+    )
+
+    raw = tomllib.loads(dump_config(config))
+    assert raw["services"][0]["user_data_script_content"] == content + "\n"
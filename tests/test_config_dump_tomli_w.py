@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from darth_infra.config.loader import dump_config, load_config
+from darth_infra.config.models import (
+    EnvironmentOverride,
+    LaunchType,
+    ProjectConfig,
+    SecretConfig,
+    SecretSource,
+    ServiceConfig,
+)
+
+
+def test_tomli_w_dump_roundtrips_and_escapes_strings(tmp_path: Path) -> None:
+    config = ProjectConfig(
+        project_name="demo",
+        environments=["prod", "dev"],
+        tags={"owner": 'team "platform"', "path": "C:\\infra"},
+        services=[
+            ServiceConfig(name="web", command='echo "hi"'),
+            ServiceConfig(
+                name="worker",
+                port=None,
+                launch_type=LaunchType.EC2,
+                ec2_instance_type="t4g.small",
+                user_data_script_content="#!/bin/sh\necho ready\n",
+            ),
+        ],
+        secrets=[
+            SecretConfig(
+                name="DB",
+                source=SecretSource.EXISTING,
+                existing_secret_name="prod/db",
+            )
+        ],
+        environment_overrides={"dev": EnvironmentOverride(tags={"tier": "sandbox"})},
+    )
+
+    dumped = dump_config(config, use_tomli_w=True)
+
+    assert dumped.startswith("#:schema darth-infra.schema.json\n")
+    config_path = tmp_path / "darth-infra.toml"
+    config_path.write_text(dumped)
+    assert load_config(config_path) == config
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from darth_infra.config.loader import JSON_CACHE_ENV, find_config, load_config
+
+
+def _write(path: Path, project_name: str) -> None:
+    path.write_text(f"""[project]
+name = "{project_name}"
+
+[[services]]
+name = "web"
+""")
+
+
+def test_load_config_reuses_parsed_config_while_file_is_unchanged(
+    tmp_path: Path,
+) -> None:
+    config_path = tmp_path / "darth-infra.toml"
+    _write(config_path, "demo")
+
+    first = load_config(config_path)
+    second = load_config(config_path)
+
+    assert second.project_name == "demo"
+    assert second is first
+
+
+def test_load_config_reparses_when_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "darth-infra.toml"
+    _write(config_path, "demo")
+    assert load_config(config_path).project_name == "demo"
+
+    _write(config_path, "renamed-demo")
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert load_config(config_path).project_name == "renamed-demo"
+
+    load_config.cache_clear()
+    assert load_config(config_path).project_name == "renamed-demo"
+
+
+def test_json_sidecar_is_opt_in(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv(JSON_CACHE_ENV, raising=False)
+    config_path = tmp_path / "darth-infra.toml"
+    _write(config_path, "demo")
+    load_config.cache_clear()
+
+    load_config(config_path)
+
+    assert not (tmp_path / ".darth-infra.toml.cache.json").exists()
+
+
+def test_json_sidecar_is_used_until_toml_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv(JSON_CACHE_ENV, "1")
+    config_path = tmp_path / "darth-infra.toml"
+    sidecar = tmp_path / ".darth-infra.toml.cache.json"
+    _write(config_path, "demo")
+    load_config.cache_clear()
+
+    assert load_config(config_path).project_name == "demo"
+    cached = json.loads(sidecar.read_text())
+    assert cached["raw"]["project"]["name"] == "demo"
+
+    cached["raw"]["project"]["name"] = "from-sidecar"
+    sidecar.write_text(json.dumps(cached))
+    load_config.cache_clear()
+    assert load_config(config_path).project_name == "from-sidecar"
+
+    _write(config_path, "renamed-demo")
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config(config_path).project_name == "renamed-demo"
+    assert json.loads(sidecar.read_text())["raw"]["project"]["name"] == "renamed-demo"
+
+
+def test_find_config_memoizes_hits_but_not_misses(tmp_path: Path) -> None:
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    find_config.cache_clear()
+
+    with pytest.raises(FileNotFoundError):
+        find_config(nested)
+
+    config_path = tmp_path / "darth-infra.toml"
+    _write(config_path, "demo")
+    assert find_config(nested) == config_path
+
+    (nested / "darth-infra.toml").write_text("")
+    assert find_config(nested) == config_path
+
+    find_config.cache_clear()
+    assert find_config(nested) == nested / "darth-infra.toml"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from textual.content import Content
+
 from darth_infra.config.models import (
     EnvironmentOverride,
     ProjectConfig,
@@ -7,7 +9,7 @@ from darth_infra.config.models import (
     ServiceConfig,
 )
 from darth_infra.tui.screens.existing_resources import should_auto_fetch_saved_alb
-from darth_infra.tui.screens.review import build_config_from_state
+from darth_infra.tui.screens.review import ReviewScreen, build_config_from_state
 from darth_infra.tui.screens.services import merge_service_state
 from darth_infra.tui.steps import STEP_ORDER
 from darth_infra.tui.wizard_export import project_config_to_wizard_state
@@ -160,3 +162,26 @@ def test_should_auto_fetch_saved_alb_skips_intermediate_transit_mounts() -> None
         )
         is True
     )
+
+
+def test_review_summary_markup_renders_same_text_as_plain() -> None:
+    state = project_config_to_wizard_state(
+        ProjectConfig(
+            project_name="demo",
+            services=[
+                ServiceConfig(
+                    name="web",
+                    port=8000,
+                    enable_service_discovery=True,
+                    environment_variables={"FLAGS": "[CF] [read-only]"},
+                )
+            ],
+        )
+    )
+    screen = ReviewScreen(state)
+
+    plain = screen._build_summary(markup=False)
+
+    assert "web:8000 [discovery]" in plain
+    assert "Env: FLAGS=[CF] [read-only]" in plain
+    assert Content.from_markup(screen._build_summary()).plain == plain